@@ -3,16 +3,19 @@ from typing import Dict, Any
 import uuid
 from datetime import datetime
 
+from app.core.config import settings
 from app.storage.file_manager import file_manager
 from app.storage.data_models import AnalysisResult
+from app.storage.analysis_cache import analysis_cache
 from app.services.resume_parser import parse_resume
 from app.services.ai_analyzer import analyze_resume
 from app.services.scoring_engine import scoring_engine
+from app.services.resume_features import ResumeFeatures
 
 router = APIRouter()
 
 @router.post("/analyze/{resume_id}")
-async def analyze_resume_endpoint(resume_id: str, ai_provider: str = "gemini"):
+async def analyze_resume_endpoint(resume_id: str, ai_provider: str = "gemini", force: bool = False):
     """Analyze a resume using AI"""
     try:
         # Get resume metadata
@@ -30,12 +33,16 @@ async def analyze_resume_endpoint(resume_id: str, ai_provider: str = "gemini"):
             metadata.is_parsed = True
             file_manager.save_resume_metadata(metadata)
         
-        # Analyze with AI
-        ai_analysis = await analyze_resume(parsed_content["extracted_text"], ai_provider)
+        # Analyze with AI, or copy the analysis of a near-duplicate resume
+        ai_analysis = None
+        if settings.reuse_near_duplicate_analysis and not force:
+            ai_analysis = file_manager.near_duplicate_analysis(resume_id)
+        if not ai_analysis:
+            ai_analysis = await analyze_resume(parsed_content["extracted_text"], ai_provider, force=force)
         ai_analysis.resume_id = resume_id
         
         # Calculate scores using the new scoring engine
-        scoring_result = scoring_engine.score_resume(parsed_content["parsed_data"], ai_analysis)
+        scoring_result = scoring_engine.score_resume(ResumeFeatures.from_parsed_content(parsed_content), ai_analysis)
         
         # Create analysis result
         analysis = AnalysisResult(
@@ -63,6 +70,15 @@ async def analyze_resume_endpoint(resume_id: str, ai_provider: str = "gemini"):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/analysis/cache/stats")
+async def get_analysis_cache_stats():
+    """Get hit/miss counters for the analysis cache"""
+    try:
+        return analysis_cache.stats()
+    
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.get("/analysis/{analysis_id}")
 async def get_analysis(analysis_id: str):
     """Get analysis result by ID"""
@@ -80,20 +96,8 @@ async def get_analysis(analysis_id: str):
 async def get_resume_analysis(resume_id: str):
     """Get analysis for a specific resume"""
     try:
-        # Find analysis files for this resume
-        from pathlib import Path
-        from app.core.config import settings
-        
-        analyses = []
-        for analysis_file in Path(settings.analyses_dir).glob("*.json"):
-            try:
-                analysis = file_manager.get_analysis_result(analysis_file.stem)
-                if analysis and analysis.resume_id == resume_id:
-                    analyses.append(analysis.dict())
-            except:
-                continue
-        
-        return analyses
+        analyses = file_manager.get_analyses_for_resume(resume_id)
+        return [analysis.dict() for analysis in analyses]
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
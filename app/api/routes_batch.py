@@ -1,7 +1,19 @@
 from fastapi import APIRouter, HTTPException, Query
 from typing import List, Optional
+import re
 from app.storage.file_manager import file_manager
-from app.storage.data_models import RankedResultsResponse, ScoredResume
+from app.storage.data_models import (
+    RankedResultsResponse, ScoredResume, BatchStatusResponse, RankedBatchResult, RescoreRequest, RescoreResponse
+)
+from app.services.ranking_engine import ranking_engine
+from app.services.ranked_batch import RankedBatch
+from app.services.resume_features import ResumeFeatures
+from app.services.score_stats import ScoreStats
+from app.services.leaderboard import merge_leaders
+from app.services.batch_summaries import get_batch_summaries, save_ranked_result
+from app.services.batch_processor import batch_processor
+from app.storage.candidate_columns import CandidateColumns
+from app.core.config import settings
 
 router = APIRouter()
 
@@ -9,7 +21,7 @@ router = APIRouter()
 async def get_ranked_results(batch_id: str):
     """Get ranked results for a specific batch"""
     try:
-        ranked_result = file_manager.get_ranked_batch_result(batch_id)
+        ranked_result = batch_processor.get_ranked_result(batch_id)
         if not ranked_result:
             raise HTTPException(status_code=404, detail="Batch not found")
         
@@ -48,6 +60,100 @@ async def get_all_batch_results():
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/batch/cache/stats")
+async def get_ranked_cache_stats():
+    """Get hit-rate counters for the ranked results cache"""
+    try:
+        return file_manager.ranked_cache.stats()
+    
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/batch/stats/overview")
+async def get_batch_stats_overview(
+    batch_ids: Optional[str] = Query(None, description="Comma-separated batch IDs; all ranked batches by default"),
+    percentiles: Optional[str] = Query(None, description="Comma-separated percentiles (0-100)")
+):
+    """
+    Get score statistics merged across batches. Each batch contributes its
+    stored stats state, so no candidates are loaded; percentiles are estimated
+    from merged quantile sketches.
+    """
+    try:
+        try:
+            percentile_list = (
+                [float(p) for p in percentiles.split(",")] if percentiles else settings.stats_percentiles_list
+            )
+        except ValueError:
+            raise HTTPException(status_code=400, detail="percentiles must be comma-separated numbers")
+        if any(not 0 <= p <= 100 for p in percentile_list):
+            raise HTTPException(status_code=400, detail="percentiles must be between 0 and 100")
+
+        summaries = get_batch_summaries(batch_ids.split(",") if batch_ids else None)
+        states = {batch_id: summary["stats"] for batch_id, summary in summaries.items()}
+
+        merged = ScoreStats(settings.stats_sketch_k)
+        for state in states.values():
+            merged.merge(ScoreStats.from_dict(state))
+
+        return {
+            "batch_count": len(states),
+            "batch_ids": sorted(states),
+            "statistics": merged.summary(percentile_list)
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/leaderboard")
+async def get_leaderboard(
+    top_k: int = Query(50, ge=1, description="Number of candidates to return"),
+    batch_ids: Optional[str] = Query(None, description="Comma-separated batch IDs; all ranked batches by default"),
+    unique: bool = Query(True, description="Show each resume once, at its best score")
+):
+    """
+    Get the top candidates across batches, merged from each batch's stored
+    leaders. Each batch contributes at most settings.leaderboard_depth candidates.
+    """
+    try:
+        summaries = get_batch_summaries(batch_ids.split(",") if batch_ids else None)
+        leaders = {batch_id: summary["leaders"] for batch_id, summary in summaries.items()}
+        candidates = merge_leaders(leaders, top_k, unique=unique)
+        return {
+            "total_candidates": len(candidates),
+            "candidates": candidates
+        }
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/batch/{batch_id}/status", response_model=BatchStatusResponse)
+async def get_batch_status(batch_id: str):
+    """Get processing progress for a batch"""
+    try:
+        batch = file_manager.get_batch_result(batch_id)
+        if not batch:
+            raise HTTPException(status_code=404, detail="Batch not found")
+        
+        return BatchStatusResponse(
+            batch_id=batch.id,
+            batch_name=batch.batch_name,
+            status=batch.status,
+            total_files=batch.total_files,
+            processed_files=batch.processed_files,
+            failed_files=batch.failed_files,
+            pending_files=max(batch.total_files - batch.processed_files - batch.failed_files, 0),
+            created_date=batch.created_date,
+            completed_date=batch.completed_date
+        )
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.get("/batch/{batch_id}/candidates")
 async def get_batch_candidates(
     batch_id: str,
@@ -55,33 +161,41 @@ async def get_batch_candidates(
     max_score: Optional[float] = Query(None, description="Maximum score filter"),
     category: Optional[str] = Query(None, description="Category to filter by"),
     category_min_score: Optional[float] = Query(None, description="Minimum category score"),
-    limit: Optional[int] = Query(50, description="Maximum number of candidates to return")
+    limit: int = Query(50, ge=1, description="Maximum number of candidates to return"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page")
 ):
-    """Get candidates from a batch with optional filtering"""
+    """
+    Get candidates from a batch with optional filtering, in rank order.
+    Filters run on the batch's cached score columns; pages continue from
+    next_cursor and stay consistent while candidates are added or removed.
+    """
     try:
-        ranked_result = file_manager.get_ranked_batch_result(batch_id)
+        ranked_result = batch_processor.get_ranked_result(batch_id)
         if not ranked_result:
             raise HTTPException(status_code=404, detail="Batch not found")
         
-        candidates = ranked_result.ranked_candidates
-        
-        # Apply filters
-        if min_score is not None:
-            candidates = [c for c in candidates if c.score >= min_score]
-        
-        if max_score is not None:
-            candidates = [c for c in candidates if c.score <= max_score]
-        
-        if category and category_min_score is not None:
-            candidates = [c for c in candidates if c.category_scores.get(category, 0) >= category_min_score]
+        try:
+            after = CandidateColumns.decode_cursor(cursor) if cursor else None
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         
-        # Apply limit
-        if limit:
-            candidates = candidates[:limit]
+        columns = file_manager.ranked_cache.columns(batch_id, ranked_result)
+        positions, total_matches = columns.select(
+            min_score=min_score,
+            max_score=max_score,
+            category_min_scores={category: category_min_score} if category and category_min_score is not None else None,
+            cursor=after,
+            limit=limit
+        )
+        candidates = [ranked_result.ranked_candidates[position] for position in positions.tolist()]
         
         return {
             "batch_id": batch_id,
             "total_candidates": len(candidates),
+            "total_matches": total_matches,  # Matches from the cursor on
+            "next_cursor": (
+                columns.cursor_at(int(positions[-1])) if len(positions) and len(positions) < total_matches else None
+            ),
             "candidates": [
                 {
                     "rank": c.rank,
@@ -95,6 +209,8 @@ async def get_batch_candidates(
             ]
         }
     
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -105,7 +221,7 @@ async def get_top_candidates(
 ):
     """Get top N candidates from a batch"""
     try:
-        ranked_result = file_manager.get_ranked_batch_result(batch_id)
+        ranked_result = batch_processor.get_ranked_result(batch_id)
         if not ranked_result:
             raise HTTPException(status_code=404, detail="Batch not found")
         
@@ -134,7 +250,7 @@ async def get_top_candidates(
 async def get_batch_statistics(batch_id: str):
     """Get detailed statistics for a batch"""
     try:
-        ranked_result = file_manager.get_ranked_batch_result(batch_id)
+        ranked_result = batch_processor.get_ranked_result(batch_id)
         if not ranked_result:
             raise HTTPException(status_code=404, detail="Batch not found")
         
@@ -147,6 +263,139 @@ async def get_batch_statistics(batch_id: str):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.post("/batch/{batch_id}/rescore", response_model=RescoreResponse)
+async def rescore_batch(
+    batch_id: str,
+    request: RescoreRequest,
+    limit: Optional[int] = Query(None, description="Maximum number of candidates to return")
+):
+    """
+    Re-score and re-rank a processed batch with custom category weights.
+    Uses stored features and AI scores only, so nothing is re-parsed or re-analyzed.
+    Pass view_name to keep the result as a named ranking view.
+    """
+    try:
+        if request.view_name is not None:
+            _validate_view_name(request.view_name)
+        
+        ranked_result = batch_processor.get_ranked_result(batch_id)
+        if not ranked_result:
+            raise HTTPException(status_code=404, detail="Batch not found")
+        
+        features = [_candidate_features(candidate) for candidate in ranked_result.ranked_candidates]
+        rescored = ranking_engine.rescore(ranked_result, features, request.weights, request.view_name)
+        if request.view_name is not None:
+            file_manager.save_ranking_view(rescored)
+        
+        return _rescore_response(rescored, limit)
+    
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/batch/{batch_id}/views")
+async def get_ranking_views(batch_id: str):
+    """List the named ranking views saved for a batch"""
+    try:
+        return {
+            "batch_id": batch_id,
+            "views": [
+                {
+                    "view_name": view.view_name,
+                    "weights": view.weights,
+                    "created_date": view.created_date
+                }
+                for view in file_manager.get_ranking_views(batch_id)
+            ]
+        }
+    
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/batch/{batch_id}/views/{view_name}", response_model=RescoreResponse)
+async def get_ranking_view(
+    batch_id: str,
+    view_name: str,
+    limit: Optional[int] = Query(None, description="Maximum number of candidates to return")
+):
+    """Get a named ranking view of a batch"""
+    try:
+        _validate_view_name(view_name)
+        view = file_manager.get_ranking_view(batch_id, view_name)
+        if not view:
+            raise HTTPException(status_code=404, detail="Ranking view not found")
+        
+        return _rescore_response(view, limit)
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+def _validate_view_name(view_name: str):
+    # View names end up in file names
+    if not re.fullmatch(r"[A-Za-z0-9_-]{1,64}", view_name):
+        raise HTTPException(status_code=400, detail="View name must be 1-64 letters, digits, '-' or '_'")
+
+def _candidate_features(candidate: ScoredResume) -> ResumeFeatures:
+    """Stored features of a ranked candidate, read from parsed content for older batches"""
+    if candidate.features is not None:
+        return ResumeFeatures.from_dict(candidate.features)
+    parsed_content = file_manager.get_parsed_content(candidate.resume_id)
+    return ResumeFeatures.from_parsed_content(parsed_content) if parsed_content else ResumeFeatures()
+
+def _rescore_response(ranked_result: RankedBatchResult, limit: Optional[int]) -> RescoreResponse:
+    candidates = ranked_result.ranked_candidates
+    return RescoreResponse(
+        batch_id=ranked_result.batch_id,
+        batch_name=ranked_result.batch_name,
+        total_candidates=ranked_result.total_candidates,
+        ranked_candidates=candidates[:limit] if limit else candidates,
+        summary_stats=ranked_result.summary_stats,
+        weights=ranked_result.weights or {},
+        view_name=ranked_result.view_name
+    )
+
+@router.delete("/batch/{batch_id}/candidates/{resume_id}")
+async def remove_batch_candidate(batch_id: str, resume_id: str):
+    """Remove a candidate from a batch and its ranking; the others keep their relative order"""
+    try:
+        batch = file_manager.get_batch_result(batch_id)
+        if not batch:
+            raise HTTPException(status_code=404, detail="Batch not found")
+        if batch.status in ("queued", "processing"):
+            raise HTTPException(status_code=409, detail="Batch is still processing")
+        if resume_id not in batch.resume_ids:
+            raise HTTPException(status_code=404, detail="Candidate not found in batch")
+        
+        ranked_result = file_manager.get_ranked_batch_result(batch_id)
+        if ranked_result:
+            ranked_batch = RankedBatch.from_result(ranked_result)
+            ranked_batch.remove(resume_id)
+            ranked_result = ranked_batch.to_result()
+            save_ranked_result(ranked_result)
+            file_manager.save_ranked_results_csv(ranked_result)
+        
+        batch.resume_ids.remove(resume_id)
+        batch.total_files -= 1
+        if resume_id in batch.failed_resume_ids:
+            batch.failed_resume_ids.remove(resume_id)
+            batch.failed_files -= 1
+        remaining = [result for result in batch.results if result["resume_id"] != resume_id]
+        batch.processed_files -= len(batch.results) - len(remaining)
+        batch.results = remaining
+        file_manager.save_batch_result(batch)
+        
+        return {"message": "Candidate removed from batch", "total_candidates": len(remaining)}
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.delete("/batch/{batch_id}")
 async def delete_batch_result(batch_id: str):
     """Delete a batch result and all associated data"""
@@ -164,7 +413,7 @@ async def delete_batch_result(batch_id: str):
 async def download_batch_csv(batch_id: str):
     """Download batch results as CSV file"""
     try:
-        ranked_result = file_manager.get_ranked_batch_result(batch_id)
+        ranked_result = batch_processor.get_ranked_result(batch_id)
         if not ranked_result:
             raise HTTPException(status_code=404, detail="Batch not found")
         
@@ -0,0 +1,138 @@
+from fastapi import APIRouter, HTTPException
+from typing import List, Optional
+from app.storage.file_manager import file_manager
+from app.storage.data_models import (
+    MatchRequest, RequisitionMatchRequest, RequisitionMatchResponse, RequisitionRanking, RequisitionCandidate
+)
+from app.services.jd_matcher import match_resumes, match_requisitions
+
+router = APIRouter()
+
+@router.post("/match")
+async def match_job_description(request: MatchRequest):
+    """
+    Rank stored resumes against a job description with BM25 over their
+    extracted text, optionally blended with their latest overall scores.
+    Runs entirely on the local index; no LLM calls are made.
+    """
+    try:
+        if request.top_k < 1:
+            raise HTTPException(status_code=400, detail="top_k must be at least 1")
+
+        resume_ids = _batch_resume_ids(request.batch_id)
+        try:
+            candidates = match_resumes(
+                file_manager.bm25_index, file_manager.term_index, request.job_description,
+                top_k=request.top_k, blend=request.blend, resume_ids=resume_ids
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        for candidate in candidates:
+            metadata = file_manager.get_resume_metadata(candidate["resume_id"])
+            candidate["filename"] = metadata.original_filename if metadata else None
+
+        return {
+            "batch_id": request.batch_id,
+            "total_candidates": len(candidates),
+            "candidates": candidates
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/match/requisitions", response_model=RequisitionMatchResponse)
+async def match_requisitions_matrix(request: RequisitionMatchRequest):
+    """
+    Rank the applicant pool against many job requisitions in one call. All
+    requisitions are scored together as one resume x requisition BM25 matrix;
+    each gets a ranking shaped like a ranked batch result, and every
+    shortlisted candidate gets their best-fit requisitions.
+    """
+    try:
+        if request.top_k < 1 or request.best_fit_k < 1:
+            raise HTTPException(status_code=400, detail="top_k and best_fit_k must be at least 1")
+        requisition_ids = [
+            requisition.requisition_id or str(position)
+            for position, requisition in enumerate(request.requisitions, 1)
+        ]
+        if len(set(requisition_ids)) != len(requisition_ids):
+            raise HTTPException(status_code=400, detail="Requisition IDs must be unique")
+
+        resume_ids = _batch_resume_ids(request.batch_id)
+        try:
+            matches = match_requisitions(
+                file_manager.bm25_index, file_manager.term_index,
+                [requisition.job_description for requisition in request.requisitions],
+                top_k=request.top_k, blend=request.blend, best_fit_k=request.best_fit_k, resume_ids=resume_ids
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        # Each shortlisted resume is loaded once, however many rankings it is in
+        metadata = {}
+        analyses = {}
+        for resume_id in matches["best_fit"]:
+            metadata[resume_id] = file_manager.get_resume_metadata(resume_id)
+            analyses[resume_id] = file_manager.get_latest_analysis(resume_id)
+
+        rankings = []
+        for requisition, requisition_id, ranking in zip(request.requisitions, requisition_ids, matches["rankings"]):
+            ranked_candidates = []
+            for candidate in ranking["candidates"]:
+                resume_id = candidate["resume_id"]
+                resume_metadata = metadata[resume_id]
+                ranked_candidates.append(RequisitionCandidate(
+                    resume_id=resume_id,
+                    filename=resume_metadata.filename if resume_metadata else resume_id,
+                    original_filename=resume_metadata.original_filename if resume_metadata else resume_id,
+                    score=candidate["score"],
+                    category_scores={
+                        "relevance": candidate["relevance"],
+                        "overall_score": candidate["overall_score"] or 0.0
+                    },
+                    highlights={"matched_terms": candidate["matched_terms"], "bm25": candidate["bm25"]},
+                    analysis=analyses[resume_id],
+                    rank=candidate["rank"]
+                ))
+            rankings.append(RequisitionRanking(
+                requisition_id=requisition_id,
+                title=requisition.title,
+                total_candidates=ranking["summary_stats"]["total_candidates"],
+                ranked_candidates=ranked_candidates,
+                summary_stats=ranking["summary_stats"]
+            ))
+
+        return RequisitionMatchResponse(
+            batch_id=request.batch_id,
+            total_candidates=matches["total_candidates"],
+            rankings=rankings,
+            best_fit={
+                resume_id: [
+                    {
+                        "requisition_id": requisition_ids[fit["job"]],
+                        "title": request.requisitions[fit["job"]].title,
+                        "score": fit["score"],
+                        "relevance": fit["relevance"]
+                    }
+                    for fit in fits
+                ]
+                for resume_id, fits in matches["best_fit"].items()
+            }
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+def _batch_resume_ids(batch_id: Optional[str]) -> Optional[List[str]]:
+    """Resume IDs of a batch's results, or None for every resume; 404 for unknown batches"""
+    if not batch_id:
+        return None
+    batch_result = file_manager.get_batch_result(batch_id)
+    if not batch_result:
+        raise HTTPException(status_code=404, detail="Batch not found")
+    return [r["resume_id"] for r in batch_result.results if r.get("resume_id")]
@@ -1,7 +1,9 @@
-from fastapi import APIRouter, HTTPException
-from typing import List
+from fastapi import APIRouter, HTTPException, Query
+from typing import List, Optional
+from app.core.config import settings
 from app.storage.file_manager import file_manager
 from app.storage.data_models import ResumeResponse
+from app.services.resume_search import search_resumes
 
 router = APIRouter()
 
@@ -18,22 +20,12 @@ async def get_resume_details(resume_id: str):
         parsed_content = file_manager.get_parsed_content(resume_id)
         
         # Get analyses
-        from pathlib import Path
-        from app.core.config import settings
-        
-        analyses = []
-        for analysis_file in Path(settings.analyses_dir).glob("*.json"):
-            try:
-                analysis = file_manager.get_analysis_result(analysis_file.stem)
-                if analysis and analysis.resume_id == resume_id:
-                    analyses.append(analysis.dict())
-            except:
-                continue
+        analyses = file_manager.get_analyses_for_resume(resume_id)
         
         return {
             "metadata": metadata.dict(),
             "parsed_content": parsed_content,
-            "analyses": analyses
+            "analyses": [analysis.dict() for analysis in analyses]
         }
     
     except Exception as e:
@@ -59,3 +51,107 @@ async def get_stats():
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+
+@router.get("/search/resumes")
+async def search_resumes_by_terms(
+    q: str = Query(..., description='Boolean query, e.g. python AND aws NOT java, or "machine learning" OR ml'),
+    min_score: Optional[float] = Query(None, description="Minimum latest analysis score"),
+    limit: int = Query(50, ge=1, description="Maximum number of resumes to return")
+):
+    """
+    Find resumes by skill, degree and keyword using the inverted term index;
+    no resume files are opened except for the returned page's filenames.
+    """
+    try:
+        try:
+            results, total_matches = search_resumes(file_manager.term_index, q, min_score, limit)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        resumes = []
+        for resume_id, score in results:
+            metadata = file_manager.get_resume_metadata(resume_id)
+            resumes.append({
+                "resume_id": resume_id,
+                "filename": metadata.original_filename if metadata else None,
+                "score": score
+            })
+        
+        return {
+            "query": q,
+            "total_matches": total_matches,
+            "resumes": resumes
+        }
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/resumes/{resume_id}/duplicates")
+async def get_resume_near_duplicates(
+    resume_id: str,
+    threshold: Optional[float] = Query(None, ge=0, le=1, description="Minimum estimated Jaccard similarity; defaults to NEAR_DUPLICATE_THRESHOLD")
+):
+    """Find resumes whose text nearly matches this one's, using the MinHash LSH index"""
+    try:
+        if not file_manager.get_resume_metadata(resume_id):
+            raise HTTPException(status_code=404, detail="Resume not found")
+        
+        duplicates = []
+        for duplicate_id, similarity in file_manager.find_near_duplicates(resume_id, threshold):
+            metadata = file_manager.get_resume_metadata(duplicate_id)
+            duplicates.append({
+                "resume_id": duplicate_id,
+                "filename": metadata.original_filename if metadata else None,
+                "similarity": round(similarity, 3)
+            })
+        
+        return {
+            "resume_id": resume_id,
+            "total_duplicates": len(duplicates),
+            "duplicates": duplicates
+        }
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/duplicates")
+async def get_near_duplicate_clusters(
+    threshold: Optional[float] = Query(None, ge=0, le=1, description="Minimum estimated Jaccard similarity; defaults to NEAR_DUPLICATE_THRESHOLD")
+):
+    """
+    Group resumes into near-duplicate clusters; only resumes sharing an LSH
+    bucket are compared, not every pair.
+    """
+    try:
+        if threshold is None:
+            threshold = settings.near_duplicate_threshold
+        
+        clusters = []
+        for resume_ids, min_similarity in file_manager.minhash_index.clusters(threshold):
+            resumes = []
+            for resume_id in resume_ids:
+                metadata = file_manager.get_resume_metadata(resume_id)
+                resumes.append({
+                    "resume_id": resume_id,
+                    "filename": metadata.original_filename if metadata else None
+                })
+            clusters.append({
+                "size": len(resumes),
+                "min_similarity": round(min_similarity, 3),
+                "resumes": resumes
+            })
+        
+        return {
+            "threshold": threshold,
+            "total_clusters": len(clusters),
+            "clusters": clusters
+        }
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
@@ -4,17 +4,13 @@ from typing import List
 import os
 import uuid
 from datetime import datetime
-from pathlib import Path
 
 from app.core.config import settings
 from app.storage.file_manager import file_manager
-from app.storage.data_models import ResumeMetadata, ResumeResponse, BatchUploadResponse, RankedResultsResponse
+from app.storage.data_models import ResumeMetadata, ResumeResponse, BatchResult, BatchUploadResponse, RankedResultsResponse
 from app.utils.validators import validate_file
 from app.utils.file_handler import save_uploaded_file
-from app.services.resume_parser import parse_resume
-from app.services.ai_analyzer import analyze_resume
-from app.services.scoring_engine import scoring_engine
-from app.services.ranking_engine import ranking_engine
+from app.services.batch_processor import batch_processor
 
 router = APIRouter()
 
@@ -30,135 +26,174 @@ async def upload_resume(file: UploadFile = File(...)):
         file_extension = file.filename.split('.')[-1].lower() if file.filename else "pdf"
         filename = f"{file_id}.{file_extension}"
         
-        # Save file
-        file_path = await save_uploaded_file(file, filename)
+        # Stream file to disk
+        saved = await save_uploaded_file(file, filename)
         
-        # Create metadata
+        # Create metadata and store the file, keeping one copy per distinct content
         metadata = ResumeMetadata(
             id=file_id,
             filename=filename,
             original_filename=file.filename or "unknown",
-            file_path=file_path,
-            file_size=file.size or 0,
-            file_type=file_extension
+            file_path=saved.file_path,
+            file_size=saved.size,
+            file_type=file_extension,
+            content_hash=saved.sha256
         )
+        file_manager.store_blob(metadata)
         
-        # Save metadata
-        file_manager.save_resume_metadata(metadata)
+        # Reuse parsing and analysis of a byte-identical upload
+        deduplicated = file_manager.reuse_duplicate_results(metadata)
+        if deduplicated:
+            file_manager.save_resume_metadata(metadata)
         
         return {
             "message": "File uploaded successfully",
             "resume_id": file_id,
             "filename": file.filename,
-            "size": file.size
+            "size": saved.size,
+            "deduplicated": deduplicated
         }
     
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.post("/batch_upload", response_model=BatchUploadResponse)
-async def batch_upload_resumes(files: List[UploadFile] = File(...)):
-    """Upload multiple resumes and process them in batch"""
+@router.post("/batch_upload", response_model=BatchUploadResponse, status_code=202)
+async def batch_upload_resumes(files: List[UploadFile] = File(...), force: bool = False):
+    """Upload multiple resumes and queue them for batch processing"""
     try:
         if not files:
             raise HTTPException(status_code=400, detail="No files provided")
         
-        if len(files) > 20:  # Limit batch size
-            raise HTTPException(status_code=400, detail="Maximum 20 files allowed per batch")
+        if len(files) > settings.max_batch_files:  # Limit batch size
+            raise HTTPException(
+                status_code=400,
+                detail=f"Maximum {settings.max_batch_files} files allowed per batch"
+            )
         
-        batch_id = str(uuid.uuid4())
-        processed_files = 0
-        failed_files = 0
-        results = []
+        batch = BatchResult(
+            total_files=len(files),
+            processed_files=0,
+            failed_files=0,
+            force_analysis=force
+        )
         
-        # Process each file
-        for file in files:
-            try:
-                # Validate file
-                validate_file(file)
-                
-                # Generate unique filename
-                file_id = str(uuid.uuid4())
-                file_extension = file.filename.split('.')[-1].lower() if file.filename else "pdf"
-                filename = f"{file_id}.{file_extension}"
-                
-                # Save file
-                file_path = await save_uploaded_file(file, filename)
-                
-                # Create metadata
-                metadata = ResumeMetadata(
-                    id=file_id,
-                    filename=filename,
-                    original_filename=file.filename or "unknown",
-                    file_path=file_path,
-                    file_size=file.size or 0,
-                    file_type=file_extension
-                )
-                
-                # Save metadata
-                file_manager.save_resume_metadata(metadata)
-                
-                # Parse resume
-                parsed_data = await parse_resume(file_path)
-                file_manager.save_parsed_content(file_id, parsed_data)
-                
-                # Analyze with AI
-                analysis = await analyze_resume(parsed_data["extracted_text"])
-                analysis.resume_id = file_id
-                file_manager.save_analysis_result(analysis)
-                
-                # Score resume
-                scoring_result = scoring_engine.score_resume(parsed_data["parsed_data"], analysis)
-                
-                # Prepare result
-                result = {
-                    "resume_id": file_id,
-                    "filename": filename,
-                    "original_filename": metadata.original_filename,
-                    "score": scoring_result["overall_score"],
-                    "category_scores": scoring_result["category_scores"],
-                    "highlights": scoring_result["highlights"],
-                    "analysis": analysis,
-                    "batch_id": batch_id
-                }
-                
-                results.append(result)
-                processed_files += 1
-                
-                # Update metadata
-                metadata.is_parsed = True
-                metadata.is_analyzed = True
-                file_manager.save_resume_metadata(metadata)
-                
-            except Exception as e:
-                failed_files += 1
-                print(f"Error processing file {file.filename}: {str(e)}")
-                continue
+        # Persist each file; parsing and analysis happen in the background
+        await _persist_batch_files(files, batch)
         
-        # Rank all processed resumes
-        if results:
-            ranked_result = ranking_engine.rank_resumes(results)
-            ranked_result.batch_id = batch_id
-            
-            # Save ranked results
-            file_manager.save_ranked_batch_result(ranked_result)
-            file_manager.save_ranked_results_csv(ranked_result)
+        if batch.resume_ids:
+            file_manager.save_batch_result(batch)
+            await batch_processor.enqueue(batch.id)
+        else:
+            batch.status = "failed"
+            batch.completed_date = datetime.utcnow()
+            file_manager.save_batch_result(batch)
         
         return BatchUploadResponse(
-            batch_id=batch_id,
-            message=f"Batch processing completed. {processed_files} files processed, {failed_files} failed.",
+            batch_id=batch.id,
+            message=f"Batch queued. {len(batch.resume_ids)} files accepted, {batch.failed_files} rejected.",
             total_files=len(files),
-            status="completed"
+            status=batch.status
+        )
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/batch/{batch_id}/append", response_model=BatchUploadResponse, status_code=202)
+async def append_to_batch(batch_id: str, files: List[UploadFile] = File(...)):
+    """
+    Add late applicants to an existing batch. Only the new resumes are processed,
+    and each is inserted into the batch's ranking without re-ranking the others.
+    """
+    try:
+        if not files:
+            raise HTTPException(status_code=400, detail="No files provided")
+        
+        if len(files) > settings.max_batch_files:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Maximum {settings.max_batch_files} files allowed per batch"
+            )
+        
+        batch = file_manager.get_batch_result(batch_id)
+        if not batch:
+            raise HTTPException(status_code=404, detail="Batch not found")
+        if batch.status in ("queued", "processing"):
+            raise HTTPException(status_code=409, detail="Batch is still processing; append once it has finished")
+        
+        accepted = await _persist_batch_files(files, batch)
+        batch.total_files += len(files)
+        
+        if accepted:
+            batch.status = "queued"
+            batch.completed_date = None
+            file_manager.save_batch_result(batch)
+            await batch_processor.enqueue(batch.id)
+        else:
+            file_manager.save_batch_result(batch)
+        
+        return BatchUploadResponse(
+            batch_id=batch.id,
+            message=f"{accepted} files appended to batch, {len(files) - accepted} rejected.",
+            total_files=batch.total_files,
+            status=batch.status
         )
     
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+async def _persist_batch_files(files: List[UploadFile], batch: BatchResult) -> int:
+    """Save uploaded files and add them to the batch; returns how many were accepted"""
+    accepted = 0
+    for file in files:
+        try:
+            # Validate file
+            validate_file(file)
+            
+            # Generate unique filename
+            file_id = str(uuid.uuid4())
+            file_extension = file.filename.split('.')[-1].lower() if file.filename else "pdf"
+            filename = f"{file_id}.{file_extension}"
+            
+            # Stream file to disk
+            saved = await save_uploaded_file(file, filename)
+            
+            # Create metadata and store the file, keeping one copy per distinct content
+            metadata = ResumeMetadata(
+                id=file_id,
+                filename=filename,
+                original_filename=file.filename or "unknown",
+                file_path=saved.file_path,
+                file_size=saved.size,
+                file_type=file_extension,
+                content_hash=saved.sha256
+            )
+            file_manager.store_blob(metadata)
+            
+            # Reuse results of a byte-identical upload processed earlier
+            if file_manager.reuse_duplicate_results(metadata):
+                file_manager.save_resume_metadata(metadata)
+            
+            batch.resume_ids.append(file_id)
+            accepted += 1
+            
+        except Exception as e:
+            batch.failed_files += 1
+            print(f"Error saving file {file.filename}: {str(e)}")
+            continue
+    
+    return accepted
+
 @router.get("/ranked_results/{batch_id}", response_model=RankedResultsResponse)
 async def get_ranked_results(batch_id: str):
     """Get ranked results for a specific batch"""
     try:
-        ranked_result = file_manager.get_ranked_batch_result(batch_id)
+        ranked_result = batch_processor.get_ranked_result(batch_id)
         if not ranked_result:
             raise HTTPException(status_code=404, detail="Batch not found")
         
@@ -218,14 +253,8 @@ async def get_all_resumes():
         response = []
         
         for resume in resumes:
-            # Check if analysis exists
-            analysis = None
-            for analysis_file in Path(settings.analyses_dir).glob(f"*{resume.id}*.json"):
-                try:
-                    analysis = file_manager.get_analysis_result(analysis_file.stem)
-                    break
-                except:
-                    continue
+            # Latest analysis, if any
+            analysis = file_manager.get_latest_analysis(resume.id)
             
             response.append(ResumeResponse(
                 id=resume.id,
@@ -263,14 +292,8 @@ async def get_resume(resume_id: str):
         if not metadata:
             raise HTTPException(status_code=404, detail="Resume not found")
         
-        # Get analysis if exists
-        analysis = None
-        for analysis_file in Path(settings.analyses_dir).glob(f"*{resume_id}*.json"):
-            try:
-                analysis = file_manager.get_analysis_result(analysis_file.stem)
-                break
-            except:
-                continue
+        # Latest analysis, if any
+        analysis = file_manager.get_latest_analysis(resume_id)
         
         return ResumeResponse(
             id=metadata.id,
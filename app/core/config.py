@@ -6,6 +6,9 @@ class Settings(BaseSettings):
     # AI APIs
     gemini_api_key: Optional[str] = None
     deepseek_api_key: Optional[str] = None
+    gemini_model: str = "gemini-2.0-flash"
+    ai_max_concurrency: int = 8  # Calls in flight per provider
+    ai_request_timeout: float = 60.0  # Seconds
     
     # Security
     secret_key: str = "your_secret_key_here_make_it_long_and_random"
@@ -14,15 +17,53 @@ class Settings(BaseSettings):
     
     # File handling
     upload_dir: str = "model/resume/uploads"
+    blob_dir: str = "model/resume/blobs"  # Uploads stored once per content hash
     parsed_dir: str = "model/resume/parsed"
     data_dir: str = "data"
     resumes_dir: str = "data/resumes"
     analyses_dir: str = "data/analyses"
     metadata_dir: str = "data/metadata"
+    index_dir: str = "data/indexes"
+    storage_backend: str = "json"  # json, sqlite
+    sqlite_path: str = "data/smartrecruit.db"
+    analysis_cache_dir: str = "data/cache/analyses"
+    analysis_cache_max_bytes: int = 104857600  # 100MB
+    ranked_cache_max_bytes: int = 67108864  # 64MB of serialized ranked results kept parsed in memory
     
     max_file_size: int = 10485760  # 10MB
+    upload_chunk_size: int = 1048576  # 1MB read per chunk when streaming uploads to disk
     allowed_file_types: str = "pdf,docx,doc"
     
+    # Batch processing
+    max_batch_files: int = 20
+    batch_workers: int = 2
+    parse_concurrency: int = 4  # Resumes parsed at once across all batches
+    analysis_concurrency: int = 4  # AI analyses in flight at once across all batches
+    
+    # Resume parsing
+    parser_workers: int = 2  # Worker processes for PDF/DOCX parsing
+    parser_timeout_seconds: float = 30.0  # Per-file parse timeout
+    parser_max_pages: int = 20  # PDF pages read per resume
+    parser_max_chars: int = 50000  # Text kept per resume; extraction stops once reached
+    
+    # Keyword taxonomy (skills, degrees, section words); defaults to the bundled file
+    taxonomy_path: Optional[str] = None
+    
+    # Score statistics
+    stats_percentiles: str = "25,50,75,90"  # Percentiles reported in summary stats
+    stats_sketch_k: int = 200  # Quantile sketch size; rank error is roughly 1.7/k
+    leaderboard_depth: int = 100  # Top candidates per batch kept for the cross-batch leaderboard
+    
+    # Job description matching (BM25)
+    bm25_k1: float = 1.2  # Term frequency saturation
+    bm25_b: float = 0.75  # Document length normalization
+    
+    # Near-duplicate detection (MinHash/LSH)
+    minhash_permutations: int = 128  # Signature length; changing it starts a new index log
+    lsh_bands: int = 32  # Signature bands; more bands find less similar pairs
+    near_duplicate_threshold: float = 0.8  # Estimated Jaccard similarity of shingle sets
+    reuse_near_duplicate_analysis: bool = False  # Copy a near-duplicate's analysis instead of calling the LLM
+    
     # Server Configuration
     host: str = "0.0.0.0"
     port: int = 8000
@@ -32,6 +73,10 @@ class Settings(BaseSettings):
     def allowed_file_types_list(self) -> List[str]:
         return self.allowed_file_types.split(",")
     
+    @property
+    def stats_percentiles_list(self) -> List[float]:
+        return [float(p) for p in self.stats_percentiles.split(",")]
+    
     class Config:
         env_file = ".env"
 
@@ -1,21 +1,38 @@
-import google.generativeai as genai
+import json
 import re
 from typing import Dict, Any
 from app.core.config import settings
 from app.storage.data_models import AnalysisResult
+from app.storage.analysis_cache import analysis_cache
+from app.services.ai_providers import get_provider, has_provider
+from app.services.resume_parser import extract_skills
 
-# Configure Gemini
-if settings.gemini_api_key:
-    genai.configure(api_key=settings.gemini_api_key)
+# Bump whenever the analysis prompt changes so cached analyses are not reused
+PROMPT_VERSION = "1"
 
-async def analyze_resume(resume_text: str, ai_provider: str = "gemini") -> AnalysisResult:
+async def analyze_resume(resume_text: str, ai_provider: str = "gemini", force: bool = False) -> AnalysisResult:
     try:
+        # Reuse a cached analysis of identical text unless forced to re-run
+        cache_key = None
+        if has_provider(ai_provider):
+            cache_key = analysis_cache.make_key(
+                resume_text, ai_provider, get_provider(ai_provider).model_name, PROMPT_VERSION
+            )
+            if not force:
+                cached = analysis_cache.get(cache_key)
+                if cached is not None:
+                    return AnalysisResult(resume_id="", **cached)
+
         if ai_provider == "gemini":
-            return await analyze_with_gemini(resume_text)
+            analysis = await analyze_with_gemini(resume_text)
         elif ai_provider == "deepseek":
-            return await analyze_with_deepseek(resume_text)
+            analysis = await analyze_with_deepseek(resume_text)
         else:
             raise ValueError(f"Unsupported AI provider: {ai_provider}")
+
+        if cache_key:
+            analysis_cache.put(cache_key, analysis.dict(exclude={"id", "resume_id", "analysis_date"}))
+        return analysis
     
     except Exception as e:
         # Return default analysis if AI analysis fails
@@ -35,10 +52,8 @@ async def analyze_resume(resume_text: str, ai_provider: str = "gemini") -> Analy
         )
 
 async def analyze_with_gemini(resume_text: str) -> AnalysisResult:
+    response_text = ""
     try:
-        # Use correct Gemini 2.0 model
-        model = genai.GenerativeModel('gemini-2.0-flash')
-
         prompt = f"""
         Analyze the following resume and provide a structured assessment with scores.
 
@@ -69,11 +84,10 @@ async def analyze_with_gemini(resume_text: str) -> AnalysisResult:
         Provide only the JSON response, no additional text.
         """
 
-        # Make Gemini call (sync model works fine even in async function)
-        response = model.generate_content(prompt)
+        # Shared async client; never blocks the event loop
+        response_text = await get_provider("gemini").generate(prompt)
 
-        import json
-        analysis_data = json.loads(response.text)
+        analysis_data = json.loads(response_text)
 
         return AnalysisResult(
             resume_id="",
@@ -91,7 +105,7 @@ async def analyze_with_gemini(resume_text: str) -> AnalysisResult:
         )
 
     except json.JSONDecodeError:
-        return parse_ai_response_fallback(response.text)
+        return parse_ai_response_fallback(response_text)
 
     except Exception as e:
         raise Exception(f"Error with Gemini API: {str(e)}")
@@ -214,20 +228,7 @@ def extract_suggestions(text: str) -> list:
 
 def extract_technical_skills(text: str) -> list:
     """Extract mentioned technical skills"""
-    skills = []
-    
-    # Common technical skills to look for
-    tech_skills = [
-        'Python', 'Java', 'JavaScript', 'React', 'Node.js', 'SQL', 'HTML', 'CSS',
-        'Git', 'Docker', 'AWS', 'Azure', 'MongoDB', 'PostgreSQL', 'FastAPI'
-    ]
-    
-    text_lower = text.lower()
-    for skill in tech_skills:
-        if skill.lower() in text_lower:
-            skills.append(skill)
-    
-    return list(set(skills))
+    return extract_skills(text)
 
 def extract_rating(text: str, category: str) -> float:
     """Extract rating for specific category"""
@@ -0,0 +1,91 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+import google.generativeai as genai
+from app.core.config import settings
+
+class AIProvider:
+    """
+    Long-lived client for one AI provider.
+    Blocking SDK calls run on a dedicated thread pool, so they never stall the
+    event loop, and in-flight calls are capped by a per-provider semaphore.
+    """
+    name = "base"
+
+    def __init__(self, model_name: str, max_concurrency: int, timeout: float):
+        self.model_name = model_name
+        self.timeout = timeout
+        self._slots = asyncio.Semaphore(max(1, max_concurrency))
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, max_concurrency),
+            thread_name_prefix=f"{self.name}-provider"
+        )
+
+    async def generate(self, prompt: str) -> str:
+        """
+        Send a prompt and return the response text. A call that times out
+        keeps its slot until the SDK call actually returns, since the thread
+        running it cannot be cancelled; calls in flight never exceed the cap.
+        """
+        await self._slots.acquire()
+        try:
+            call = asyncio.get_running_loop().run_in_executor(self._executor, self._generate, prompt)
+        except BaseException:
+            self._slots.release()
+            raise
+        call.add_done_callback(lambda _: self._slots.release())
+        # shield, so a timeout or cancellation leaves the call running (and holding its slot)
+        return await asyncio.wait_for(asyncio.shield(call), timeout=self.timeout)
+
+    def _generate(self, prompt: str) -> str:
+        """Blocking call to the provider SDK, run on the provider's thread pool"""
+        raise NotImplementedError
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+class GeminiProvider(AIProvider):
+    name = "gemini"
+
+    def __init__(self, max_concurrency: int, timeout: float, model_name: Optional[str] = None):
+        super().__init__(model_name or settings.gemini_model, max_concurrency, timeout)
+        if settings.gemini_api_key:
+            genai.configure(api_key=settings.gemini_api_key)
+        # Built once and reused for every call. The SDK creates its gRPC client
+        # (including a blocking credentials lookup) on first use, which happens
+        # on the provider thread pool rather than the event loop.
+        self._model = genai.GenerativeModel(self.model_name)
+
+    def _generate(self, prompt: str) -> str:
+        response = self._model.generate_content(prompt)
+        return response.text
+
+_provider_classes = {
+    "gemini": GeminiProvider
+}
+
+_providers: Dict[str, AIProvider] = {}
+
+def get_provider(name: str) -> AIProvider:
+    """Get the shared client for a provider, creating it on first use"""
+    provider = _providers.get(name)
+    if provider is None:
+        provider_class = _provider_classes.get(name)
+        if provider_class is None:
+            raise ValueError(f"Unsupported AI provider: {name}")
+        provider = provider_class(
+            max_concurrency=settings.ai_max_concurrency,
+            timeout=settings.ai_request_timeout
+        )
+        _providers[name] = provider
+    return provider
+
+def has_provider(name: str) -> bool:
+    """Check whether a provider is backed by a real client"""
+    return name in _provider_classes
+
+def shutdown_providers():
+    """Release provider thread pools"""
+    for provider in _providers.values():
+        provider.shutdown()
+    _providers.clear()
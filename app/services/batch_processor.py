@@ -0,0 +1,250 @@
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from app.core.config import settings
+from app.storage.file_manager import file_manager
+from app.storage.data_models import BatchResult, RankedBatchResult, ResumeMetadata
+from app.services.resume_parser import parse_resume
+from app.services.ai_analyzer import analyze_resume
+from app.services.scoring_engine import scoring_engine
+from app.services.resume_features import ResumeFeatures
+from app.services.ranking_engine import ranking_engine
+from app.services.ranked_batch import RankedBatch
+from app.services.batch_summaries import save_ranked_result
+
+logger = logging.getLogger(__name__)
+
+class BatchProcessor:
+    """
+    Background job queue for batch uploads.
+    The upload endpoint only persists files and a queued BatchResult;
+    worker tasks drain the queue and run parsing, AI analysis and scoring.
+    """
+
+    def __init__(self, num_workers: int = 2, parse_concurrency: int = 4, analysis_concurrency: int = 4):
+        self.num_workers = max(1, num_workers)
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+
+        # Per-stage limits, shared by every batch in flight
+        self._parse_slots = asyncio.Semaphore(max(1, parse_concurrency))
+        self._analysis_slots = asyncio.Semaphore(max(1, analysis_concurrency))
+
+        # Rankings of batches in progress, served from memory until the batch is saved
+        self._live_rankings: Dict[str, RankedBatch] = {}
+        self._live_results: Dict[str, RankedBatchResult] = {}
+
+        # content_hash -> completion of the resume being processed with that content,
+        # so byte-identical uploads are parsed and analyzed once
+        self._in_flight: Dict[str, asyncio.Future] = {}
+
+    async def start(self):
+        """Start worker tasks and re-queue batches interrupted by a restart"""
+        self._queue = asyncio.Queue()
+        for worker_id in range(self.num_workers):
+            self._workers.append(asyncio.create_task(self._worker(worker_id)))
+
+        for batch in file_manager.get_all_batch_results():
+            if batch.status in ("queued", "processing"):
+                logger.info(f"Re-queueing unfinished batch {batch.id}")
+                await self.enqueue(batch.id)
+
+    async def stop(self):
+        """Cancel worker tasks"""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def enqueue(self, batch_id: str):
+        """Queue a persisted batch for processing"""
+        if self._queue is None:
+            raise RuntimeError("Batch processor is not running")
+        await self._queue.put(batch_id)
+
+    def get_ranked_result(self, batch_id: str) -> Optional[RankedBatchResult]:
+        """
+        Ranked result of a batch: the partial ranking while it is processed,
+        else the stored one. Partial snapshots are rebuilt only after a change.
+        """
+        ranked_batch = self._live_rankings.get(batch_id)
+        if ranked_batch is None or not len(ranked_batch):
+            return file_manager.get_ranked_batch_result(batch_id)
+        ranked_result = self._live_results.get(batch_id)
+        if ranked_result is None:
+            ranked_result = self._live_results[batch_id] = ranked_batch.to_result()
+        return ranked_result
+
+    async def _worker(self, worker_id: int):
+        while True:
+            batch_id = await self._queue.get()
+            try:
+                await self.process_batch(batch_id)
+            except Exception as e:
+                logger.error(f"Worker {worker_id} failed on batch {batch_id}: {e}")
+                batch = file_manager.get_batch_result(batch_id)
+                if batch:
+                    batch.status = "failed"
+                    batch.completed_date = datetime.utcnow()
+                    file_manager.save_batch_result(batch)
+            finally:
+                self._queue.task_done()
+
+    async def process_batch(self, batch_id: str):
+        """
+        Process every pending resume of a batch concurrently. Each finished resume
+        is inserted into the batch's ranking as it completes, so resumes appended
+        to a ranked batch never cause the existing candidates to be re-ranked.
+        """
+        batch = file_manager.get_batch_result(batch_id)
+        if not batch or batch.status in ("completed", "failed"):
+            return
+
+        batch.status = "processing"
+        file_manager.save_batch_result(batch)
+
+        # Skip resumes already handled before a restart or an append
+        done = {result["resume_id"] for result in batch.results}
+        done.update(batch.failed_resume_ids)
+        pending = [resume_id for resume_id in batch.resume_ids if resume_id not in done]
+
+        # Ties rank in upload order, whatever order results complete in
+        upload_order = {resume_id: i for i, resume_id in enumerate(batch.resume_ids)}
+        ranked_batch = self._load_ranking(batch, upload_order)
+
+        async def run(resume_id: str):
+            try:
+                result = await self._process_resume(batch, resume_id)
+                batch.results.append(result)
+                batch.processed_files += 1
+                ranked_batch.insert(ranking_engine.to_scored_resume(result), upload_order.get(resume_id))
+                self._live_results.pop(batch_id, None)
+            except Exception as e:
+                logger.error(f"Error processing resume {resume_id} in batch {batch_id}: {e}")
+                batch.failed_resume_ids.append(resume_id)
+                batch.failed_files += 1
+            file_manager.save_batch_result(batch)
+
+        # Partial rankings are read from memory; the ranking is saved once, after the last resume
+        self._live_rankings[batch_id] = ranked_batch
+        try:
+            await asyncio.gather(*(run(resume_id) for resume_id in pending))
+
+            # Keep stored results in upload order
+            batch.results.sort(key=lambda result: upload_order.get(result["resume_id"], len(upload_order)))
+
+            if len(ranked_batch):
+                ranked_result = ranked_batch.to_result()
+                save_ranked_result(ranked_result)
+                file_manager.save_ranked_results_csv(ranked_result)
+        finally:
+            self._live_rankings.pop(batch_id, None)
+            self._live_results.pop(batch_id, None)
+
+        batch.status = "completed" if batch.processed_files else "failed"
+        batch.completed_date = datetime.utcnow()
+        file_manager.save_batch_result(batch)
+
+    def _load_ranking(self, batch: BatchResult, upload_order: Dict[str, int]) -> RankedBatch:
+        """Start from the stored ranking, or rank results saved before a restart"""
+        ranked_result = file_manager.get_ranked_batch_result(batch.id)
+        if ranked_result:
+            ranked_batch = RankedBatch.from_result(ranked_result, upload_order)
+        else:
+            ranked_batch = RankedBatch(batch.id, batch.batch_name)
+        for result in batch.results:
+            if result["resume_id"] not in ranked_batch:
+                ranked_batch.insert(ranking_engine.to_scored_resume(result), upload_order.get(result["resume_id"]))
+        ranked_batch.batch_name = batch.batch_name
+        return ranked_batch
+
+    async def _process_resume(self, batch: BatchResult, resume_id: str) -> Dict[str, Any]:
+        """
+        Process a single resume of a batch. Of byte-identical resumes in flight
+        (within or across batches), only the first is parsed and analyzed; the
+        others wait for it and reuse its results.
+        """
+        metadata = file_manager.get_resume_metadata(resume_id)
+        if not metadata:
+            raise ValueError(f"Resume {resume_id} not found")
+
+        content_hash = metadata.content_hash
+        in_flight = self._in_flight.get(content_hash) if content_hash else None
+        if in_flight is not None:
+            # A byte-identical resume is being processed: wait for it and copy its results
+            await asyncio.shield(in_flight)
+            reused = file_manager.reuse_duplicate_results(metadata)
+            if reused:
+                file_manager.save_resume_metadata(metadata)
+            return await self._score_resume(batch, metadata, reused)
+        if not content_hash:
+            return await self._score_resume(batch, metadata)
+
+        done = asyncio.get_running_loop().create_future()
+        self._in_flight[content_hash] = done
+        try:
+            return await self._score_resume(batch, metadata)
+        finally:
+            del self._in_flight[content_hash]
+            done.set_result(None)
+
+    async def _score_resume(self, batch: BatchResult, metadata: ResumeMetadata,
+                            reused: bool = False) -> Dict[str, Any]:
+        """
+        Parse, analyze and score a resume, skipping stages whose results exist
+        (reused results are kept even when analysis is forced). Each stage is
+        bounded by its own semaphore, so a batch of N files takes roughly the
+        slowest file's latency instead of the sum of all of them.
+        """
+        resume_id = metadata.id
+
+        # Parse resume, unless already parsed (duplicate upload or restart)
+        parsed_data = file_manager.get_parsed_content(resume_id) if metadata.is_parsed else None
+        if not parsed_data:
+            async with self._parse_slots:
+                parsed_data = await parse_resume(metadata.file_path)
+            file_manager.save_parsed_content(resume_id, parsed_data)
+
+        # Analyze with AI, unless an analysis already exists or can be copied from a near-duplicate
+        analysis = None
+        if metadata.is_analyzed and (reused or not batch.force_analysis):
+            analysis = file_manager.get_latest_analysis(resume_id)
+        if not analysis and settings.reuse_near_duplicate_analysis and not batch.force_analysis:
+            analysis = file_manager.near_duplicate_analysis(resume_id)
+            if analysis:
+                file_manager.save_analysis_result(analysis)
+        if not analysis:
+            async with self._analysis_slots:
+                analysis = await analyze_resume(parsed_data["extracted_text"], force=batch.force_analysis)
+            analysis.resume_id = resume_id
+            file_manager.save_analysis_result(analysis)
+
+        # Score resume
+        features = ResumeFeatures.from_parsed_content(parsed_data)
+        scoring_result = scoring_engine.score_resume(features, analysis)
+
+        # Update metadata
+        metadata.is_parsed = True
+        metadata.is_analyzed = True
+        file_manager.save_resume_metadata(metadata)
+
+        return {
+            "resume_id": resume_id,
+            "filename": metadata.filename,
+            "original_filename": metadata.original_filename,
+            "score": scoring_result["overall_score"],
+            "category_scores": scoring_result["category_scores"],
+            "highlights": scoring_result["highlights"],
+            "analysis": analysis.dict(),
+            "features": features.to_dict(),
+            "batch_id": batch.id
+        }
+
+# Global batch processor instance
+batch_processor = BatchProcessor(
+    num_workers=settings.batch_workers,
+    parse_concurrency=settings.parse_concurrency,
+    analysis_concurrency=settings.analysis_concurrency
+)
@@ -0,0 +1,34 @@
+from typing import Any, Dict, Iterable, Optional
+from app.core.config import settings
+from app.storage.file_manager import file_manager
+from app.storage.data_models import RankedBatchResult
+from app.services.score_stats import ScoreStats
+from app.services.leaderboard import leader_entries
+
+def stats_state(ranked_result: RankedBatchResult) -> Dict[str, Any]:
+    """Stored ScoreStats state of a ranked result, computed for results saved without one"""
+    if ranked_result.stats_state is not None:
+        return ranked_result.stats_state
+    candidates = ranked_result.ranked_candidates
+    return ScoreStats.from_scores(
+        (c.score for c in candidates), (c.category_scores for c in candidates), settings.stats_sketch_k
+    ).to_dict()
+
+def batch_summary(ranked_result: RankedBatchResult) -> Dict[str, Any]:
+    """Stats state and leaderboard entries of a ranked result, for cross-batch reads"""
+    return {"stats": stats_state(ranked_result), "leaders": leader_entries(ranked_result, settings.leaderboard_depth)}
+
+def save_ranked_result(ranked_result: RankedBatchResult) -> str:
+    """Save a ranked result together with its summary"""
+    return file_manager.save_ranked_batch_result(ranked_result, batch_summary(ranked_result))
+
+def get_batch_summaries(batch_ids: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Summaries of ranked batches (all by default) by batch ID. Ranked results
+    saved without a summary are summarized and stored on first read.
+    """
+    for batch_id in file_manager.get_unsummarized_batch_ids():
+        ranked_result = file_manager.get_ranked_batch_result(batch_id)
+        if ranked_result is not None:
+            file_manager.save_batch_summary(batch_id, batch_summary(ranked_result))
+    return file_manager.get_batch_summaries(batch_ids)
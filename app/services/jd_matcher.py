@@ -0,0 +1,161 @@
+import heapq
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+import numpy as np
+from app.core.config import settings
+from app.services.score_stats import SCORE_BUCKETS, percentile_label
+from app.storage.bm25_index import BM25Index, tokenize
+from app.storage.term_index import TermIndex
+
+# Ascending lower bounds and their labels for histogramming score arrays
+_BUCKET_BOUNDS = np.array([bound for _, bound in reversed(SCORE_BUCKETS)])
+_BUCKET_LABELS = [label for label, _ in reversed(SCORE_BUCKETS)]
+
+def match_resumes(bm25_index: BM25Index, term_index: TermIndex, job_description: str, top_k: int = 20,
+                  blend: float = 0.0, resume_ids: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+    """
+    Rank resumes by BM25 relevance to a job description, best first.
+    Relevance is rescaled to 0-100 against the best match, then blended with
+    each resume's latest overall score: score = (1 - blend) * relevance +
+    blend * overall_score, with unanalyzed resumes counting 0. Only resumes
+    sharing a term with the job description are returned.
+    """
+    if not 0 <= blend <= 1:
+        raise ValueError("blend must be between 0 and 1")
+    query_terms = set(tokenize(job_description))
+    if not query_terms:
+        raise ValueError("Job description has no searchable terms")
+
+    raw_scores = bm25_index.score(query_terms, set(resume_ids) if resume_ids is not None else None)
+    if not raw_scores:
+        return []
+    best = max(raw_scores.values())
+    overall_scores = dict(term_index.scores(raw_scores)) if blend else {}
+
+    def combined(resume_id: str) -> float:
+        relevance = raw_scores[resume_id] / best * 100
+        if not blend:
+            return relevance
+        return (1 - blend) * relevance + blend * (overall_scores.get(resume_id) or 0.0)
+
+    top = heapq.nlargest(top_k, raw_scores, key=combined)
+    if not blend:
+        overall_scores = dict(term_index.scores(top))
+    return [
+        {
+            "rank": rank,
+            "resume_id": resume_id,
+            "score": round(combined(resume_id), 2),
+            "relevance": round(raw_scores[resume_id] / best * 100, 2),
+            "bm25": round(raw_scores[resume_id], 4),
+            "overall_score": overall_scores.get(resume_id),
+            "matched_terms": bm25_index.matched_terms(resume_id, query_terms)
+        }
+        for rank, resume_id in enumerate(top, 1)
+    ]
+
+def match_requisitions(bm25_index: BM25Index, term_index: TermIndex, job_descriptions: Sequence[str],
+                       top_k: int = 20, blend: float = 0.0, best_fit_k: int = 3,
+                       resume_ids: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+    """
+    Rank the same resumes against many job descriptions in one pass. The
+    BM25 scores of every resume for every job come from a single resumes x
+    jobs matrix, and relevance, blending, per-job top-k and summary
+    statistics are computed on its columns, so each job is scored as
+    match_resumes would score it alone.
+
+    Returns "rankings", one {"candidates", "summary_stats"} per job in input
+    order, with candidates shaped like match_resumes results; "best_fit",
+    the best_fit_k best-scoring jobs ({"job", "score", "relevance"}, job being
+    the input position) of every shortlisted candidate; and
+    "total_candidates", the number of resumes matching any job.
+    """
+    if not 0 <= blend <= 1:
+        raise ValueError("blend must be between 0 and 1")
+    queries = [set(tokenize(job_description)) for job_description in job_descriptions]
+    if not queries:
+        raise ValueError("No job descriptions given")
+    for position, query_terms in enumerate(queries, 1):
+        if not query_terms:
+            raise ValueError(f"Job description {position} has no searchable terms")
+
+    ids, raw = bm25_index.score_matrix(queries, set(resume_ids) if resume_ids is not None else None)
+    matched = raw > 0
+    best = raw.max(axis=0, initial=0.0)
+    relevance = raw / np.where(best > 0, best, 1.0) * 100
+    latest = [score for _, score in term_index.scores(ids)]
+    overall = np.array([score or 0.0 for score in latest])
+    combined = (1 - blend) * relevance + blend * overall[:, None] if blend else relevance.copy()
+    combined[~matched] = -np.inf
+
+    rankings = []
+    shortlisted = set()
+    for column, query_terms in enumerate(queries):
+        scores = combined[:, column]
+        count = int(matched[:, column].sum())
+        k = min(top_k, count)
+        top = np.argpartition(-scores, k - 1)[:k] if 0 < k < len(scores) else np.flatnonzero(matched[:, column])
+        top = top[np.lexsort((top, -scores[top]))]
+        shortlisted.update(top.tolist())
+        rankings.append({
+            "candidates": [
+                {
+                    "rank": rank,
+                    "resume_id": ids[row],
+                    "score": round(float(scores[row]), 2),
+                    "relevance": round(float(relevance[row, column]), 2),
+                    "bm25": round(float(raw[row, column]), 4),
+                    "overall_score": latest[row],
+                    "matched_terms": bm25_index.matched_terms(ids[row], query_terms)
+                }
+                for rank, row in enumerate(top.tolist(), 1)
+            ],
+            "summary_stats": _summary_stats(
+                scores[matched[:, column]], relevance[matched[:, column], column], overall[matched[:, column]]
+            )
+        })
+
+    rows = sorted(shortlisted)
+    best_jobs = np.argsort(-combined[rows], axis=1, kind="stable")[:, :best_fit_k] if rows else []
+    best_fit = {
+        ids[row]: [
+            {
+                "job": int(column),
+                "score": round(float(combined[row, column]), 2),
+                "relevance": round(float(relevance[row, column]), 2)
+            }
+            for column in columns if matched[row, column]
+        ]
+        for row, columns in zip(rows, best_jobs)
+    }
+    return {"total_candidates": len(ids), "rankings": rankings, "best_fit": best_fit}
+
+def _summary_stats(scores: np.ndarray, relevance: np.ndarray, overall: np.ndarray) -> Dict[str, Any]:
+    """Summary statistics of one job's matches, in the shape of RankedBatchResult.summary_stats"""
+    count = len(scores)
+    if not count:
+        return {
+            "total_candidates": 0,
+            "average_score": 0,
+            "score_range": {"min": 0, "max": 0},
+            "score_distribution": {},
+            "category_averages": {}
+        }
+
+    ordered = np.sort(scores)
+    buckets = np.bincount(np.searchsorted(_BUCKET_BOUNDS, scores, side="right") - 1, minlength=len(_BUCKET_LABELS))
+    return {
+        "total_candidates": count,
+        "average_score": round(float(scores.mean()), 2),
+        "median_score": round(float(np.median(ordered)), 2),
+        "score_std_dev": round(float(scores.std()), 2),
+        "score_range": {"min": round(float(ordered[0]), 2), "max": round(float(ordered[-1]), 2)},
+        "score_distribution": {label: int(buckets[i]) for i, label in reversed(list(enumerate(_BUCKET_LABELS)))},
+        "category_averages": {
+            "relevance": round(float(relevance.mean()), 2),
+            "overall_score": round(float(overall.mean()), 2)
+        },
+        "percentiles": {
+            percentile_label(percentile): round(float(ordered[min(int(count * percentile / 100), count - 1)]), 2)
+            for percentile in settings.stats_percentiles_list
+        }
+    }
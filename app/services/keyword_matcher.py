@@ -0,0 +1,151 @@
+import json
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+from app.core.config import settings
+
+def _fold_case(text: str) -> str:
+    """
+    Lowercase text without changing its length, so offsets into the result
+    index the original. Characters whose lowercase form is longer ("İ" is
+    "i" plus a combining dot) keep only its first character.
+    """
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return "".join(char.lower()[:1] for char in text)
+
+class KeywordMatch(NamedTuple):
+    start: int
+    end: int
+    kind: str  # skill, degree, education, experience, ...
+    label: str  # Canonical name, e.g. "Node.js" for "nodejs"
+    ambiguous: bool  # Also an everyday word or name, e.g. "Go" or "Spring"
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton that finds every keyword in a single pass over the text.
+    Matching is case-insensitive and respects word boundaries, so "ai" does not
+    match inside "maintain" while "c++" and "node.js" still match as written.
+    """
+
+    def __init__(self, keywords: Iterable[Tuple[str, str, str, bool]]):
+        # keywords: (alias, kind, label, ambiguous)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[int, str, str, bool]]] = [[]]  # (alias length, kind, label, ambiguous)
+
+        for alias, kind, label, ambiguous in keywords:
+            alias = _fold_case(alias).strip()
+            if alias:
+                self._add(alias, kind, label, ambiguous)
+        self._build_failure_links()
+
+    @classmethod
+    def from_taxonomy(cls, path: str) -> "KeywordMatcher":
+        """
+        Build a matcher from a taxonomy file shaped as {kind: {label: entry}}.
+        An entry is a list of aliases, or {"aliases": [...], "ambiguous": true}
+        for labels that are also everyday words; the label itself always matches,
+        flagged ambiguous if so, while its aliases never are.
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            taxonomy = json.load(f)
+
+        keywords = []
+        for kind, labels in taxonomy.items():
+            for label, entry in labels.items():
+                if isinstance(entry, dict):
+                    aliases = entry.get("aliases", [])
+                    ambiguous = entry.get("ambiguous", False)
+                else:
+                    aliases, ambiguous = entry, False
+                keywords.append((label, kind, label, ambiguous))
+                keywords.extend((alias, kind, label, False) for alias in aliases)
+        return cls(keywords)
+
+    def find_all(self, text: str) -> List[KeywordMatch]:
+        """Find all keyword occurrences, ordered by end position"""
+        matches = []
+        lowered = _fold_case(text)
+        length = len(lowered)
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+
+        for i, char in enumerate(lowered):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            for alias_length, kind, label, ambiguous in output[state]:
+                start = i - alias_length + 1
+                end = i + 1
+                # Reject matches glued to neighbouring letters or digits
+                if lowered[start].isalnum() and start > 0 and lowered[start - 1].isalnum():
+                    continue
+                if lowered[i].isalnum() and end < length and lowered[end].isalnum():
+                    continue
+                matches.append(KeywordMatch(start, end, kind, label, ambiguous))
+
+        return matches
+
+    def find_labels(self, text: str, kind: str) -> List[str]:
+        """Get distinct labels of one kind, in order of first appearance"""
+        return unique_labels(self.find_all(text), kind)
+
+    def _add(self, alias: str, kind: str, label: str, ambiguous: bool):
+        state = 0
+        for char in alias:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        entry = (len(alias), kind, label, ambiguous)
+        if entry not in self._output[state]:
+            self._output[state].append(entry)
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                # Inherit keywords that end at the fallback state
+                self._output[next_state].extend(self._output[self._fail[next_state]])
+
+def unique_labels(matches: Iterable[KeywordMatch], kind: str) -> List[str]:
+    """Distinct labels of one kind, in order of first appearance"""
+    labels = []
+    seen = set()
+    for match in sorted(matches, key=lambda m: m.start):
+        if match.kind == kind and match.label not in seen:
+            seen.add(match.label)
+            labels.append(match.label)
+    return labels
+
+def remove_nested(matches: Iterable[KeywordMatch]) -> List[KeywordMatch]:
+    """
+    Drop matches lying inside a longer match of the same kind, so "c++" does
+    not also count as "C" and "node.js" does not also count as "JS"
+    """
+    kept = []
+    reach: Dict[str, int] = {}  # Furthest end seen so far per kind
+    for match in sorted(matches, key=lambda m: (m.start, -m.end)):
+        if match.end <= reach.get(match.kind, -1):
+            continue
+        reach[match.kind] = match.end
+        kept.append(match)
+    return kept
+
+# Global matcher over the skills/degree/section taxonomy, compiled once at import
+taxonomy_matcher = KeywordMatcher.from_taxonomy(
+    settings.taxonomy_path or str(Path(__file__).with_name("skills_taxonomy.json"))
+)
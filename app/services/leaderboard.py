@@ -0,0 +1,52 @@
+import heapq
+from typing import Any, Dict, Iterable, List, Optional
+from app.storage.data_models import RankedBatchResult
+
+def leader_entries(ranked_result: RankedBatchResult, depth: int) -> List[Dict[str, Any]]:
+    """Top candidates of a ranked batch as compact leaderboard entries, best first"""
+    return [
+        {
+            "resume_id": candidate.resume_id,
+            "filename": candidate.original_filename,
+            "score": candidate.score,
+            "batch_rank": candidate.rank,
+            "category_scores": candidate.category_scores
+        }
+        for candidate in ranked_result.ranked_candidates[:depth]
+    ]
+
+def merge_leaders(leaders: Dict[str, List[Dict[str, Any]]], top_k: int,
+                  batch_ids: Optional[Iterable[str]] = None, unique: bool = True) -> List[Dict[str, Any]]:
+    """
+    Top k candidates across batches from each batch's leaderboard entries.
+    The per-batch lists are already sorted, so a heap-based k-way merge stops
+    after k entries: O(B + k log B) for B batches, with no batch loaded.
+    unique keeps only the best entry of a resume ranked in several batches.
+    Ties keep batch ID order.
+    """
+    if batch_ids is not None:
+        wanted = set(batch_ids)
+        leaders = {batch_id: entries for batch_id, entries in leaders.items() if batch_id in wanted}
+
+    lists = [(batch_id, entries) for batch_id, entries in sorted(leaders.items()) if entries]
+    # One cursor per batch: (-score, batch index, position in its list)
+    heap = [(-entries[0]["score"], index, 0) for index, (_, entries) in enumerate(lists)]
+    heapq.heapify(heap)
+
+    top: List[Dict[str, Any]] = []
+    seen = set()
+    while heap and len(top) < top_k:
+        _, index, position = heap[0]
+        batch_id, entries = lists[index]
+        entry = entries[position]
+        if position + 1 < len(entries):
+            heapq.heapreplace(heap, (-entries[position + 1]["score"], index, position + 1))
+        else:
+            heapq.heappop(heap)
+
+        if unique:
+            if entry["resume_id"] in seen:
+                continue
+            seen.add(entry["resume_id"])
+        top.append({**entry, "batch_id": batch_id, "rank": len(top) + 1})
+    return top
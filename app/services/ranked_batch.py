@@ -0,0 +1,197 @@
+from bisect import bisect_left
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from app.core.config import settings
+from app.services.score_stats import ScoreStats, percentile_label
+from app.storage.data_models import RankedBatchResult, ScoredResume
+
+class RankedBatch:
+    """
+    Candidates of one batch kept sorted by score, best first.
+    Insertion and removal find their position by bisecting a parallel array of
+    sort keys, and the sums and counters behind the summary statistics are
+    updated per candidate, so adding a late applicant never re-sorts the batch
+    or rescans every score. Ranks are positions and are only written out by
+    to_result. Ties keep the order given by each candidate's order key
+    (upload order in batches), falling back to insertion order.
+    """
+
+    def __init__(self, batch_id: str, batch_name: Optional[str] = None, created_date: Optional[datetime] = None):
+        self.batch_id = batch_id
+        self.batch_name = batch_name
+        self.created_date = created_date or datetime.utcnow()
+
+        self._keys: List[Tuple[float, int, str]] = []  # (-score, order key, resume_id), ascending
+        self._candidates: List[ScoredResume] = []  # Parallel to _keys
+        self._key_by_resume: Dict[str, Tuple[float, int, str]] = {}
+        self._next_order = 0
+
+        self._stats = ScoreStats(settings.stats_sketch_k)
+        self._stats_stale = False  # Set by removals, which the sketch cannot undo
+
+    @classmethod
+    def from_candidates(cls, batch_id: str, candidates: Iterable[ScoredResume],
+                        batch_name: Optional[str] = None, order: Optional[Dict[str, int]] = None,
+                        created_date: Optional[datetime] = None) -> "RankedBatch":
+        """
+        Build a ranked batch with a single sort. order maps resume IDs to their
+        tie-break position and defaults to the order of candidates; a later
+        candidate for the same resume replaces an earlier one.
+        """
+        ranked = cls(batch_id, batch_name, created_date)
+        latest = {candidate.resume_id: candidate for candidate in candidates}
+        entries = []
+        for position, candidate in enumerate(latest.values()):
+            order_key = order.get(candidate.resume_id, position) if order else position
+            entries.append(((-candidate.score, order_key, candidate.resume_id), candidate))
+        entries.sort(key=lambda entry: entry[0])
+
+        for key, candidate in entries:
+            ranked._keys.append(key)
+            ranked._candidates.append(candidate)
+            ranked._key_by_resume[candidate.resume_id] = key
+            ranked._stats.add(candidate.score, candidate.category_scores)
+            ranked._next_order = max(ranked._next_order, key[1] + 1)
+        return ranked
+
+    @classmethod
+    def from_result(cls, ranked_result: RankedBatchResult, order: Optional[Dict[str, int]] = None) -> "RankedBatch":
+        """Load a stored ranking, by default keeping its current order for ties"""
+        return cls.from_candidates(
+            ranked_result.batch_id, ranked_result.ranked_candidates,
+            ranked_result.batch_name, order, ranked_result.created_date
+        )
+
+    def __len__(self) -> int:
+        return len(self._candidates)
+
+    def __contains__(self, resume_id: str) -> bool:
+        return resume_id in self._key_by_resume
+
+    def insert(self, candidate: ScoredResume, order_key: Optional[int] = None) -> int:
+        """Insert a candidate, replacing any earlier entry for the same resume; returns its rank"""
+        if candidate.resume_id in self._key_by_resume:
+            self.remove(candidate.resume_id)
+        if order_key is None:
+            order_key = self._next_order
+        self._next_order = max(self._next_order, order_key + 1)
+
+        key = (-candidate.score, order_key, candidate.resume_id)
+        position = bisect_left(self._keys, key)
+        self._keys.insert(position, key)
+        self._candidates.insert(position, candidate)
+        self._key_by_resume[candidate.resume_id] = key
+        self._stats.add(candidate.score, candidate.category_scores)
+        return position + 1
+
+    def remove(self, resume_id: str) -> Optional[ScoredResume]:
+        """Remove a candidate by resume ID, returning it if it was ranked"""
+        key = self._key_by_resume.pop(resume_id, None)
+        if key is None:
+            return None
+        position = bisect_left(self._keys, key)
+        del self._keys[position]
+        candidate = self._candidates.pop(position)
+        self._stats.remove(candidate.score, candidate.category_scores)
+        self._stats_stale = True
+        return candidate
+
+    def rank_of(self, resume_id: str) -> Optional[int]:
+        """Current rank of a candidate, or None if it is not ranked"""
+        key = self._key_by_resume.get(resume_id)
+        if key is None:
+            return None
+        return bisect_left(self._keys, key) + 1
+
+    def summary_stats(self, percentiles: Optional[Sequence[float]] = None) -> Dict[str, Any]:
+        """
+        Summary statistics in the shape stored on RankedBatchResult. Percentiles
+        (0-100, default settings.stats_percentiles) are exact, read from the
+        sorted scores.
+        """
+        count = len(self._candidates)
+        if not count:
+            return {
+                "total_candidates": 0,
+                "average_score": 0,
+                "score_range": {"min": 0, "max": 0},
+                "score_distribution": {},
+                "top_performers": [],
+                "category_averages": {}
+            }
+
+        if percentiles is None:
+            percentiles = settings.stats_percentiles_list
+        overall = self._stats.overall
+        return {
+            "total_candidates": count,
+            "average_score": round(overall.mean, 2),
+            "median_score": round(self._median(), 2),
+            "score_std_dev": round(overall.std_dev, 2),
+            "score_range": {
+                "min": round(self._score_at(count - 1), 2),
+                "max": round(self._score_at(0), 2)
+            },
+            "score_distribution": self._stats.histogram.to_dict(),
+            "top_performers": self._top_performers(),
+            "category_averages": {
+                category: round(running.mean, 2) if running.count else 0.0
+                for category, running in self._stats.categories.items()
+            },
+            "percentiles": {
+                percentile_label(percentile): round(
+                    self._score_at(count - 1 - min(int(count * percentile / 100), count - 1)), 2
+                )
+                for percentile in percentiles
+            }
+        }
+
+    def stats_state(self) -> Dict[str, Any]:
+        """Serialized ScoreStats for merging, rebuilt first if candidates were removed"""
+        if self._stats_stale:
+            self._stats = ScoreStats.from_scores(
+                (candidate.score for candidate in self._candidates),
+                (candidate.category_scores for candidate in self._candidates),
+                settings.stats_sketch_k
+            )
+            self._stats_stale = False
+        return self._stats.to_dict()
+
+    def to_result(self) -> RankedBatchResult:
+        """
+        Snapshot as a RankedBatchResult with ranks filled in. Candidates are
+        copied, so stored (and possibly cached) results are never mutated later.
+        """
+        return RankedBatchResult(
+            batch_id=self.batch_id,
+            batch_name=self.batch_name,
+            total_candidates=len(self._candidates),
+            created_date=self.created_date,
+            ranked_candidates=[
+                candidate.model_copy(update={"rank": rank}) for rank, candidate in enumerate(self._candidates, 1)
+            ],
+            summary_stats=self.summary_stats(),
+            stats_state=self.stats_state()
+        )
+
+    def _score_at(self, position: int) -> float:
+        return -self._keys[position][0]
+
+    def _median(self) -> float:
+        count = len(self._keys)
+        middle = count // 2
+        if count % 2:
+            return self._score_at(middle)
+        return (self._score_at(middle - 1) + self._score_at(middle)) / 2
+
+    def _top_performers(self, top_n: int = 5) -> List[Dict[str, Any]]:
+        return [
+            {
+                "rank": rank,
+                "name": candidate.original_filename,
+                "score": candidate.score,
+                "top_skills": candidate.highlights.get("top_skills", [])[:3],
+                "strengths": candidate.highlights.get("strengths", [])[:2]
+            }
+            for rank, candidate in enumerate(self._candidates[:top_n], 1)
+        ]
@@ -0,0 +1,91 @@
+import re
+from typing import Any, Dict, Iterable, Optional
+
+# Compiled once; scoring never touches raw text again
+_YEARS_PATTERNS = [
+    re.compile(r'(\d+)\s*years?\s*of\s*experience'),
+    re.compile(r'experience.*?(\d+)\s*years?'),
+    re.compile(r'(\d+)\s*years?\s*in')
+]
+_BULLET_PATTERN = re.compile(r'^[^\S\n]*(?:[-•*]|\d+\.)[^\S\n]', re.MULTILINE)
+
+# Highest first
+DEGREE_LEVELS = ("phd", "master", "bachelor", "associate")
+
+class ResumeFeatures:
+    """
+    Everything the scoring engine reads about a resume, computed once at parse
+    time and stored with the parsed content under "features", so scoring and
+    re-scoring need no text processing.
+    """
+
+    __slots__ = (
+        "skills", "has_contact_info", "has_email", "has_phone", "has_linkedin",
+        "experience_count", "education_count", "years_of_experience", "degree",
+        "text_length", "line_count", "bullet_count"
+    )
+
+    def __init__(self, skills: Iterable[str] = (), has_contact_info: bool = False,
+                 has_email: bool = False, has_phone: bool = False, has_linkedin: bool = False,
+                 experience_count: int = 0, education_count: int = 0,
+                 years_of_experience: Optional[int] = None, degree: Optional[str] = None,
+                 text_length: int = 0, line_count: int = 0, bullet_count: int = 0):
+        self.skills = list(skills)
+        self.has_contact_info = has_contact_info
+        self.has_email = has_email
+        self.has_phone = has_phone
+        self.has_linkedin = has_linkedin
+        self.experience_count = experience_count
+        self.education_count = education_count
+        self.years_of_experience = years_of_experience
+        self.degree = degree  # One of DEGREE_LEVELS
+        self.text_length = text_length
+        self.line_count = line_count
+        self.bullet_count = bullet_count
+
+    @classmethod
+    def from_parsed(cls, text: str, parsed_data: Dict[str, Any]) -> "ResumeFeatures":
+        """Compute features from extracted text and the structured data parsed from it"""
+        contact_info = parsed_data.get("contact_info") or {}
+        degrees = parsed_data.get("degrees") or []
+
+        return cls(
+            skills=parsed_data.get("skills") or [],
+            has_contact_info=bool(contact_info),
+            has_email=bool(contact_info.get("email")),
+            has_phone=bool(contact_info.get("phone")),
+            has_linkedin=bool(contact_info.get("linkedin")),
+            experience_count=len(parsed_data.get("experience") or []),
+            education_count=len(parsed_data.get("education") or []),
+            years_of_experience=_find_years_of_experience(text.lower()),
+            degree=next((degree for degree in DEGREE_LEVELS if degree in degrees), None),
+            text_length=len(text),
+            line_count=text.count('\n') + 1,
+            bullet_count=len(_BULLET_PATTERN.findall(text))
+        )
+
+    @classmethod
+    def from_parsed_content(cls, parsed_content: Dict[str, Any]) -> "ResumeFeatures":
+        """
+        Get the features stored with parsed content, computing them for content
+        parsed before features were stored
+        """
+        features = parsed_content.get("features")
+        if features is not None:
+            return cls.from_dict(features)
+        return cls.from_parsed(parsed_content.get("extracted_text", ""), parsed_content.get("parsed_data") or {})
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ResumeFeatures":
+        return cls(**{name: data[name] for name in cls.__slots__ if name in data})
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+def _find_years_of_experience(text: str) -> Optional[int]:
+    """Years from the first pattern that matches, e.g. "5 years of experience" """
+    for pattern in _YEARS_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            return int(match.group(1))
+    return None
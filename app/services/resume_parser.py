@@ -1,71 +1,390 @@
 import PyPDF2
-from docx import Document
-from typing import Dict, Any
+import zipfile
+from xml.etree import ElementTree
+from bisect import bisect_right
+from typing import Dict, Any, List, Optional, Set, Tuple
+import asyncio
+import multiprocessing
 import os
+import time
 import re
 from pathlib import Path
+from app.core.config import settings
+from app.services.keyword_matcher import KeywordMatch, remove_nested, taxonomy_matcher, unique_labels
+from app.services.resume_features import ResumeFeatures
+
+# One slot per worker so the parse timeout covers running time, not queueing
+_parser_slots = asyncio.Semaphore(max(1, settings.parser_workers))
+_idle_workers: List["ParserWorker"] = []
+_all_workers: Set["ParserWorker"] = set()
+
+class ParserWorkerDied(Exception):
+    pass
+
+class ParserWorker:
+    """
+    Long-lived parser process with its own pipe, running one file at a time.
+    Because each parse has a known process, a stuck parse is stopped by
+    killing just that process; parses on other workers keep running.
+    """
+
+    def __init__(self):
+        self._conn, child_conn = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(target=_parser_worker_main, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+
+    def parse(self, file_path: str, timeout: float) -> Dict[str, Any]:
+        """
+        Blocking parse on this worker. Raises TimeoutError after killing the
+        worker if the parse runs too long, and ParserWorkerDied if it exits.
+        """
+        try:
+            self._conn.send((file_path, settings.parser_max_pages, settings.parser_max_chars))
+            ready = self._conn.poll(timeout)
+            if ready:
+                ok, result = self._conn.recv()
+        except (EOFError, OSError):
+            self.kill()
+            raise ParserWorkerDied
+        if not ready:
+            self.kill()
+            raise TimeoutError
+        if not ok:
+            raise Exception(result)
+        return result
+
+    def kill(self):
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+        self._conn.close()
+
+def _parser_worker_main(conn):
+    """Parse files sent over the pipe until it closes"""
+    while True:
+        try:
+            file_path, max_pages, max_chars = conn.recv()
+        except EOFError:
+            return
+        try:
+            conn.send((True, parse_resume_sync(file_path, max_pages, max_chars)))
+        except Exception as e:
+            conn.send((False, str(e)))
+
+def shutdown_parser_pool():
+    """Stop parser worker processes"""
+    for worker in list(_all_workers):
+        worker.kill()
+    _all_workers.clear()
+    _idle_workers.clear()
 
 async def parse_resume(file_path: str) -> Dict[str, Any]:
-    """Parse resume and extract text content"""
+    """
+    Parse resume in a worker process so CPU-bound extraction never blocks the event loop.
+    A file that exceeds the parse timeout has its own worker killed; a worker that
+    dies for any other reason is replaced and the file retried once.
+    """
+    loop = asyncio.get_running_loop()
+    async with _parser_slots:
+        for attempt in range(2):
+            worker = _idle_workers.pop() if _idle_workers else ParserWorker()
+            _all_workers.add(worker)
+            try:
+                result = await loop.run_in_executor(
+                    None, worker.parse, file_path, settings.parser_timeout_seconds
+                )
+            except TimeoutError:
+                _all_workers.discard(worker)
+                raise Exception(f"Error parsing resume: timed out after {settings.parser_timeout_seconds}s")
+            except ParserWorkerDied:
+                _all_workers.discard(worker)
+                if attempt:
+                    raise Exception("Error parsing resume: parser worker died")
+                continue
+            except asyncio.CancelledError:
+                # The worker is still busy with this file; stop it rather than leave it running
+                _all_workers.discard(worker)
+                worker.kill()
+                raise
+            except Exception:
+                _idle_workers.append(worker)
+                raise
+            _idle_workers.append(worker)
+            return result
+
+def parse_resume_sync(file_path: str, max_pages: Optional[int] = None,
+                      max_chars: Optional[int] = None) -> Dict[str, Any]:
+    """Parse resume and extract text content, reading at most max_pages PDF pages and max_chars characters"""
     try:
         file_extension = Path(file_path).suffix.lower()
+        extraction_stats: Dict[str, Any] = {}
         
         if file_extension == '.pdf':
-            extracted_text = extract_text_from_pdf(file_path)
+            extracted_text = extract_text_from_pdf(file_path, max_pages, max_chars, extraction_stats)
         elif file_extension in ['.docx', '.doc']:
-            extracted_text = extract_text_from_docx(file_path)
+            extracted_text = extract_text_from_docx(file_path, max_chars)
         else:
             raise ValueError(f"Unsupported file type: {file_extension}")
         
-        # Parse structured data
+        # Parse structured data and the features scoring reads
         parsed_data = parse_structured_data(extracted_text)
+        features = ResumeFeatures.from_parsed(extracted_text, parsed_data)
         
         return {
             "extracted_text": extracted_text,
             "parsed_data": parsed_data,
-            "parsing_method": f"{file_extension[1:]}_parser"
+            "features": features.to_dict(),
+            "parsing_method": f"{file_extension[1:]}_parser",
+            "extraction_stats": extraction_stats
         }
     
     except Exception as e:
         raise Exception(f"Error parsing resume: {str(e)}")
 
-def extract_text_from_pdf(file_path: str) -> str:
-    """Extract text from PDF file"""
-    text = ""
+def extract_text_from_pdf(file_path: str, max_pages: Optional[int] = None, max_chars: Optional[int] = None,
+                          stats: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Extract text from PDF file, stopping after max_pages pages or once max_chars
+    characters have been read. Pages without fonts (scanned images) are skipped
+    without running text extraction. Per-page timings are recorded in stats.
+    """
+    page_texts = []
+    page_stats = []
+    chars = 0
+    stopped_by = None
     try:
         with open(file_path, 'rb') as file:
             reader = PyPDF2.PdfReader(file)
-            for page in reader.pages:
-                text += page.extract_text() + "\n"
+            pages_total = len(reader.pages)
+            for page_number, page in enumerate(reader.pages):
+                if max_pages is not None and page_number >= max_pages:
+                    stopped_by = "max_pages"
+                    break
+                if max_chars is not None and chars >= max_chars:
+                    stopped_by = "max_chars"
+                    break
+                
+                started = time.perf_counter()
+                if _page_may_have_text(page):
+                    page_text = page.extract_text() or ""
+                    page_texts.append(page_text)
+                    chars += len(page_text) + 1
+                    skipped = False
+                else:
+                    page_text = ""
+                    skipped = True
+                page_stats.append({
+                    "page": page_number + 1,
+                    "chars": len(page_text),
+                    "skipped": skipped,
+                    "ms": round((time.perf_counter() - started) * 1000, 2)
+                })
     except Exception as e:
         raise Exception(f"Error reading PDF: {str(e)}")
     
-    return text.strip()
+    text = "\n".join(page_texts).strip()
+    if max_chars is not None and len(text) > max_chars:
+        text = text[:max_chars]
+        stopped_by = "max_chars"
+    
+    if stats is not None:
+        stats.update({
+            "pages_total": pages_total,
+            "pages_read": len(page_stats),
+            "pages_skipped": sum(1 for page in page_stats if page["skipped"]),
+            "chars": len(text),
+            "stopped_by": stopped_by,
+            "total_ms": round(sum(page["ms"] for page in page_stats), 2),
+            "pages": page_stats
+        })
+    
+    return text
 
-def extract_text_from_docx(file_path: str) -> str:
-    """Extract text from DOCX file"""
+def _page_may_have_text(page) -> bool:
+    """
+    Cheap check on the page resources: text needs a font, either on the page
+    or inside a form XObject, so a page with neither is image-only
+    """
+    resources = page.get("/Resources")
+    if resources is None:
+        return False
+    resources = resources.get_object()
+    if "/Font" in resources:
+        return True
+    xobjects = resources.get("/XObject")
+    if xobjects is None:
+        return False
+    return any(
+        xobject.get_object().get("/Subtype") == "/Form"
+        for xobject in xobjects.get_object().values()
+    )
+
+def extract_text_from_docx(file_path: str, max_chars: Optional[int] = None) -> str:
+    """
+    Extract text from DOCX file by streaming word/document.xml out of the zip.
+    Paragraphs and table cells are emitted in document order, one table row per
+    line with cells separated by " | ", and parsed elements are discarded as soon
+    as they are read so memory stays flat on large documents. Reading stops once
+    max_chars characters have been collected.
+    """
+    lines = []
+    chars = 0
+    runs = []  # Text runs of each open paragraph (text boxes nest paragraphs)
+    cells = []  # Paragraph texts of each open table cell
+    rows = []  # Cell texts of each open table row
+    body = None
     try:
-        doc = Document(file_path)
-        text = ""
-        for paragraph in doc.paragraphs:
-            text += paragraph.text + "\n"
+        with zipfile.ZipFile(file_path) as archive, archive.open("word/document.xml") as document:
+            for event, element in ElementTree.iterparse(document, events=("start", "end")):
+                tag = element.tag
+                if event == "start":
+                    if tag == _W_P:
+                        runs.append([])
+                    elif tag == _W_TC:
+                        cells.append([])
+                    elif tag == _W_TR:
+                        rows.append([])
+                    elif tag == _W_BODY:
+                        body = element
+                    continue
+                
+                if tag == _W_T:
+                    if runs and element.text:
+                        runs[-1].append(element.text)
+                elif tag in _W_BREAKS:
+                    if runs:
+                        runs[-1].append(_W_BREAKS[tag])
+                elif tag == _W_P:
+                    paragraph = "".join(runs.pop())
+                    if cells:
+                        cells[-1].append(paragraph)
+                    else:
+                        lines.append(paragraph)
+                        chars += len(paragraph) + 1
+                    element.clear()
+                elif tag == _W_TC:
+                    rows[-1].append(" ".join(text.strip() for text in cells.pop() if text.strip()))
+                elif tag == _W_TR:
+                    row = " | ".join(cell for cell in rows.pop() if cell)
+                    if cells:
+                        cells[-1].append(row)  # Nested table
+                    else:
+                        lines.append(row)
+                        chars += len(row) + 1
+                    element.clear()
+                
+                # Drop finished top-level content so the tree never grows
+                if body is not None and not cells and tag in (_W_P, _W_TBL):
+                    body.clear()
+                if max_chars is not None and chars >= max_chars:
+                    break
     except Exception as e:
         raise Exception(f"Error reading DOCX: {str(e)}")
     
-    return text.strip()
+    text = "\n".join(lines).strip()
+    return text[:max_chars] if max_chars is not None else text
+
+_W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_BODY = _W_NS + "body"
+_W_P = _W_NS + "p"
+_W_T = _W_NS + "t"
+_W_TBL = _W_NS + "tbl"
+_W_TR = _W_NS + "tr"
+_W_TC = _W_NS + "tc"
+_W_BREAKS = {_W_NS + "tab": "\t", _W_NS + "br": "\n", _W_NS + "cr": "\n"}
 
 def parse_structured_data(text: str) -> Dict[str, Any]:
     """Parse structured data from resume text"""
+    # One pass of the keyword matcher and one segmentation pass feed every extractor,
+    # each of which then only looks at its own section
+    matches = taxonomy_matcher.find_all(text)
+    sections = segment_sections(text, matches)
+    
+    contact_text = _section_text(text, sections, "contact")
+    contact_info = extract_contact_info(contact_text) if contact_text else {}
+    if not contact_info:
+        contact_info = extract_contact_info(text)
+    
     data = {
-        "contact_info": extract_contact_info(text),
-        "skills": extract_skills(text),
-        "experience": extract_experience(text),
-        "education": extract_education(text),
-        "summary": extract_summary(text)
+        "contact_info": contact_info,
+        "skills": extract_skills(text, matches, sections),
+        "experience": extract_experience(text, matches, sections),
+        "education": extract_education(text, matches, sections),
+        "degrees": extract_degrees(text, matches, sections),
+        # Education and experience terms found anywhere, for candidate search
+        "keywords": unique_labels(matches, "education") + unique_labels(matches, "experience"),
+        "summary": extract_summary(text, sections),
+        "sections": sections
     }
     
     return data
 
+def segment_sections(text: str, matches: Optional[List[KeywordMatch]] = None) -> List[Dict[str, Any]]:
+    """
+    Split resume text into typed sections (contact, summary, experience, education,
+    skills, other) at heading lines found by the keyword matcher. Text before the
+    first heading is treated as contact details. Each section records the offsets
+    of its body, excluding the heading itself.
+    """
+    if matches is None:
+        matches = taxonomy_matcher.find_all(text)
+    
+    headings = []  # (heading line start, body start, section type, heading text)
+    for match in remove_nested(match for match in matches if match.kind == "section"):
+        line_start = text.rfind('\n', 0, match.start) + 1
+        if headings and headings[-1][0] == line_start:
+            continue  # One heading per line
+        body_start = _heading_body_start(text, line_start, match)
+        if body_start is not None:
+            headings.append((line_start, body_start, match.label, text[match.start:match.end]))
+    
+    sections = []
+    first_heading = headings[0][0] if headings else len(text)
+    if text[:first_heading].strip():
+        sections.append({"type": "contact", "heading": "", "start": 0, "end": first_heading})
+    for i, (line_start, body_start, section_type, heading) in enumerate(headings):
+        end = headings[i + 1][0] if i + 1 < len(headings) else len(text)
+        sections.append({"type": section_type, "heading": heading, "start": min(body_start, end), "end": end})
+    
+    return sections
+
+def _heading_body_start(text: str, line_start: int, match: KeywordMatch) -> Optional[int]:
+    """
+    Get where the body of a section starts if the match is a heading, else None.
+    A heading is a short line such as "Work Experience" or "RELEVANT EXPERIENCE:",
+    or a line opening with "Skills:" or a "Skills | ..." table row followed by
+    inline content.
+    """
+    line_end = text.find('\n', match.end)
+    if line_end == -1:
+        line_end = len(text)
+    
+    if not _HEADING_PREFIX.fullmatch(text[line_start:match.start]):
+        return None
+    rest = text[match.end:line_end]
+    if not rest.strip(_HEADING_DECORATION):
+        return line_end
+    separator = rest.lstrip()[:1]
+    if separator in (':', '|'):  # "Skills: ..." or a "Skills | ..." table row
+        return match.end + rest.index(separator) + 1
+    return None
+
+# Up to two leading words ("Relevant Work Experience") after optional bullets or numbering
+_HEADING_PREFIX = re.compile(r'[^\w\n]*(?:\d+[.)]?\s+)?(?:[A-Za-z&]+\s+){0,2}')
+_HEADING_DECORATION = ' \t\r:-–—|_=*#•'
+
+def _section_spans(sections: List[Dict[str, Any]], section_type: str) -> List[Tuple[int, int]]:
+    """Body offsets of every section of the given type"""
+    return [(section["start"], section["end"]) for section in sections if section["type"] == section_type]
+
+def _section_text(text: str, sections: List[Dict[str, Any]], section_type: str) -> Optional[str]:
+    """Body text of all sections of the given type, or None if the resume has none"""
+    spans = _section_spans(sections, section_type)
+    if not spans:
+        return None
+    return '\n'.join(text[start:end] for start, end in spans)
+
 def extract_contact_info(text: str) -> Dict[str, str]:
     """Extract contact information"""
     contact_info = {}
@@ -90,62 +409,100 @@ def extract_contact_info(text: str) -> Dict[str, str]:
     
     return contact_info
 
-def extract_skills(text: str) -> list:
-    """Extract skills from resume text"""
-    skills = []
-    
-    # Common technical skills
-    tech_skills = [
-        'Python', 'Java', 'JavaScript', 'React', 'Node.js', 'SQL', 'HTML', 'CSS',
-        'Git', 'Docker', 'AWS', 'Azure', 'MongoDB', 'PostgreSQL', 'FastAPI',
-        'Django', 'Flask', 'Machine Learning', 'AI', 'Data Science'
-    ]
+def extract_skills(text: str, matches: Optional[List[KeywordMatch]] = None,
+                   sections: Optional[List[Dict[str, Any]]] = None) -> list:
+    """Extract skills from the skills section using the skills taxonomy"""
+    if matches is None:
+        matches = taxonomy_matcher.find_all(text)
+    if sections is None:
+        sections = segment_sections(text, matches)
+    skill_matches = remove_nested(match for match in matches if match.kind == "skill")
     
-    text_lower = text.lower()
-    for skill in tech_skills:
-        if skill.lower() in text_lower:
-            skills.append(skill)
+    # Everything listed under a skills heading counts, ambiguous names included
+    spans = _section_spans(sections, "skills")
+    if spans:
+        return unique_labels(
+            [match for match in skill_matches if any(start <= match.start < end for start, end in spans)],
+            "skill"
+        )
     
-    return list(set(skills))
-
-def extract_experience(text: str) -> list:
-    """Extract work experience"""
-    experience = []
-    
-    # Look for common experience indicators
-    experience_patterns = [
-        r'(.*?)\s*[-–—]\s*(\d{4}.*?)(?:\n|$)',
-        r'(\d{4}.*?)\s*[-–—]\s*(.*?)(?:\n|$)'
+    # Without a skills section, ambiguous names ("Go", "R", "Spring") only count
+    # on a line that also mentions an unambiguous skill
+    line_starts = _line_starts(text)
+    skill_lines = {
+        bisect_right(line_starts, match.start)
+        for match in skill_matches if not match.ambiguous
+    }
+    confirmed = [
+        match for match in skill_matches
+        if not match.ambiguous or bisect_right(line_starts, match.start) in skill_lines
     ]
     
-    lines = text.split('\n')
-    for line in lines:
-        if any(word in line.lower() for word in ['experience', 'work', 'employment', 'position']):
-            experience.append(line.strip())
-    
-    return experience
+    return unique_labels(confirmed, "skill")
 
-def extract_education(text: str) -> list:
-    """Extract education information"""
-    education = []
-    
-    # Look for education keywords
-    education_keywords = ['education', 'degree', 'university', 'college', 'bachelor', 'master', 'phd']
-    
-    lines = text.split('\n')
-    for line in lines:
-        if any(keyword in line.lower() for keyword in education_keywords):
-            education.append(line.strip())
-    
-    return education
+def extract_experience(text: str, matches: Optional[List[KeywordMatch]] = None,
+                       sections: Optional[List[Dict[str, Any]]] = None) -> list:
+    """Extract work experience entries from the experience section"""
+    if matches is None:
+        matches = taxonomy_matcher.find_all(text)
+    if sections is None:
+        sections = segment_sections(text, matches)
+    body = _section_text(text, sections, "experience")
+    if body is not None:
+        return _non_empty_lines(body)
+    return _lines_with_keywords(text, matches, {"experience"})
+
+def extract_education(text: str, matches: Optional[List[KeywordMatch]] = None,
+                      sections: Optional[List[Dict[str, Any]]] = None) -> list:
+    """Extract education entries from the education section"""
+    if matches is None:
+        matches = taxonomy_matcher.find_all(text)
+    if sections is None:
+        sections = segment_sections(text, matches)
+    body = _section_text(text, sections, "education")
+    if body is not None:
+        return _non_empty_lines(body)
+    return _lines_with_keywords(text, matches, {"education", "degree"})
 
-def extract_summary(text: str) -> str:
-    """Extract resume summary/objective"""
+def extract_degrees(text: str, matches: Optional[List[KeywordMatch]] = None,
+                    sections: Optional[List[Dict[str, Any]]] = None) -> list:
+    """Extract degree levels (phd, master, bachelor, associate) named in the education section"""
+    if matches is None:
+        matches = taxonomy_matcher.find_all(text)
+    if sections is None:
+        sections = segment_sections(text, matches)
+    spans = _section_spans(sections, "education")
+    if spans:
+        matches = [match for match in matches if any(start <= match.start < end for start, end in spans)]
+    return unique_labels(matches, "degree")
+
+def _non_empty_lines(text: str) -> List[str]:
+    return [line.strip() for line in text.split('\n') if line.strip()]
+
+def _line_starts(text: str) -> List[int]:
+    """Offsets at which each line of the text begins"""
+    starts = [0]
+    position = text.find('\n')
+    while position != -1:
+        starts.append(position + 1)
+        position = text.find('\n', position + 1)
+    return starts
+
+def _lines_with_keywords(text: str, matches: Optional[List[KeywordMatch]], kinds: Set[str]) -> list:
+    """Get the stripped lines containing a keyword of one of the given kinds, in order"""
+    if matches is None:
+        matches = taxonomy_matcher.find_all(text)
+    line_starts = _line_starts(text)
+    line_numbers = sorted({
+        bisect_right(line_starts, match.start) - 1
+        for match in matches if match.kind in kinds
+    })
     lines = text.split('\n')
-    
-    for i, line in enumerate(lines):
-        if any(word in line.lower() for word in ['summary', 'objective', 'profile', 'about']):
-            # Return next few lines as summary
-            summary_lines = lines[i:i+3]
-            return ' '.join(summary_lines).strip()
-    
\ No newline at end of file
+    return [lines[number].strip() for number in line_numbers]
+
+def extract_summary(text: str, sections: Optional[List[Dict[str, Any]]] = None) -> str:
+    """Extract resume summary/objective from the summary section"""
+    if sections is None:
+        sections = segment_sections(text)
+    body = _section_text(text, sections, "summary")
+    return ' '.join(_non_empty_lines(body)) if body else ""
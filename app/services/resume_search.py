@@ -0,0 +1,130 @@
+import heapq
+import re
+from typing import Any, List, Optional, Set, Tuple
+from app.services.keyword_matcher import taxonomy_matcher
+from app.storage.term_index import TermIndex, normalize_term
+
+_TOKEN_PATTERN = re.compile(r'\(|\)|"([^"]*)"|[^\s()"]+')
+_OPERATORS = {"AND", "OR", "NOT"}
+# Preferred kind when a query term is an alias of several
+_TERM_KINDS = ("skill", "degree", "education", "experience")
+
+def parse_query(query: str) -> Tuple:
+    """
+    Parse a boolean query into a tree of ("term", t), ("not", node),
+    ("and", [nodes]) and ("or", [nodes]). NOT binds tightest, then AND, then
+    OR; adjacent terms are ANDed, so "python aws NOT java" means python AND
+    aws AND NOT java. Quote multi-word terms: "machine learning".
+    Raises ValueError on malformed queries.
+    """
+    tokens = []
+    for match in _TOKEN_PATTERN.finditer(query):
+        text = match.group(0)
+        if match.group(1) is not None:
+            tokens.append(("term", match.group(1)))
+        elif text in "()":
+            tokens.append((text, text))
+        elif text.upper() in _OPERATORS:
+            tokens.append((text.upper(), text))
+        else:
+            tokens.append(("term", text))
+    if not tokens:
+        raise ValueError("Empty query")
+
+    position = 0
+
+    def peek() -> Optional[str]:
+        return tokens[position][0] if position < len(tokens) else None
+
+    def parse_or() -> Tuple:
+        nonlocal position
+        nodes = [parse_and()]
+        while peek() == "OR":
+            position += 1
+            nodes.append(parse_and())
+        return nodes[0] if len(nodes) == 1 else ("or", nodes)
+
+    def parse_and() -> Tuple:
+        nonlocal position
+        nodes = [parse_not()]
+        while peek() in ("AND", "NOT", "term", "("):
+            if peek() == "AND":
+                position += 1
+            nodes.append(parse_not())
+        return nodes[0] if len(nodes) == 1 else ("and", nodes)
+
+    def parse_not() -> Tuple:
+        nonlocal position
+        kind = peek()
+        if kind == "NOT":
+            position += 1
+            return ("not", parse_not())
+        if kind == "(":
+            position += 1
+            node = parse_or()
+            if peek() != ")":
+                raise ValueError("Missing closing parenthesis")
+            position += 1
+            return node
+        if kind == "term":
+            term = canonical_term(tokens[position][1])
+            position += 1
+            if not term:
+                raise ValueError("Empty search term")
+            return ("term", term)
+        raise ValueError(f"Unexpected {tokens[position][1]!r}" if kind else "Query ends unexpectedly")
+
+    tree = parse_or()
+    if position < len(tokens):
+        raise ValueError(f"Unexpected {tokens[position][1]!r}")
+    return tree
+
+def canonical_term(term: str) -> str:
+    """Normalized term, mapped to its taxonomy label when it is a known alias ("golang" -> "go")"""
+    term = normalize_term(term)
+    covering = [
+        match for match in taxonomy_matcher.find_all(term)
+        if match.start == 0 and match.end == len(term) and match.kind in _TERM_KINDS
+    ]
+    if covering:
+        covering.sort(key=lambda match: _TERM_KINDS.index(match.kind))
+        return normalize_term(covering[0].label)
+    return term
+
+def evaluate(tree: Tuple, index: TermIndex) -> Set[str]:
+    """Resume IDs matching a parsed query; may be the index's own posting set, so do not mutate"""
+    kind = tree[0]
+    if kind == "term":
+        return index.postings(tree[1])
+    if kind == "or":
+        return set().union(*(evaluate(node, index) for node in tree[1]))
+    if kind == "not":
+        return index.resume_ids() - evaluate(tree[1], index)
+
+    # AND: intersect positive clauses smallest first, then subtract negated ones,
+    # so NOT never materializes the complement unless every clause is negated
+    positives = [evaluate(node, index) for node in tree[1] if node[0] != "not"]
+    negatives = [evaluate(node[1], index) for node in tree[1] if node[0] == "not"]
+    if positives:
+        positives.sort(key=len)
+        result = positives[0].intersection(*positives[1:])
+    else:
+        result = index.resume_ids()
+    return result.difference(*negatives)
+
+def search_resumes(index: TermIndex, query: str, min_score: Optional[float] = None,
+                   limit: int = 50) -> Tuple[List[Tuple[str, Optional[float]]], int]:
+    """
+    Resumes matching a boolean query with their latest scores, best first
+    (unscored resumes last); returns at most limit results and the total
+    number of matches. min_score excludes unscored resumes.
+    """
+    tree = parse_query(query)
+    with index.lock:
+        scored = index.scores(list(evaluate(tree, index)), min_score)
+    top = heapq.nsmallest(limit, scored, key=_result_order)
+    return top, len(scored)
+
+def _result_order(result: Tuple[str, Optional[float]]) -> Tuple[Any, ...]:
+    resume_id, score = result
+    return (score is None, -(score or 0.0), resume_id)
@@ -0,0 +1,264 @@
+import math
+import random
+from bisect import bisect_right
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+CATEGORIES = ("completeness", "technical_skills", "experience", "education", "presentation")
+
+# (label, lower bound), highest first
+SCORE_BUCKETS = (
+    ("90-100", 90), ("80-89", 80), ("70-79", 70), ("60-69", 60),
+    ("50-59", 50), ("40-49", 40), ("30-39", 30), ("0-29", float("-inf"))
+)
+
+class RunningStats:
+    """
+    Count, mean and variance via Welford's algorithm. Values can be added and
+    removed one at a time, and two accumulators merge exactly (Chan et al.),
+    so per-batch stats combine into org-wide ones without the raw scores.
+    min/max are kept for additions and merges only.
+    """
+
+    __slots__ = ("count", "mean", "m2", "min", "max")
+
+    def __init__(self, count: int = 0, mean: float = 0.0, m2: float = 0.0,
+                 min: Optional[float] = None, max: Optional[float] = None):
+        self.count = count
+        self.mean = mean
+        self.m2 = m2  # Sum of squared differences from the mean
+        self.min = min
+        self.max = max
+
+    def add(self, value: float):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def remove(self, value: float):
+        """Undo an earlier add; min/max are left to the caller to refresh"""
+        if self.count <= 1:
+            self.count, self.mean, self.m2 = 0, 0.0, 0.0
+            return
+        delta = value - self.mean
+        self.count -= 1
+        self.mean -= delta / self.count
+        self.m2 = max(self.m2 - delta * (value - self.mean), 0.0)
+
+    def merge(self, other: "RunningStats"):
+        if not other.count:
+            return
+        if not self.count:
+            self.count, self.mean, self.m2, self.min, self.max = other.count, other.mean, other.m2, other.min, other.max
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def variance(self) -> float:
+        """Population variance"""
+        return self.m2 / self.count if self.count else 0.0
+
+    @property
+    def std_dev(self) -> float:
+        return math.sqrt(self.variance)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RunningStats":
+        return cls(**data)
+
+class ScoreHistogram:
+    """Counts per fixed score bucket, found by bisecting the bucket bounds"""
+
+    def __init__(self, counts: Optional[Dict[str, int]] = None):
+        self.counts = {label: 0 for label, _ in SCORE_BUCKETS}
+        if counts:
+            self.counts.update(counts)
+
+    # Ascending lower bounds and their labels, for bisect
+    _bounds = [bound for _, bound in reversed(SCORE_BUCKETS)]
+    _labels = [label for label, _ in reversed(SCORE_BUCKETS)]
+
+    def add(self, score: float, count: int = 1):
+        self.counts[self._labels[bisect_right(self._bounds, score) - 1]] += count
+
+    def remove(self, score: float):
+        self.add(score, -1)
+
+    def merge(self, other: "ScoreHistogram"):
+        for label, count in other.counts.items():
+            self.counts[label] = self.counts.get(label, 0) + count
+
+    def to_dict(self) -> Dict[str, int]:
+        return dict(self.counts)
+
+class KLLSketch:
+    """
+    KLL quantile sketch (Karnin, Lang, Liberty). Keeps O(k log n) values in
+    levels of compactors; a full level is sorted and every other value is
+    promoted with double weight. Rank error is about 1.7/k with high
+    probability, sketches merge, and fewer than ~k values are kept exactly.
+    """
+
+    def __init__(self, k: int = 200, count: int = 0, compactors: Optional[List[List[float]]] = None):
+        self.k = k
+        self.count = count
+        self.compactors: List[List[float]] = compactors or [[]]
+
+    def add(self, value: float):
+        self.compactors[0].append(value)
+        self.count += 1
+        self._compress()
+
+    def merge(self, other: "KLLSketch"):
+        while len(self.compactors) < len(other.compactors):
+            self.compactors.append([])
+        for level, items in enumerate(other.compactors):
+            self.compactors[level].extend(items)
+        self.count += other.count
+        self._compress()
+
+    def quantile(self, fraction: float) -> Optional[float]:
+        """Approximate value at the given fraction (0-1) of the sorted values"""
+        weighted = sorted(
+            (value, 1 << level) for level, items in enumerate(self.compactors) for value in items
+        )
+        if not weighted:
+            return None
+        total = sum(weight for _, weight in weighted)
+        target = fraction * total
+        cumulative = 0
+        for value, weight in weighted:
+            cumulative += weight
+            if cumulative > target:
+                return value
+        return weighted[-1][0]
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.compactors) - level - 1
+        return max(2, math.ceil(self.k * (2 / 3) ** depth))
+
+    def _compress(self):
+        while sum(len(items) for items in self.compactors) > sum(
+            self._capacity(level) for level in range(len(self.compactors))
+        ):
+            for level, items in enumerate(self.compactors):
+                if len(items) >= self._capacity(level):
+                    if level + 1 == len(self.compactors):
+                        self.compactors.append([])
+                    items.sort()
+                    # Odd leftovers stay on this level
+                    keep = [items.pop()] if len(items) % 2 else []
+                    self.compactors[level + 1].extend(items[random.getrandbits(1)::2])
+                    self.compactors[level] = keep
+                    break
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"k": self.k, "count": self.count, "compactors": self.compactors}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "KLLSketch":
+        return cls(data["k"], data["count"], [list(items) for items in data["compactors"]])
+
+class ScoreStats:
+    """
+    Mergeable summary of a set of scored candidates: running stats of the
+    overall and category scores, a score histogram and a quantile sketch.
+    Serializable, so each batch stores its state and dashboards merge states
+    instead of loading candidates.
+    """
+
+    def __init__(self, sketch_k: int = 200):
+        self.overall = RunningStats()
+        self.categories = {category: RunningStats() for category in CATEGORIES}
+        self.histogram = ScoreHistogram()
+        self.sketch = KLLSketch(sketch_k)
+
+    @classmethod
+    def from_scores(cls, scores: Iterable[float], category_scores: Iterable[Dict[str, float]],
+                    sketch_k: int = 200) -> "ScoreStats":
+        stats = cls(sketch_k)
+        for score, categories in zip(scores, category_scores):
+            stats.add(score, categories)
+        return stats
+
+    def add(self, score: float, category_scores: Dict[str, float]):
+        self.overall.add(score)
+        for category, category_score in category_scores.items():
+            if category in self.categories:
+                self.categories[category].add(category_score)
+        self.histogram.add(score)
+        self.sketch.add(score)
+
+    def remove(self, score: float, category_scores: Dict[str, float]):
+        """
+        Undo an earlier add. Counts, means, variances and the histogram stay
+        exact; min/max and the sketch cannot forget a value, so a holder of the
+        remaining scores rebuilds with from_scores before storing or merging.
+        """
+        self.overall.remove(score)
+        for category, category_score in category_scores.items():
+            if category in self.categories:
+                self.categories[category].remove(category_score)
+        self.histogram.remove(score)
+
+    def merge(self, other: "ScoreStats"):
+        self.overall.merge(other.overall)
+        for category, running in other.categories.items():
+            self.categories.setdefault(category, RunningStats()).merge(running)
+        self.histogram.merge(other.histogram)
+        self.sketch.merge(other.sketch)
+
+    def summary(self, percentiles: Sequence[float]) -> Dict[str, Any]:
+        """Dashboard view; percentiles (0-100) come from the sketch and are approximate"""
+        overall = self.overall
+        return {
+            "total_candidates": overall.count,
+            "average_score": round(overall.mean, 2),
+            "score_std_dev": round(overall.std_dev, 2),
+            "score_range": {
+                "min": round(overall.min, 2) if overall.min is not None else 0,
+                "max": round(overall.max, 2) if overall.max is not None else 0
+            },
+            "score_distribution": self.histogram.to_dict(),
+            "category_averages": {
+                category: round(running.mean, 2) for category, running in self.categories.items()
+            },
+            "percentiles": {
+                percentile_label(percentile): round(self.sketch.quantile(percentile / 100), 2)
+                for percentile in percentiles if overall.count
+            }
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "overall": self.overall.to_dict(),
+            "categories": {category: running.to_dict() for category, running in self.categories.items()},
+            "histogram": self.histogram.to_dict(),
+            "sketch": self.sketch.to_dict()
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ScoreStats":
+        stats = cls(data["sketch"]["k"])
+        stats.overall = RunningStats.from_dict(data["overall"])
+        stats.categories = {
+            category: RunningStats.from_dict(running) for category, running in data["categories"].items()
+        }
+        stats.histogram = ScoreHistogram(data["histogram"])
+        stats.sketch = KLLSketch.from_dict(data["sketch"])
+        return stats
+
+def percentile_label(percentile: float) -> str:
+    """Summary key for a percentile, e.g. 90 -> "p90", 99.9 -> "p99.9" """
+    return f"p{percentile:g}"
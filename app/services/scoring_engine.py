@@ -1,6 +1,7 @@
-from typing import Dict, Any, List
-import re
+from typing import Dict, Any, List, Optional, Sequence
+import numpy as np
 from app.storage.data_models import AnalysisResult
+from app.services.resume_features import ResumeFeatures
 
 class ScoringEngine:
     def __init__(self):
@@ -21,10 +22,31 @@ class ScoringEngine:
             "education": self._score_education,
             "presentation": self._score_presentation
         }
+        
+        # Array versions of the criteria above, used by score_batch
+        self.batch_criteria = {
+            "completeness": self._score_completeness_batch,
+            "technical_skills": self._score_technical_skills_batch,
+            "experience": self._score_experience_batch,
+            "education": self._score_education_batch,
+            "presentation": self._score_presentation_batch
+        }
+        
+        self.in_demand_skills = {
+            "python", "java", "javascript", "react", "node.js", "sql",
+            "aws", "docker", "kubernetes", "machine learning", "ai"
+        }
+        
+        self.degree_scores = {
+            "phd": 20,
+            "master": 15,
+            "bachelor": 10,
+            "associate": 5
+        }
 
-    def score_resume(self, parsed_data: Dict[str, Any], analysis: AnalysisResult) -> Dict[str, Any]:
+    def score_resume(self, features: ResumeFeatures, analysis: AnalysisResult) -> Dict[str, Any]:
         """
-        Score a resume based on multiple criteria
+        Score a resume based on multiple criteria, reading only its precomputed features
         Returns a dictionary with overall score and category scores
         """
         try:
@@ -32,7 +54,7 @@ class ScoringEngine:
             
             # Calculate scores for each category
             for category, scoring_func in self.criteria.items():
-                category_scores[category] = scoring_func(parsed_data, analysis)
+                category_scores[category] = scoring_func(features, analysis)
             
             # Calculate weighted overall score
             overall_score = sum(
@@ -41,7 +63,7 @@ class ScoringEngine:
             )
             
             # Generate highlights
-            highlights = self._generate_highlights(parsed_data, analysis, category_scores)
+            highlights = self._generate_highlights(features, analysis, category_scores)
             
             return {
                 "overall_score": round(overall_score, 2),
@@ -67,42 +89,163 @@ class ScoringEngine:
                 }
             }
 
-    def _score_completeness(self, parsed_data: Dict[str, Any], analysis: AnalysisResult) -> float:
+    def resolve_weights(self, weights: Optional[Dict[str, float]] = None) -> Dict[str, float]:
+        """
+        Merge custom category weights over the defaults and normalize them to sum to 1,
+        so overall scores stay on the 0-100 scale
+        """
+        if not weights:
+            return dict(self.weights)
+        
+        unknown = set(weights) - set(self.weights)
+        if unknown:
+            raise ValueError(f"Unknown scoring categories: {', '.join(sorted(unknown))}")
+        if any(weight < 0 for weight in weights.values()):
+            raise ValueError("Weights must not be negative")
+        
+        merged = {**self.weights, **weights}
+        total = sum(merged.values())
+        if total <= 0:
+            raise ValueError("At least one weight must be positive")
+        return {category: weight / total for category, weight in merged.items()}
+
+    def score_batch(self, features: Sequence[ResumeFeatures],
+                    analyses: Optional[Sequence[Optional[AnalysisResult]]] = None,
+                    include_highlights: bool = True,
+                    weights: Optional[Dict[str, float]] = None) -> List[Dict[str, Any]]:
+        """
+        Score many resumes at once with array operations over a feature matrix.
+        Returns one result per resume, in order, shaped like score_resume's;
+        score_resume remains the single-resume path and gives the same scores.
+        Skip highlights for backfills that only need the scores, and pass custom
+        category weights (see resolve_weights) for what-if re-scoring.
+        """
+        weights = self.resolve_weights(weights) if weights else self.weights
+        if analyses is None:
+            analyses = [None] * len(features)
+        if not features:
+            return []
+        
+        columns = self._feature_columns(features)
+        category_scores = {}
+        for category, scoring_func in self.batch_criteria.items():
+            ai_scores = np.fromiter((
+                (analysis.category_scores.get(category) or 0.0) if analysis else 0.0
+                for analysis in analyses
+            ), dtype=float, count=len(features))
+            category_scores[category] = scoring_func(columns, ai_scores)
+        
+        # Same summation order as score_resume so both paths round identically
+        overall_scores = np.zeros(len(features))
+        for category in self.weights.keys():
+            overall_scores = overall_scores + category_scores[category] * weights[category]
+        
+        # Back to Python floats column by column; indexing arrays per element is slow
+        categories = list(category_scores.keys())
+        rows = zip(*(category_scores[category].tolist() for category in categories))
+        results = []
+        for resume_features, analysis, overall_score, row in zip(features, analyses, overall_scores.tolist(), rows):
+            scores = dict(zip(categories, row))
+            result = {"overall_score": round(overall_score, 2), "category_scores": scores}
+            if include_highlights:
+                result["highlights"] = self._generate_highlights(resume_features, analysis, scores)
+            results.append(result)
+        return results
+
+    def _feature_columns(self, features: Sequence[ResumeFeatures]) -> Dict[str, np.ndarray]:
+        """Build the feature matrix, one row per resume, and return it by column"""
+        count = len(features)
+        
+        def column(values) -> np.ndarray:
+            return np.fromiter(values, dtype=float, count=count)
+        
+        in_demand = self.in_demand_skills
+        return {
+            "skill_count": column(len(f.skills) for f in features),
+            "in_demand_count": column(sum(skill.lower() in in_demand for skill in f.skills) for f in features),
+            "has_contact_info": column(f.has_contact_info for f in features),
+            "has_email": column(f.has_email for f in features),
+            "has_phone": column(f.has_phone for f in features),
+            "has_linkedin": column(f.has_linkedin for f in features),
+            "experience_count": column(f.experience_count for f in features),
+            "education_count": column(f.education_count for f in features),
+            "years_of_experience": column(
+                np.nan if f.years_of_experience is None else f.years_of_experience for f in features
+            ),
+            "degree_points": column(self.degree_scores.get(f.degree, 0) if f.degree else 0 for f in features),
+            "text_length": column(f.text_length for f in features),
+            "line_count": column(f.line_count for f in features),
+            "bullet_count": column(f.bullet_count for f in features)
+        }
+
+    @staticmethod
+    def _blend_ai_batch(scores: np.ndarray, ai_scores: np.ndarray) -> np.ndarray:
+        """Average with the AI score where there is one, then cap at 100"""
+        return np.minimum(np.where(ai_scores != 0, (scores + ai_scores) / 2, scores), 100.0)
+
+    def _score_completeness_batch(self, columns: Dict[str, np.ndarray], ai_scores: np.ndarray) -> np.ndarray:
+        present_sections = (
+            (columns["has_contact_info"] > 0).astype(float) + (columns["skill_count"] > 0)
+            + (columns["experience_count"] > 0) + (columns["education_count"] > 0)
+        )
+        scores = 50.0 + (present_sections / 4) * 30
+        scores = scores + columns["has_email"] * 10 + columns["has_phone"] * 5 + columns["has_linkedin"] * 5
+        return np.minimum(scores, 100.0)
+
+    def _score_technical_skills_batch(self, columns: Dict[str, np.ndarray], ai_scores: np.ndarray) -> np.ndarray:
+        scores = 50.0 + np.minimum(columns["skill_count"] * 5, 30) + columns["in_demand_count"] * 2
+        return self._blend_ai_batch(scores, ai_scores)
+
+    def _score_experience_batch(self, columns: Dict[str, np.ndarray], ai_scores: np.ndarray) -> np.ndarray:
+        years = columns["years_of_experience"]
+        scores = 50.0 + np.minimum(columns["experience_count"] * 8, 40)
+        scores = scores + np.where(np.isnan(years), 0.0, np.minimum(np.nan_to_num(years) * 3, 20))
+        return self._blend_ai_batch(scores, ai_scores)
+
+    def _score_education_batch(self, columns: Dict[str, np.ndarray], ai_scores: np.ndarray) -> np.ndarray:
+        scores = 50.0 + np.minimum(columns["education_count"] * 10, 30) + columns["degree_points"]
+        return self._blend_ai_batch(scores, ai_scores)
+
+    def _score_presentation_batch(self, columns: Dict[str, np.ndarray], ai_scores: np.ndarray) -> np.ndarray:
+        text_length = columns["text_length"]
+        length_points = np.select(
+            [(text_length >= 500) & (text_length <= 2000), (text_length > 2000) & (text_length <= 3000), text_length > 3000],
+            [20.0, 15.0, 10.0],
+            default=0.0
+        )
+        scores = 50.0 + length_points + (columns["line_count"] > 20) * 15.0 + (columns["bullet_count"] > 5) * 15.0
+        return self._blend_ai_batch(scores, ai_scores)
+
+    def _score_completeness(self, features: ResumeFeatures, analysis: AnalysisResult) -> float:
         """Score resume completeness (0-100)"""
         score = 50.0  # Base score
         
         # Check for essential sections
-        sections = ["contact_info", "skills", "experience", "education"]
-        present_sections = sum(1 for section in sections if parsed_data.get(section))
+        sections = [features.has_contact_info, features.skills, features.experience_count, features.education_count]
+        present_sections = sum(1 for section in sections if section)
         score += (present_sections / len(sections)) * 30
         
         # Check for contact information completeness
-        contact_info = parsed_data.get("contact_info", {})
-        if contact_info.get("email"):
+        if features.has_email:
             score += 10
-        if contact_info.get("phone"):
+        if features.has_phone:
             score += 5
-        if contact_info.get("linkedin"):
+        if features.has_linkedin:
             score += 5
         
         return min(score, 100.0)
 
-    def _score_technical_skills(self, parsed_data: Dict[str, Any], analysis: AnalysisResult) -> float:
+    def _score_technical_skills(self, features: ResumeFeatures, analysis: AnalysisResult) -> float:
         """Score technical skills (0-100)"""
         score = 50.0  # Base score
         
         # Count technical skills
-        skills = parsed_data.get("skills", [])
+        skills = features.skills
         if skills:
             score += min(len(skills) * 5, 30)  # Up to 30 points for skill count
         
         # Check for in-demand skills (bonus points)
-        in_demand_skills = [
-            "python", "java", "javascript", "react", "node.js", "sql", 
-            "aws", "docker", "kubernetes", "machine learning", "ai"
-        ]
-        
-        found_in_demand = sum(1 for skill in skills if skill.lower() in in_demand_skills)
+        found_in_demand = sum(1 for skill in skills if skill.lower() in self.in_demand_skills)
         score += found_in_demand * 2  # 2 points per in-demand skill
         
         # Use AI analysis if available
@@ -112,32 +255,17 @@ class ScoringEngine:
         
         return min(score, 100.0)
 
-    def _score_experience(self, parsed_data: Dict[str, Any], analysis: AnalysisResult) -> float:
+    def _score_experience(self, features: ResumeFeatures, analysis: AnalysisResult) -> float:
         """Score work experience (0-100)"""
         score = 50.0  # Base score
         
         # Count experience entries
-        experience = parsed_data.get("experience", [])
-        if experience:
-            score += min(len(experience) * 8, 40)  # Up to 40 points for experience count
-        
-        # Look for years of experience in text
-        text = parsed_data.get("extracted_text", "").lower()
-        years_patterns = [
-            r'(\d+)\s*years?\s*of\s*experience',
-            r'experience.*?(\d+)\s*years?',
-            r'(\d+)\s*years?\s*in'
-        ]
-        
-        for pattern in years_patterns:
-            matches = re.findall(pattern, text)
-            if matches:
-                try:
-                    years = int(matches[0])
-                    score += min(years * 3, 20)  # Up to 20 points for years
-                    break
-                except:
-                    continue
+        if features.experience_count:
+            score += min(features.experience_count * 8, 40)  # Up to 40 points for experience count
+        
+        # Years of experience stated in the text
+        if features.years_of_experience is not None:
+            score += min(features.years_of_experience * 3, 20)  # Up to 20 points for years
         
         # Use AI analysis if available
         if analysis and analysis.category_scores.get("experience"):
@@ -146,29 +274,17 @@ class ScoringEngine:
         
         return min(score, 100.0)
 
-    def _score_education(self, parsed_data: Dict[str, Any], analysis: AnalysisResult) -> float:
+    def _score_education(self, features: ResumeFeatures, analysis: AnalysisResult) -> float:
         """Score education background (0-100)"""
         score = 50.0  # Base score
         
         # Check for education entries
-        education = parsed_data.get("education", [])
-        if education:
-            score += min(len(education) * 10, 30)  # Up to 30 points for education entries
-        
-        # Look for degree levels
-        text = parsed_data.get("extracted_text", "").lower()
-        degree_scores = {
-            "phd": 20,
-            "doctorate": 20,
-            "master": 15,
-            "bachelor": 10,
-            "associate": 5
-        }
+        if features.education_count:
+            score += min(features.education_count * 10, 30)  # Up to 30 points for education entries
         
-        for degree, points in degree_scores.items():
-            if degree in text:
-                score += points
-                break
+        # Highest degree level (doctorate counts as phd)
+        if features.degree:
+            score += self.degree_scores.get(features.degree, 0)
         
         # Use AI analysis if available
         if analysis and analysis.category_scores.get("education"):
@@ -177,14 +293,12 @@ class ScoringEngine:
         
         return min(score, 100.0)
 
-    def _score_presentation(self, parsed_data: Dict[str, Any], analysis: AnalysisResult) -> float:
+    def _score_presentation(self, features: ResumeFeatures, analysis: AnalysisResult) -> float:
         """Score presentation and formatting (0-100)"""
         score = 50.0  # Base score
         
-        text = parsed_data.get("extracted_text", "")
-        
         # Check text length (not too short, not too long)
-        text_length = len(text)
+        text_length = features.text_length
         if 500 <= text_length <= 2000:
             score += 20
         elif 2000 < text_length <= 3000:
@@ -193,14 +307,11 @@ class ScoringEngine:
             score += 10
         
         # Check for structured formatting
-        lines = text.split('\n')
-        if len(lines) > 20:  # Good structure
+        if features.line_count > 20:  # Good structure
             score += 15
         
         # Check for bullet points or structured lists
-        bullet_patterns = [r'^\s*[-•*]\s', r'^\s*\d+\.\s']
-        bullet_count = sum(1 for line in lines if any(re.match(pattern, line) for pattern in bullet_patterns))
-        if bullet_count > 5:
+        if features.bullet_count > 5:
             score += 15
         
         # Use AI analysis if available
@@ -210,12 +321,12 @@ class ScoringEngine:
         
         return min(score, 100.0)
 
-    def _generate_highlights(self, parsed_data: Dict[str, Any], analysis: AnalysisResult, category_scores: Dict[str, float]) -> Dict[str, Any]:
+    def _generate_highlights(self, features: ResumeFeatures, analysis: AnalysisResult, category_scores: Dict[str, float]) -> Dict[str, Any]:
         """Generate highlights for the resume"""
         highlights = {
-            "top_skills": parsed_data.get("skills", [])[:5],  # Top 5 skills
-            "experience_summary": f"{len(parsed_data.get('experience', []))} positions",
-            "education_summary": f"{len(parsed_data.get('education', []))} education entries",
+            "top_skills": features.skills[:5],  # Top 5 skills
+            "experience_summary": f"{features.experience_count} positions",
+            "education_summary": f"{features.education_count} education entries",
             "strengths": [],
             "areas_for_improvement": []
         }
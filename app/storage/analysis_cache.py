@@ -0,0 +1,121 @@
+import hashlib
+import json
+import os
+import re
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+from app.core.config import settings
+
+class AnalysisCache:
+    """
+    Disk-backed cache of AI analyses keyed by content hash.
+    Entries are evicted least-recently-used first once the cache exceeds
+    max_bytes; recency survives restarts through file modification times.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: Optional["OrderedDict[str, int]"] = None  # key -> size, oldest first
+        self._total_bytes = 0
+
+    @staticmethod
+    def make_key(resume_text: str, ai_provider: str, model_name: str, prompt_version: str) -> str:
+        """Hash normalized resume text together with everything that shapes the analysis"""
+        normalized = unicodedata.normalize("NFC", resume_text)
+        normalized = re.sub(r'\s+', ' ', normalized).strip()
+        digest = hashlib.sha256()
+        for part in (ai_provider, model_name, prompt_version, normalized):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get cached analysis data, or None on a miss"""
+        entries = self._load_entries()
+        entry_file = self._entry_file(key)
+        if key not in entries or not entry_file.exists():
+            self.misses += 1
+            return None
+
+        try:
+            with open(entry_file, 'r') as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"Error reading cache entry {entry_file}: {e}")
+            self._remove(key)
+            self.misses += 1
+            return None
+
+        # Mark as most recently used
+        entries.move_to_end(key)
+        os.utime(entry_file)
+        self.hits += 1
+        return data
+
+    def put(self, key: str, data: Dict[str, Any]):
+        """Store analysis data and evict old entries beyond the size limit"""
+        entries = self._load_entries()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        payload = json.dumps(data, default=str).encode("utf-8")
+
+        entry_file = self._entry_file(key)
+        tmp_file = entry_file.with_suffix(".tmp")
+        with open(tmp_file, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_file, entry_file)
+
+        self._total_bytes -= entries.pop(key, 0)
+        entries[key] = len(payload)
+        self._total_bytes += len(payload)
+
+        while self._total_bytes > self.max_bytes and len(entries) > 1:
+            oldest_key = next(iter(entries))
+            self._remove(oldest_key)
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache size and hit/miss counters"""
+        entries = self._load_entries()
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(entries),
+            "size_bytes": self._total_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+        }
+
+    def _entry_file(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _load_entries(self) -> "OrderedDict[str, int]":
+        """Scan the cache directory once, ordering entries by last use"""
+        if self._entries is None:
+            self._entries = OrderedDict()
+            self._total_bytes = 0
+            if self.cache_dir.exists():
+                files = []
+                for entry_file in self.cache_dir.glob("*.json"):
+                    stat = entry_file.stat()
+                    files.append((stat.st_mtime, entry_file.stem, stat.st_size))
+                for _, key, size in sorted(files):
+                    self._entries[key] = size
+                    self._total_bytes += size
+        return self._entries
+
+    def _remove(self, key: str):
+        self._total_bytes -= self._entries.pop(key, 0)
+        entry_file = self._entry_file(key)
+        if entry_file.exists():
+            entry_file.unlink()
+
+# Global analysis cache instance
+analysis_cache = AnalysisCache(settings.analysis_cache_dir, settings.analysis_cache_max_bytes)
@@ -0,0 +1,178 @@
+import math
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+import numpy as np
+from app.storage.log_index import LogIndex, Operation
+
+# Words with internal dots or trailing +/# stay whole: "node.js", "c++", "c#", "asp.net"
+_TOKEN_PATTERN = re.compile(r'[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9+#]+)*')
+_SINGLE_LETTER_TERMS = {"c", "r"}
+STOPWORDS = frozenset("""
+a about above after all also an and any are as at be been being but by can could did do does doing for from
+had has have having he her here his how i if in into is it its just me more most my no nor not of off on once
+only or other our out over own same she should so some such than that the their them then there these they
+this those through to too under until up very was we were what when where which while who will with would
+you your years year work working experience responsible team etc
+""".split())
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word tokens without stopwords, bare numbers or stray letters"""
+    return [
+        token for token in _TOKEN_PATTERN.findall(text.lower())
+        if token not in STOPWORDS and not token.isdigit()
+        and (len(token) > 1 or token in _SINGLE_LETTER_TERMS)
+    ]
+
+def term_frequencies(text: str) -> Dict[str, int]:
+    return dict(Counter(tokenize(text)))
+
+class BM25Index(LogIndex):
+    """
+    Okapi BM25 over resume text: per-resume term frequencies and lengths, an
+    inverted index from term to {resume_id: frequency}, and the corpus
+    statistics behind IDF, all updated per resume. Scoring walks only the
+    postings of the query's terms, so its cost follows how many resumes
+    mention them rather than the corpus size. Persisted as a log of
+    add/remove operations.
+    """
+
+    def __init__(self, path: Path, rebuild: Optional[Callable[[], Iterable[Operation]]] = None,
+                 k1: float = 1.2, b: float = 0.75):
+        super().__init__(path, rebuild)
+        self.k1 = k1
+        self.b = b
+        self._lengths: Dict[str, int] = {}
+        self._doc_terms: Dict[str, List[str]] = {}
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        with self.lock:
+            self._load()
+            return len(self._lengths)
+
+    def add(self, resume_id: str, frequencies: Dict[str, int]):
+        """Index a resume's term frequencies, replacing any earlier entry for it"""
+        with self.lock:
+            self._load()
+            self._record(["add", resume_id, frequencies])
+
+    def remove(self, resume_id: str):
+        with self.lock:
+            self._load()
+            if resume_id in self._lengths:
+                self._record(["remove", resume_id])
+
+    def idf(self, term: str) -> float:
+        """BM25 IDF, kept positive for terms in most resumes"""
+        df = len(self._postings.get(term, ()))
+        return math.log(1 + (len(self._lengths) - df + 0.5) / (df + 0.5))
+
+    def score(self, query_terms: Iterable[str], resume_ids: Optional[Set[str]] = None) -> Dict[str, float]:
+        """
+        BM25 score of every resume containing at least one query term, counting
+        each distinct term once; resume_ids restricts scoring to those resumes.
+        """
+        with self.lock:
+            self._load()
+            if not self._lengths:
+                return {}
+            average_length = self._total_length / len(self._lengths)
+            k1, b = self.k1, self.b
+            scores: Dict[str, float] = {}
+            for term in set(query_terms):
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = self.idf(term)
+                if resume_ids is not None:
+                    # Walk whichever side is smaller
+                    if len(resume_ids) < len(postings):
+                        postings = {r: postings[r] for r in resume_ids if r in postings}
+                    else:
+                        postings = {r: tf for r, tf in postings.items() if r in resume_ids}
+                for resume_id, tf in postings.items():
+                    norm = k1 * (1 - b + b * self._lengths[resume_id] / average_length)
+                    scores[resume_id] = scores.get(resume_id, 0.0) + idf * tf * (k1 + 1) / (tf + norm)
+            return scores
+
+    def score_matrix(self, queries: Sequence[Iterable[str]],
+                     resume_ids: Optional[Set[str]] = None) -> Tuple[List[str], np.ndarray]:
+        """
+        BM25 scores of many queries at once: the IDs of resumes containing a
+        term of any query, and a resumes x queries matrix equal to score() per
+        query. Each term's postings are walked once however many queries use
+        it; its weights are added to the columns of those queries.
+        """
+        queries_by_term: Dict[str, List[int]] = {}
+        for column, terms in enumerate(queries):
+            for term in set(terms):
+                queries_by_term.setdefault(term, []).append(column)
+
+        with self.lock:
+            self._load()
+            candidates = self._lengths if resume_ids is None else [r for r in resume_ids if r in self._lengths]
+            rows = {resume_id: row for row, resume_id in enumerate(candidates)}
+            row_lengths = np.fromiter(map(self._lengths.__getitem__, rows), dtype=float, count=len(rows))
+            matrix = np.zeros((len(rows), len(queries)))
+            average_length = self._total_length / len(self._lengths) if self._lengths else 0.0
+            k1, b = self.k1, self.b
+            for term, columns in queries_by_term.items():
+                postings = self._postings.get(term)
+                if postings and resume_ids is not None:
+                    if len(resume_ids) < len(postings):
+                        postings = {r: postings[r] for r in resume_ids if r in postings}
+                    else:
+                        postings = {r: tf for r, tf in postings.items() if r in resume_ids}
+                if not postings:
+                    continue
+                count = len(postings)
+                positions = np.fromiter(map(rows.__getitem__, postings), dtype=np.int64, count=count)
+                tf = np.fromiter(postings.values(), dtype=float, count=count)
+                norm = k1 * (1 - b + b * row_lengths[positions] / average_length)
+                weights = self.idf(term) * tf * (k1 + 1) / (tf + norm)
+                matrix[positions[:, None], columns] += weights[:, None]
+
+        # Keep only resumes matching some query
+        hits = np.flatnonzero(matrix.any(axis=1))
+        ids = list(rows)
+        return [ids[row] for row in hits], matrix[hits]
+
+    def matched_terms(self, resume_id: str, query_terms: Iterable[str], limit: int = 10) -> List[str]:
+        """Query terms found in a resume, most distinctive first"""
+        with self.lock:
+            self._load()
+            found = [term for term in set(query_terms) if resume_id in self._postings.get(term, ())]
+            found.sort(key=lambda term: (-self.idf(term), term))
+            return found[:limit]
+
+    def _apply(self, operation: Operation):
+        op, resume_id = operation[0], operation[1]
+        for term in self._doc_terms.pop(resume_id, []):
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(resume_id, None)
+                if not postings:
+                    del self._postings[term]
+        self._total_length -= self._lengths.pop(resume_id, 0)
+
+        if op == "add":
+            frequencies = operation[2]
+            self._doc_terms[resume_id] = list(frequencies)
+            self._lengths[resume_id] = sum(frequencies.values())
+            self._total_length += self._lengths[resume_id]
+            for term, tf in frequencies.items():
+                self._postings.setdefault(term, {})[resume_id] = tf
+
+    def _reset(self):
+        self._lengths, self._doc_terms, self._postings = {}, {}, {}
+        self._total_length = 0
+
+    def _snapshot(self) -> Iterable[Operation]:
+        for resume_id, terms in self._doc_terms.items():
+            yield ["add", resume_id, {term: self._postings[term][resume_id] for term in terms}]
+
+    def _live_count(self) -> int:
+        return len(self._lengths)
@@ -0,0 +1,90 @@
+import base64
+import binascii
+import json
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from app.storage.data_models import RankedBatchResult
+
+class CandidateColumns:
+    """
+    Columnar view of a ranked batch: the overall score and every category
+    score as NumPy arrays in rank order, so the candidates of a score range
+    are found by binary search and category thresholds by a vectorized mask,
+    without touching the ScoredResume objects outside the returned page.
+    Built from a RankedBatchResult and, like it, never mutated.
+    """
+
+    def __init__(self, ranked_result: RankedBatchResult):
+        candidates = ranked_result.ranked_candidates
+        count = len(candidates)
+        # Ranked best first, so negated scores are ascending and searchsorted applies
+        self.neg_scores = -np.fromiter((c.score for c in candidates), dtype=np.float64, count=count)
+        categories = sorted({category for c in candidates for category in c.category_scores})
+        self.categories: Dict[str, np.ndarray] = {
+            category: np.fromiter(
+                (c.category_scores.get(category, 0.0) for c in candidates), dtype=np.float64, count=count
+            )
+            for category in categories
+        }
+        self.resume_ids: List[str] = [c.resume_id for c in candidates]
+        self.position_by_resume = {resume_id: position for position, resume_id in enumerate(self.resume_ids)}
+
+    def __len__(self) -> int:
+        return len(self.resume_ids)
+
+    @property
+    def nbytes(self) -> int:
+        return self.neg_scores.nbytes + sum(column.nbytes for column in self.categories.values())
+
+    def select(self, min_score: Optional[float] = None, max_score: Optional[float] = None,
+               category_min_scores: Optional[Dict[str, float]] = None,
+               cursor: Optional[Tuple[float, str]] = None, limit: Optional[int] = None) -> Tuple[np.ndarray, int]:
+        """
+        Positions (ranks - 1) of candidates within the score range and at or
+        above every category threshold, starting after the cursor; returns at
+        most limit positions and the number of matches after the cursor.
+        A missing category counts as 0, as it does in category_scores.
+        """
+        start = 0 if max_score is None else int(np.searchsorted(self.neg_scores, -max_score, side="left"))
+        end = len(self) if min_score is None else int(np.searchsorted(self.neg_scores, -min_score, side="right"))
+        if cursor is not None:
+            start = max(start, self._after_cursor(*cursor))
+        if start >= end:
+            return np.empty(0, dtype=np.int64), 0
+
+        mask = None
+        for category, threshold in (category_min_scores or {}).items():
+            column = self.categories.get(category)
+            window = column[start:end] >= threshold if column is not None else np.full(end - start, 0.0 >= threshold)
+            mask = window if mask is None else mask & window
+
+        if mask is None:
+            stop = end if limit is None else min(end, start + limit)
+            return np.arange(start, stop), end - start
+        matches = np.flatnonzero(mask) + start
+        return (matches if limit is None else matches[:limit]), len(matches)
+
+    def cursor_at(self, position: int) -> str:
+        """Opaque cursor resuming after the candidate at position"""
+        payload = json.dumps([float(-self.neg_scores[position]), self.resume_ids[position]])
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[float, str]:
+        """Score and resume ID from a cursor; raises ValueError on malformed input"""
+        try:
+            score, resume_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            return float(score), str(resume_id)
+        except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+            raise ValueError("Invalid cursor") from e
+
+    def _after_cursor(self, score: float, resume_id: str) -> int:
+        """
+        Position after the cursor candidate. If it was removed or re-scored,
+        continue after every candidate scoring at least the cursor score.
+        Either way a batch changing between pages never repeats an entry.
+        """
+        position = self.position_by_resume.get(resume_id)
+        if position is not None and -self.neg_scores[position] == score:
+            return position + 1
+        return int(np.searchsorted(self.neg_scores, -score, side="right"))
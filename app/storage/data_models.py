@@ -10,6 +10,7 @@ class ResumeMetadata(BaseModel):
     file_path: str
     file_size: int
     file_type: str
+    content_hash: Optional[str] = None  # SHA-256 of the uploaded bytes
     upload_date: datetime = Field(default_factory=datetime.utcnow)
     is_parsed: bool = False
     is_analyzed: bool = False
@@ -54,7 +55,10 @@ class BatchResult(BaseModel):
     failed_files: int
     created_date: datetime = Field(default_factory=datetime.utcnow)
     completed_date: Optional[datetime] = None
-    status: str = "processing"  # processing, completed, failed
+    status: str = "queued"  # queued, processing, completed, failed
+    resume_ids: List[str] = []  # Resumes persisted at upload time, in upload order
+    failed_resume_ids: List[str] = []
+    force_analysis: bool = False  # Bypass the analysis cache
     results: List[Dict[str, Any]] = []
 
 class ScoredResume(BaseModel):
@@ -66,6 +70,7 @@ class ScoredResume(BaseModel):
     highlights: Dict[str, Any]
     analysis: AnalysisResult
     rank: Optional[int] = None
+    features: Optional[Dict[str, Any]] = None  # ResumeFeatures, kept for re-scoring
 
 class RankedBatchResult(BaseModel):
     batch_id: str
@@ -74,6 +79,54 @@ class RankedBatchResult(BaseModel):
     created_date: datetime
     ranked_candidates: List[ScoredResume]
     summary_stats: Dict[str, Any]
+    view_name: Optional[str] = None  # Set on named ranking views
+    weights: Optional[Dict[str, float]] = None  # Scoring weights of a re-scored ranking
+    stats_state: Optional[Dict[str, Any]] = None  # Mergeable ScoreStats state behind summary_stats
+
+class RescoreRequest(BaseModel):
+    weights: Dict[str, float]  # Category weights; omitted categories keep their defaults
+    view_name: Optional[str] = None  # Persist the result as a named ranking view
+
+class MatchRequest(BaseModel):
+    job_description: str
+    top_k: int = 20
+    blend: float = 0.0  # Weight of the overall resume score against job description relevance, 0-1
+    batch_id: Optional[str] = None  # Only match resumes of this batch
+
+class Requisition(BaseModel):
+    job_description: str
+    requisition_id: Optional[str] = None  # Defaults to the requisition's 1-based position
+    title: Optional[str] = None
+
+class RequisitionMatchRequest(BaseModel):
+    requisitions: List[Requisition]
+    top_k: int = 20  # Candidates ranked per requisition
+    blend: float = 0.0  # Weight of the overall resume score against job description relevance, 0-1
+    best_fit_k: int = 3  # Requisitions listed per shortlisted candidate
+    batch_id: Optional[str] = None  # Only match resumes of this batch
+
+class RequisitionCandidate(BaseModel):
+    resume_id: str
+    filename: str
+    original_filename: str
+    score: float
+    category_scores: Dict[str, float]  # relevance and overall_score, the parts of score
+    highlights: Dict[str, Any]
+    analysis: Optional[AnalysisResult] = None  # Latest analysis; None if not analyzed yet
+    rank: int
+
+class RequisitionRanking(BaseModel):
+    requisition_id: str
+    title: Optional[str]
+    total_candidates: int
+    ranked_candidates: List[RequisitionCandidate]
+    summary_stats: Dict[str, Any]
+
+class RequisitionMatchResponse(BaseModel):
+    batch_id: Optional[str]
+    total_candidates: int
+    rankings: List[RequisitionRanking]
+    best_fit: Dict[str, List[Dict[str, Any]]]  # resume_id -> best-fit requisitions
 
 class BatchUploadResponse(BaseModel):
     batch_id: str
@@ -81,9 +134,24 @@ class BatchUploadResponse(BaseModel):
     total_files: int
     status: str
 
+class BatchStatusResponse(BaseModel):
+    batch_id: str
+    batch_name: Optional[str]
+    status: str
+    total_files: int
+    processed_files: int
+    failed_files: int
+    pending_files: int
+    created_date: datetime
+    completed_date: Optional[datetime] = None
+
 class RankedResultsResponse(BaseModel):
     batch_id: str
     batch_name: Optional[str]
     total_candidates: int
     ranked_candidates: List[ScoredResume]
-    summary_stats: Dict[str, Any]
\ No newline at end of file
+    summary_stats: Dict[str, Any]
+
+class RescoreResponse(RankedResultsResponse):
+    weights: Dict[str, float]
+    view_name: Optional[str] = None
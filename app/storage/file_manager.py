@@ -1,12 +1,20 @@
 import os
+import sys
 import json
 import uuid
 import csv
+import shutil
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Tuple, Any
 from pathlib import Path
 from app.core.config import settings
 from app.storage.data_models import ResumeMetadata, AnalysisResult, BatchResult, RankedBatchResult
+from app.storage.ranked_cache import RankedResultCache
+from app.storage.json_index import JsonIndex, JsonRecords
+from app.storage.log_index import Operation
+from app.storage.term_index import TermIndex, document_terms
+from app.storage.bm25_index import BM25Index, term_frequencies
+from app.storage.minhash_index import MinHashIndex, minhash_signature
 
 class FileManager:
     def __init__(self):
@@ -15,12 +23,48 @@ class FileManager:
         self.metadata_dir = Path(settings.metadata_dir)
         self.upload_dir = Path(settings.upload_dir)
         self.parsed_dir = Path(settings.parsed_dir)
+        self.index_dir = Path(settings.index_dir)
+        
+        self.blob_dir = Path(settings.blob_dir)
+        
+        # resume_id -> {"analysis_ids": [...], "latest": id, "latest_date": iso date}
+        # Built from the analysis files on first run against an existing tree
+        self.analysis_index = JsonIndex(self.index_dir / "analyses_by_resume.json", rebuild=self._scan_analyses)
+        # content_hash -> [resume_id, ...]; a blob is deleted with its last reference
+        self.hash_index = JsonIndex(self.index_dir / "resumes_by_hash.json", rebuild=self._scan_content_hashes)
+        # Held while blobs are placed or released and their references change
+        self._blob_lock = self.hash_index.lock
+        # Per-batch summaries of ranked results (stats state and leaders), one file per batch
+        self.batch_summaries = JsonRecords(self.index_dir / "batch_summaries")
+        
+        # skill/degree/keyword -> resume IDs, plus latest scores, for candidate search
+        self.term_index = TermIndex(self.index_dir / "resume_terms.log", rebuild=self._scan_terms)
+        # BM25 term statistics of resume text, for job description matching
+        self.bm25_index = BM25Index(
+            self.index_dir / "resume_bm25.log", rebuild=self._scan_text_terms, k1=settings.bm25_k1, b=settings.bm25_b
+        )
+        # MinHash signatures of resume text in LSH buckets, for near-duplicate detection
+        self.minhash_index = MinHashIndex(
+            self.index_dir / f"resume_minhash_{settings.minhash_permutations}.log", rebuild=self._scan_signatures,
+            num_perm=settings.minhash_permutations, bands=settings.lsh_bands
+        )
+        
+        # Parsed ranked results, so dashboard reads skip disk and validation
+        self.ranked_cache = RankedResultCache(settings.ranked_cache_max_bytes)
 
     def save_resume_metadata(self, metadata: ResumeMetadata) -> str:
-        """Save resume metadata to JSON file"""
+        """Save resume metadata to JSON file and record its blob reference"""
         metadata_file = self.metadata_dir / f"{metadata.id}.json"
         with open(metadata_file, 'w') as f:
             json.dump(metadata.dict(), f, indent=2, default=str)
+        
+        if metadata.content_hash:
+            with self.hash_index.lock:
+                index = self.hash_index.load()
+                references = index.setdefault(metadata.content_hash, [])
+                if metadata.id not in references:
+                    references.append(metadata.id)
+                    self.hash_index.save(index)
         return str(metadata_file)
 
     def get_resume_metadata(self, resume_id: str) -> Optional[ResumeMetadata]:
@@ -33,10 +77,16 @@ class FileManager:
         return None
 
     def save_analysis_result(self, analysis: AnalysisResult) -> str:
-        """Save analysis result to JSON file"""
+        """Save analysis result to JSON file and record it in the resume index"""
         analysis_file = self.analyses_dir / f"{analysis.id}.json"
         with open(analysis_file, 'w') as f:
             json.dump(analysis.dict(), f, indent=2, default=str)
+        
+        with self.analysis_index.lock:
+            index = self.analysis_index.load()
+            self._add_to_analysis_index(index, analysis)
+            self.analysis_index.save(index)
+        self.term_index.set_score(analysis.resume_id, analysis.overall_score, analysis.analysis_date.isoformat())
         return str(analysis_file)
 
     def get_analysis_result(self, analysis_id: str) -> Optional[AnalysisResult]:
@@ -48,10 +98,146 @@ class FileManager:
                 return AnalysisResult(**data)
         return None
 
+    def get_analyses_for_resume(self, resume_id: str) -> List[AnalysisResult]:
+        """Get all analysis results for a resume, oldest first"""
+        entry = self.analysis_index.load().get(resume_id, {})
+        
+        analyses = []
+        for analysis_id in list(entry.get("analysis_ids", [])):
+            analysis = self.get_analysis_result(analysis_id)
+            if analysis:
+                analyses.append(analysis)
+        return sorted(analyses, key=lambda x: x.analysis_date)
+
+    def get_latest_analysis(self, resume_id: str) -> Optional[AnalysisResult]:
+        """Get the most recent analysis result for a resume"""
+        latest_id = self.analysis_index.load().get(resume_id, {}).get("latest")
+        return self.get_analysis_result(latest_id) if latest_id else None
+
+    def rebuild_analysis_index(self) -> int:
+        """Rebuild the resume -> analysis index from the analysis files; returns analyses indexed"""
+        index = self._scan_analyses()
+        self.analysis_index.save(index)
+        return sum(len(entry["analysis_ids"]) for entry in index.values())
+
+    def _scan_analyses(self) -> Dict[str, Dict[str, Any]]:
+        index: Dict[str, Dict[str, Any]] = {}
+        for analysis_file in self.analyses_dir.glob("*.json"):
+            try:
+                analysis = self.get_analysis_result(analysis_file.stem)
+                if analysis:
+                    self._add_to_analysis_index(index, analysis)
+            except Exception as e:
+                print(f"Error reading {analysis_file}: {e}")
+        return index
+
+    @staticmethod
+    def _add_to_analysis_index(index: Dict[str, Dict[str, Any]], analysis: AnalysisResult):
+        entry = index.setdefault(analysis.resume_id, {"analysis_ids": [], "latest": None, "latest_date": None})
+        if analysis.id not in entry["analysis_ids"]:
+            entry["analysis_ids"].append(analysis.id)
+        analysis_date = analysis.analysis_date.isoformat()
+        if entry["latest_date"] is None or analysis_date >= entry["latest_date"]:
+            entry["latest"] = analysis.id
+            entry["latest_date"] = analysis_date
+
+    def store_blob(self, metadata: ResumeMetadata) -> str:
+        """
+        Move an uploaded file (metadata.file_path) into the content-addressed
+        blob store, where identical content is kept once, and save the metadata
+        pointing at the blob. Both happen under the blob lock, so deleting the
+        last other resume with this content cannot remove the blob in between.
+        """
+        blob_path = self.blob_dir / metadata.content_hash[:2] / f"{metadata.content_hash}.{metadata.file_type}"
+        with self._blob_lock:
+            if blob_path.exists():
+                Path(metadata.file_path).unlink()
+            else:
+                blob_path.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(metadata.file_path, blob_path)
+            metadata.file_path = str(blob_path)
+            self.save_resume_metadata(metadata)
+        return metadata.file_path
+
+    def find_resumes_by_hash(self, content_hash: str) -> List[str]:
+        """Get IDs of resumes whose uploaded bytes have this hash"""
+        return list(self.hash_index.load().get(content_hash, []))
+
+    def reuse_duplicate_results(self, metadata: ResumeMetadata) -> bool:
+        """
+        Copy parsed content and the latest analysis from an already processed
+        resume with byte-identical content. Updates the metadata flags; the
+        caller saves the metadata. Returns True if anything was reused.
+        """
+        if not metadata.content_hash:
+            return False
+        
+        candidates = []
+        for resume_id in self.find_resumes_by_hash(metadata.content_hash):
+            if resume_id == metadata.id:
+                continue
+            parsed_content = self.get_parsed_content(resume_id)
+            if parsed_content:
+                candidates.append((self.get_latest_analysis(resume_id), parsed_content))
+        if not candidates:
+            return False
+        
+        # Prefer a duplicate that has already been analyzed
+        analysis, parsed_content = max(candidates, key=lambda candidate: candidate[0] is not None)
+        self.save_parsed_content(metadata.id, parsed_content)
+        metadata.is_parsed = True
+        if analysis:
+            self.save_analysis_result(analysis.model_copy(update={"id": str(uuid.uuid4()), "resume_id": metadata.id}))
+            metadata.is_analyzed = True
+        return True
+
+    def find_near_duplicates(self, resume_id: str, threshold: Optional[float] = None) -> List[Tuple[str, float]]:
+        """
+        (resume ID, estimated Jaccard similarity) of resumes whose text nearly
+        matches this one's, most similar first. threshold defaults to
+        settings.near_duplicate_threshold.
+        """
+        if threshold is None:
+            threshold = settings.near_duplicate_threshold
+        return self.minhash_index.neighbours(resume_id, threshold)
+
+    def near_duplicate_analysis(self, resume_id: str) -> Optional[AnalysisResult]:
+        """
+        Copy of the latest analysis of the most similar analyzed near-duplicate,
+        assigned to this resume but not saved, or None if there is none.
+        """
+        for duplicate_id, _ in self.find_near_duplicates(resume_id):
+            analysis = self.get_latest_analysis(duplicate_id)
+            if analysis:
+                return analysis.model_copy(update={"id": str(uuid.uuid4()), "resume_id": resume_id})
+        return None
+
+    def _release_upload(self, metadata: ResumeMetadata):
+        """
+        Delete a resume's uploaded file unless other resumes still reference the
+        same blob; call with the blob lock held, after dropping the reference
+        """
+        if metadata.content_hash and self.find_resumes_by_hash(metadata.content_hash):
+            return
+        if metadata.file_path:
+            file_path = Path(metadata.file_path)
+            if file_path.exists():
+                file_path.unlink()
+
+    def _scan_content_hashes(self) -> Dict[str, List[str]]:
+        index: Dict[str, List[str]] = {}
+        for metadata in self.get_all_resumes():
+            if metadata.content_hash:
+                index.setdefault(metadata.content_hash, []).append(metadata.id)
+        return index
+
     def get_all_resumes(self) -> List[ResumeMetadata]:
         """Get all resume metadata"""
         resumes = []
         for metadata_file in self.metadata_dir.glob("*.json"):
+            # Batch and ranked results share the metadata directory
+            if metadata_file.name.startswith(("batch_", "ranked_", "view_")):
+                continue
             try:
                 with open(metadata_file, 'r') as f:
                     data = json.load(f)
@@ -63,21 +249,44 @@ class FileManager:
     def delete_resume(self, resume_id: str) -> bool:
         """Delete resume and associated files"""
         try:
+            metadata = self.get_resume_metadata(resume_id)
+            
             # Delete metadata
             metadata_file = self.metadata_dir / f"{resume_id}.json"
             if metadata_file.exists():
                 metadata_file.unlink()
             
             # Delete analysis files
-            for analysis_file in self.analyses_dir.glob(f"*{resume_id}*.json"):
-                analysis_file.unlink()
+            with self.analysis_index.lock:
+                index = self.analysis_index.load()
+                entry = index.pop(resume_id, None)
+                if entry:
+                    for analysis_id in entry["analysis_ids"]:
+                        analysis_file = self.analyses_dir / f"{analysis_id}.json"
+                        if analysis_file.exists():
+                            analysis_file.unlink()
+                    self.analysis_index.save(index)
             
-            # Delete uploaded file
-            metadata = self.get_resume_metadata(resume_id)
-            if metadata and metadata.file_path:
-                file_path = Path(metadata.file_path)
-                if file_path.exists():
-                    file_path.unlink()
+            # Delete parsed content
+            parsed_file = self.parsed_dir / f"{resume_id}.json"
+            if parsed_file.exists():
+                parsed_file.unlink()
+            self.term_index.remove(resume_id)
+            self.bm25_index.remove(resume_id)
+            self.minhash_index.remove(resume_id)
+            
+            # Drop the blob reference; the file goes with the last one
+            if metadata:
+                with self._blob_lock:
+                    if metadata.content_hash:
+                        index = self.hash_index.load()
+                        references = [r for r in index.get(metadata.content_hash, []) if r != resume_id]
+                        if references:
+                            index[metadata.content_hash] = references
+                        else:
+                            index.pop(metadata.content_hash, None)
+                        self.hash_index.save(index)
+                    self._release_upload(metadata)
             
             return True
         except Exception as e:
@@ -85,10 +294,15 @@ class FileManager:
             return False
 
     def save_parsed_content(self, resume_id: str, content: Dict[str, Any]) -> str:
-        """Save parsed resume content"""
+        """Save parsed resume content and index its terms"""
         parsed_file = self.parsed_dir / f"{resume_id}.json"
         with open(parsed_file, 'w') as f:
             json.dump(content, f, indent=2, default=str)
+        self.term_index.add(resume_id, document_terms(content))
+        self.bm25_index.add(resume_id, term_frequencies(content.get("extracted_text") or ""))
+        self.minhash_index.add(
+            resume_id, minhash_signature(content.get("extracted_text") or "", settings.minhash_permutations)
+        )
         return str(parsed_file)
 
     def get_parsed_content(self, resume_id: str) -> Optional[Dict[str, Any]]:
@@ -99,6 +313,31 @@ class FileManager:
                 return json.load(f)
         return None
 
+    def _iter_parsed_content(self) -> Iterable[Tuple[str, Dict[str, Any]]]:
+        for parsed_file in self.parsed_dir.glob("*.json"):
+            try:
+                with open(parsed_file, 'r') as f:
+                    yield parsed_file.stem, json.load(f)
+            except Exception as e:
+                print(f"Error reading {parsed_file}: {e}")
+
+    def _scan_terms(self) -> Iterable[Operation]:
+        for resume_id, content in self._iter_parsed_content():
+            yield ["add", resume_id, document_terms(content)]
+            analysis = self.get_latest_analysis(resume_id)
+            if analysis:
+                yield ["score", resume_id, analysis.overall_score, analysis.analysis_date.isoformat()]
+
+    def _scan_text_terms(self) -> Iterable[Operation]:
+        for resume_id, content in self._iter_parsed_content():
+            yield ["add", resume_id, term_frequencies(content.get("extracted_text") or "")]
+
+    def _scan_signatures(self) -> Iterable[Operation]:
+        for resume_id, content in self._iter_parsed_content():
+            signature = minhash_signature(content.get("extracted_text") or "", settings.minhash_permutations)
+            if signature is not None:
+                yield ["add", resume_id, signature]
+
     # New batch processing methods
     def save_batch_result(self, batch_result: BatchResult) -> str:
         """Save batch processing result"""
@@ -116,22 +355,85 @@ class FileManager:
                 return BatchResult(**data)
         return None
 
-    def save_ranked_batch_result(self, ranked_result: RankedBatchResult) -> str:
-        """Save ranked batch result"""
+    def save_ranked_batch_result(self, ranked_result: RankedBatchResult,
+                                 summary: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Save ranked batch result and write it through to the cache, along with
+        its summary ({"stats": ScoreStats state, "leaders": leaderboard entries})
+        for cross-batch reads. Without a summary, a stored one is dropped.
+        """
         ranked_file = self.metadata_dir / f"ranked_{ranked_result.batch_id}.json"
         with open(ranked_file, 'w') as f:
             json.dump(ranked_result.dict(), f, indent=2, default=str)
+        
+        stat = ranked_file.stat()
+        self.ranked_cache.put(ranked_result.batch_id, stat.st_mtime_ns, ranked_result, stat.st_size)
+        
+        if summary is not None:
+            self.save_batch_summary(ranked_result.batch_id, summary)
+        else:
+            self.batch_summaries.delete(ranked_result.batch_id)
         return str(ranked_file)
 
     def get_ranked_batch_result(self, batch_id: str) -> Optional[RankedBatchResult]:
-        """Get ranked batch result by ID"""
+        """Get ranked batch result by ID, served from the cache while the file is unchanged"""
         ranked_file = self.metadata_dir / f"ranked_{batch_id}.json"
-        if ranked_file.exists():
-            with open(ranked_file, 'r') as f:
-                data = json.load(f)
-                return RankedBatchResult(**data)
+        try:
+            stat = ranked_file.stat()
+        except FileNotFoundError:
+            self.ranked_cache.invalidate(batch_id)
+            return None
+        
+        cached = self.ranked_cache.get(batch_id, stat.st_mtime_ns)
+        if cached is not None:
+            return cached
+        
+        with open(ranked_file, 'r') as f:
+            data = json.load(f)
+        ranked_result = RankedBatchResult(**data)
+        self.ranked_cache.put(batch_id, stat.st_mtime_ns, ranked_result, stat.st_size)
+        return ranked_result
+
+    def save_batch_summary(self, batch_id: str, summary: Dict[str, Any]):
+        """Store the summary of a batch's ranked result"""
+        self.batch_summaries.put(batch_id, summary)
+
+    def get_batch_summaries(self, batch_ids: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """Stored summaries of ranked batches (all by default) by batch ID, without loading candidates"""
+        return self.batch_summaries.load(batch_ids)
+
+    def get_unsummarized_batch_ids(self) -> List[str]:
+        """IDs of ranked batches without a stored summary, from directory listings alone"""
+        summarized = set(self.batch_summaries.keys())
+        ranked_ids = (ranked_file.stem[len("ranked_"):] for ranked_file in self.metadata_dir.glob("ranked_*.json"))
+        return [batch_id for batch_id in ranked_ids if batch_id not in summarized]
+
+    def save_ranking_view(self, ranked_result: RankedBatchResult) -> str:
+        """Save a re-scored ranking of a batch under its view name"""
+        view_file = self.metadata_dir / f"view_{ranked_result.batch_id}_{ranked_result.view_name}.json"
+        with open(view_file, 'w') as f:
+            json.dump(ranked_result.dict(), f, indent=2, default=str)
+        return str(view_file)
+
+    def get_ranking_view(self, batch_id: str, view_name: str) -> Optional[RankedBatchResult]:
+        """Get a named ranking view of a batch"""
+        view_file = self.metadata_dir / f"view_{batch_id}_{view_name}.json"
+        if view_file.exists():
+            with open(view_file, 'r') as f:
+                return RankedBatchResult(**json.load(f))
         return None
 
+    def get_ranking_views(self, batch_id: str) -> List[RankedBatchResult]:
+        """Get all named ranking views of a batch, newest first"""
+        views = []
+        for view_file in self.metadata_dir.glob(f"view_{batch_id}_*.json"):
+            try:
+                with open(view_file, 'r') as f:
+                    views.append(RankedBatchResult(**json.load(f)))
+            except Exception as e:
+                print(f"Error reading {view_file}: {e}")
+        return sorted(views, key=lambda x: x.created_date, reverse=True)
+
     def save_ranked_results_csv(self, ranked_result: RankedBatchResult) -> str:
         """Save ranked results as CSV file"""
         csv_file = self.metadata_dir / f"ranked_{ranked_result.batch_id}.csv"
@@ -186,6 +488,12 @@ class FileManager:
             ranked_file = self.metadata_dir / f"ranked_{batch_id}.json"
             if ranked_file.exists():
                 ranked_file.unlink()
+            self.ranked_cache.invalidate(batch_id)
+            self.batch_summaries.delete(batch_id)
+            
+            # Delete named ranking views
+            for view_file in self.metadata_dir.glob(f"view_{batch_id}_*.json"):
+                view_file.unlink()
             
             # Delete CSV file
             csv_file = self.metadata_dir / f"ranked_{batch_id}.csv"
@@ -205,15 +513,35 @@ def ensure_directories():
     """Create all required directories"""
     directories = [
         settings.upload_dir,
+        settings.blob_dir,
         settings.parsed_dir,
         settings.data_dir,
         settings.resumes_dir,
         settings.analyses_dir,
-        settings.metadata_dir
+        settings.metadata_dir,
+        settings.analysis_cache_dir,
+        settings.index_dir
     ]
     
     for directory in directories:
         Path(directory).mkdir(parents=True, exist_ok=True)
 
+def create_file_manager() -> FileManager:
+    """Create the storage backend selected by STORAGE_BACKEND"""
+    if settings.storage_backend == "sqlite":
+        from app.storage.sqlite_manager import SQLiteFileManager
+        return SQLiteFileManager(settings.sqlite_path)
+    if settings.storage_backend != "json":
+        raise ValueError(f"Unsupported storage backend: {settings.storage_backend}")
+    return FileManager()
+
 # Global file manager instance
-file_manager = FileManager()
+file_manager = create_file_manager()
+
+if __name__ == "__main__":
+    # Repair the resume -> analysis index: python -m app.storage.file_manager rebuild-index
+    if sys.argv[1:] != ["rebuild-index"]:
+        print("Usage: python -m app.storage.file_manager rebuild-index")
+        sys.exit(1)
+    count = FileManager().rebuild_analysis_index()
+    print(f"Indexed {count} analyses")
@@ -0,0 +1,163 @@
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: no flock, so the lock only covers threads of one process
+    fcntl = None
+
+class FileLock:
+    """
+    Reentrant lock shared by threads and processes: a thread lock plus an
+    exclusive flock on a sidecar file, taken by the outermost acquire only.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._file = None
+        self._pid: Optional[int] = None
+
+    def __enter__(self) -> "FileLock":
+        self._thread_lock.acquire()
+        try:
+            if self._depth == 0 and fcntl and self.path.parent.exists():
+                # A forked worker must not share the parent's open file, or it shares the flock too
+                if self._file is None or self._pid != os.getpid():
+                    self._file = open(self.path, 'a')
+                    self._pid = os.getpid()
+                fcntl.flock(self._file, fcntl.LOCK_EX)
+        except Exception:
+            self._thread_lock.release()
+            raise
+        self._depth += 1
+        return self
+
+    def __exit__(self, *exc_info):
+        self._depth -= 1
+        if self._depth == 0 and fcntl and self._file is not None and self._pid == os.getpid():
+            fcntl.flock(self._file, fcntl.LOCK_UN)
+        self._thread_lock.release()
+
+class JsonIndex:
+    """
+    Dictionary persisted as a single JSON file.
+    Loaded once and kept in memory, reloaded only when another process
+    rewrites the file, and replaced atomically on save. Hold `lock` around
+    a load-modify-save sequence; it also locks out other processes (uvicorn
+    workers) through flock on a `.lock` file next to the index.
+    """
+
+    def __init__(self, path: Path, rebuild: Optional[Callable[[], Dict[str, Any]]] = None):
+        self.path = Path(path)
+        self.lock = FileLock(self.path.with_suffix(".lock"))
+        self._rebuild = rebuild
+        self._data: Optional[Dict[str, Any]] = None
+        self._mtime: Optional[int] = None
+
+    def load(self) -> Dict[str, Any]:
+        """Get the index, building it with the rebuild callback if the file is missing"""
+        with self.lock:
+            if not self.path.exists():
+                if self._data is None:
+                    self.save(self._rebuild() if self._rebuild else {})
+                return self._data
+
+            mtime = self.path.stat().st_mtime_ns
+            if self._data is None or mtime != self._mtime:
+                with open(self.path, 'r') as f:
+                    self._data = json.load(f)
+                self._mtime = mtime
+            return self._data
+
+    def save(self, data: Dict[str, Any]):
+        """Atomically replace the index file"""
+        with self.lock:
+            self._data = data
+            if not self.path.parent.exists():
+                return
+            tmp_file = self.path.with_suffix(".tmp")
+            with open(tmp_file, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_file, self.path)
+            self._mtime = self.path.stat().st_mtime_ns
+
+class JsonRecords:
+    """
+    JSON documents stored one file per key in a directory, so saving one key
+    rewrites only its own file. Reads are cached in memory and a file is
+    reloaded only when its mtime changes.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self._cache: Dict[str, Tuple[int, Any]] = {}
+        self._lock = threading.Lock()
+
+    def keys(self) -> List[str]:
+        """Stored keys, from the directory listing alone"""
+        if not self.directory.exists():
+            return []
+        return [entry.name[:-len(".json")] for entry in os.scandir(self.directory) if entry.name.endswith(".json")]
+
+    def put(self, key: str, value: Any):
+        """Atomically replace a key's file"""
+        if not self.directory.parent.exists():
+            return
+        self.directory.mkdir(exist_ok=True)
+        path = self._path(key)
+        tmp_file = path.with_name(f".{key}.{os.getpid()}.tmp")
+        with open(tmp_file, 'w') as f:
+            json.dump(value, f)
+        os.replace(tmp_file, path)
+        with self._lock:
+            self._cache[key] = (path.stat().st_mtime_ns, value)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._cache.pop(key, None)
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            pass
+
+    def load(self, keys: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Documents by key; all of them, or only those of keys that exist"""
+        if keys is None:
+            if not self.directory.exists():
+                return {}
+            mtimes = {
+                entry.name[:-len(".json")]: entry.stat().st_mtime_ns
+                for entry in os.scandir(self.directory) if entry.name.endswith(".json")
+            }
+        else:
+            mtimes = {}
+            for key in keys:
+                try:
+                    mtimes[key] = self._path(key).stat().st_mtime_ns
+                except FileNotFoundError:
+                    pass
+
+        records = {}
+        with self._lock:
+            for key, mtime in mtimes.items():
+                cached = self._cache.get(key)
+                if cached is None or cached[0] != mtime:
+                    try:
+                        with open(self._path(key), 'r') as f:
+                            cached = (mtime, json.load(f))
+                    except FileNotFoundError:
+                        continue
+                    self._cache[key] = cached
+                records[key] = cached[1]
+            if keys is None:
+                for key in set(self._cache) - set(mtimes):
+                    del self._cache[key]
+        return records
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
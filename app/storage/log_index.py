@@ -0,0 +1,109 @@
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+from app.storage.json_index import FileLock
+
+Operation = List[Any]  # JSON array whose first item names the operation
+
+class LogIndex:
+    """
+    Base for in-memory indexes persisted as an append-only log of JSON
+    operations: an update appends one line instead of rewriting the index,
+    and the log is replaced by a snapshot of the live state once superseded
+    lines dominate. Lines appended by another process are replayed, a log
+    it compacted is reloaded, and a missing log is built from the rebuild
+    callback's operations. `lock` also locks out other processes (uvicorn
+    workers) through flock on a `.lock` file next to the log; hold it around
+    reads that must be consistent with each other.
+
+    Subclasses implement _apply, _reset, _snapshot and _live_count.
+    """
+
+    def __init__(self, path: Path, rebuild: Optional[Callable[[], Iterable[Operation]]] = None):
+        self.path = Path(path)
+        self.lock = FileLock(self.path.with_suffix(".lock"))
+        self._rebuild = rebuild
+        self._loaded = False
+        # (inode, size, mtime) of the log as last read or written by this process; compaction replaces the inode
+        self._file_id: Optional[Tuple[int, int, int]] = None
+        self._lines = 0
+
+    def _apply(self, operation: Operation):
+        raise NotImplementedError
+
+    def _reset(self):
+        raise NotImplementedError
+
+    def _snapshot(self) -> Iterable[Operation]:
+        """Operations that recreate the live state"""
+        raise NotImplementedError
+
+    def _live_count(self) -> int:
+        """Lines a snapshot would have"""
+        raise NotImplementedError
+
+    def _record(self, operation: Operation):
+        """Apply an operation and persist it; call with the lock held after _load"""
+        self._apply(operation)
+        self._append(operation)
+
+    def _load(self):
+        """Replay the log if it is new to this process, building it first if missing"""
+        if not self.path.exists():
+            if not self._loaded:
+                self._reset()
+                for operation in (self._rebuild() if self._rebuild else []):
+                    self._apply(operation)
+                self._loaded = True
+                self._compact()
+            return
+
+        file_id = self._stat_id()
+        if self._loaded and file_id == self._file_id:
+            return
+        offset = 0
+        if self._loaded and self._file_id is not None and file_id[0] == self._file_id[0] \
+                and file_id[1] > self._file_id[1]:
+            # Another process appended: replay only its lines
+            offset = self._file_id[1]
+        else:
+            self._reset()
+            self._lines = 0
+        with open(self.path, 'rb') as f:
+            f.seek(offset)
+            for line in f:
+                if line.strip():
+                    self._apply(json.loads(line))
+                    self._lines += 1
+        self._file_id = file_id
+        self._loaded = True
+
+    def _append(self, operation: Operation):
+        if not self.path.parent.exists():
+            return
+        if self._lines > 2 * self._live_count() + 1000:
+            self._compact()
+            return
+        with open(self.path, 'a') as f:
+            f.write(json.dumps(operation) + "\n")
+        self._lines += 1
+        self._file_id = self._stat_id()
+
+    def _compact(self):
+        """Atomically replace the log with a snapshot of the live state"""
+        if not self.path.parent.exists():
+            return
+        tmp_file = self.path.with_suffix(".tmp")
+        lines = 0
+        with open(tmp_file, 'w') as f:
+            for operation in self._snapshot():
+                f.write(json.dumps(operation) + "\n")
+                lines += 1
+        os.replace(tmp_file, self.path)
+        self._lines = lines
+        self._file_id = self._stat_id()
+
+    def _stat_id(self) -> Tuple[int, int, int]:
+        stat = self.path.stat()
+        return stat.st_ino, stat.st_size, stat.st_mtime_ns
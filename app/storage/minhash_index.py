@@ -0,0 +1,188 @@
+import re
+import zlib
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+import numpy as np
+from app.storage.log_index import LogIndex, Operation
+
+SHINGLE_SIZE = 3  # Words per shingle
+_MERSENNE_PRIME = (1 << 31) - 1  # a * crc32 + b stays below 2**64, so uint64 math never wraps
+_WORD_PATTERN = re.compile(r'\w+')
+
+@lru_cache(maxsize=4)
+def _permutations(num_perm: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Fixed (a, b) of the universal hashes, so signatures stay comparable across processes"""
+    a, b = np.random.RandomState(1).randint(1, _MERSENNE_PRIME, size=(2, num_perm), dtype=np.uint64)
+    return a, b
+
+def shingles(text: str) -> Set[str]:
+    """Overlapping SHINGLE_SIZE-word sequences of lowercased text"""
+    words = _WORD_PATTERN.findall(text.lower())
+    if len(words) <= SHINGLE_SIZE:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)}
+
+def minhash_signature(text: str, num_perm: int = 128) -> Optional[List[int]]:
+    """
+    MinHash signature of the text's shingles; the fraction of equal positions
+    in two signatures estimates the Jaccard similarity of their shingle sets.
+    None for text without words.
+    """
+    shingle_set = shingles(text)
+    if not shingle_set:
+        return None
+    hashes = np.fromiter((zlib.crc32(s.encode()) for s in shingle_set), dtype=np.uint64, count=len(shingle_set))
+    a, b = _permutations(num_perm)
+    return ((a[:, None] * hashes + b[:, None]) % _MERSENNE_PRIME).min(axis=1).tolist()
+
+class MinHashIndex(LogIndex):
+    """
+    Locality-sensitive hashing over resume MinHash signatures. Signatures are
+    cut into bands and each band is a bucket key, so resumes sharing any
+    bucket are near-duplicate candidates; lookups touch only the query's
+    buckets instead of every resume, and candidates are confirmed by
+    comparing full signatures. Persisted as a log of add/remove operations.
+    """
+
+    def __init__(self, path: Path, rebuild: Optional[Callable[[], Iterable[Operation]]] = None,
+                 num_perm: int = 128, bands: int = 32):
+        super().__init__(path, rebuild)
+        self.num_perm = num_perm
+        self.bands = max(1, min(bands, num_perm))
+        self.rows = num_perm // self.bands
+        self._signatures: Dict[str, np.ndarray] = {}
+        self._buckets: List[Dict[bytes, Set[str]]] = [{} for _ in range(self.bands)]
+
+    def __len__(self) -> int:
+        with self.lock:
+            self._load()
+            return len(self._signatures)
+
+    def add(self, resume_id: str, signature: Optional[List[int]]):
+        """Index a resume's signature, replacing any earlier one; None only removes it"""
+        with self.lock:
+            self._load()
+            if signature is not None:
+                self._record(["add", resume_id, signature])
+            elif resume_id in self._signatures:
+                self._record(["remove", resume_id])
+
+    def remove(self, resume_id: str):
+        with self.lock:
+            self._load()
+            if resume_id in self._signatures:
+                self._record(["remove", resume_id])
+
+    def neighbours(self, resume_id: str, threshold: float) -> List[Tuple[str, float]]:
+        """
+        Indexed resumes whose estimated Jaccard similarity to this one is at
+        least threshold, most similar first. Resumes below the banding's
+        detection curve, about (1 / bands) ** (1 / rows), are rarely found.
+        """
+        with self.lock:
+            self._load()
+            signature = self._signatures.get(resume_id)
+            if signature is None:
+                return []
+            candidates = set()
+            for band, key in enumerate(self._band_keys(signature)):
+                candidates.update(self._buckets[band][key])
+            candidates.discard(resume_id)
+            if not candidates:
+                return []
+            ids = list(candidates)
+            similarities = self._similarities(signature, ids)
+        found = [(ids[i], float(similarities[i])) for i in np.flatnonzero(similarities >= threshold)]
+        found.sort(key=lambda pair: (-pair[1], pair[0]))
+        return found
+
+    def clusters(self, threshold: float) -> List[Tuple[List[str], float]]:
+        """
+        Groups of resumes linked by estimated Jaccard similarity of at least
+        threshold (transitively), largest first, each with its weakest link.
+        Only pairs sharing a bucket are compared.
+        """
+        with self.lock:
+            self._load()
+            # Identical signatures collapse into one node before pairing
+            groups: Dict[bytes, List[str]] = {}
+            for resume_id, signature in self._signatures.items():
+                groups.setdefault(signature.tobytes(), []).append(resume_id)
+            parent = {key: key for key in groups}
+            weakest = {key: 1.0 for key in groups if len(groups[key]) > 1}
+
+            def find(key: bytes) -> bytes:
+                while parent[key] != key:
+                    parent[key] = parent[parent[key]]
+                    key = parent[key]
+                return key
+
+            compared = set()
+            for buckets in self._buckets:
+                for members in buckets.values():
+                    if len(members) < 2:
+                        continue
+                    keys = sorted({self._signatures[resume_id].tobytes() for resume_id in members})
+                    for i, first in enumerate(keys):
+                        for second in keys[i + 1:]:
+                            if (first, second) in compared:
+                                continue
+                            compared.add((first, second))
+                            similarity = float(np.mean(
+                                np.frombuffer(first, dtype=np.uint32) == np.frombuffer(second, dtype=np.uint32)
+                            ))
+                            if similarity < threshold:
+                                continue
+                            root_first, root_second = find(first), find(second)
+                            if root_first != root_second:
+                                parent[root_second] = root_first
+                                weakest[root_first] = min(
+                                    similarity, weakest.get(root_first, 1.0), weakest.get(root_second, 1.0)
+                                )
+
+        members_by_root: Dict[bytes, List[str]] = {}
+        for key, resume_ids in groups.items():
+            members_by_root.setdefault(find(key), []).extend(resume_ids)
+        result = [
+            (sorted(resume_ids), weakest[root]) for root, resume_ids in members_by_root.items() if len(resume_ids) > 1
+        ]
+        result.sort(key=lambda cluster: (-len(cluster[0]), cluster[0]))
+        return result
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        rows = self.rows
+        return [signature[band * rows:(band + 1) * rows].tobytes() for band in range(self.bands)]
+
+    def _similarities(self, signature: np.ndarray, resume_ids: List[str]) -> np.ndarray:
+        """Estimated Jaccard similarity of a signature to each resume's"""
+        others = np.stack([self._signatures[resume_id] for resume_id in resume_ids])
+        return (others == signature).mean(axis=1)
+
+    def _apply(self, operation: Operation):
+        op, resume_id = operation[0], operation[1]
+        previous = self._signatures.pop(resume_id, None)
+        if previous is not None:
+            for band, key in enumerate(self._band_keys(previous)):
+                members = self._buckets[band].get(key)
+                if members is not None:
+                    members.discard(resume_id)
+                    if not members:
+                        del self._buckets[band][key]
+
+        if op == "add" and len(operation[2]) == self.num_perm:
+            signature = np.array(operation[2], dtype=np.uint32)
+            self._signatures[resume_id] = signature
+            for band, key in enumerate(self._band_keys(signature)):
+                self._buckets[band].setdefault(key, set()).add(resume_id)
+
+    def _reset(self):
+        self._signatures = {}
+        self._buckets = [{} for _ in range(self.bands)]
+
+    def _snapshot(self) -> Iterable[Operation]:
+        for resume_id, signature in self._signatures.items():
+            yield ["add", resume_id, signature.tolist()]
+
+    def _live_count(self) -> int:
+        return len(self._signatures)
@@ -0,0 +1,92 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from app.storage.data_models import RankedBatchResult
+from app.storage.candidate_columns import CandidateColumns
+
+class RankedResultCache:
+    """
+    Memory-bounded LRU cache of parsed RankedBatchResult objects.
+    Each entry carries a version (the file mtime for the JSON backend) and is
+    treated as a miss when the stored version no longer matches. Entry size is
+    approximated by the size of the serialized result, plus its columnar
+    index once one has been built.
+    Cached objects are shared between requests and must not be mutated.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, Tuple[Any, RankedBatchResult, int, Optional[CandidateColumns]]]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, batch_id: str, version: Any) -> Optional[RankedBatchResult]:
+        """Get a cached result if it is still at the given version"""
+        with self._lock:
+            entry = self._entries.get(batch_id)
+            if entry is None or entry[0] != version:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(batch_id)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, batch_id: str, version: Any, ranked_result: RankedBatchResult, size: int):
+        """Cache a result and evict least recently used entries beyond the limit"""
+        with self._lock:
+            self._pop(batch_id)
+            if size > self.max_bytes:
+                return
+            self._entries[batch_id] = (version, ranked_result, size, None)
+            self._total_bytes += size
+            while self._total_bytes > self.max_bytes:
+                self._pop(next(iter(self._entries)))
+                self.evictions += 1
+
+    def columns(self, batch_id: str, ranked_result: RankedBatchResult) -> CandidateColumns:
+        """
+        Columnar index of a result, built once per cached result and kept in
+        its entry. Results that are not (or no longer) cached get a fresh one.
+        """
+        with self._lock:
+            entry = self._entries.get(batch_id)
+            if entry is not None and entry[1] is ranked_result and entry[3] is not None:
+                return entry[3]
+
+        columns = CandidateColumns(ranked_result)
+        with self._lock:
+            entry = self._entries.get(batch_id)
+            if entry is not None and entry[1] is ranked_result and entry[3] is None:
+                self._entries[batch_id] = (entry[0], entry[1], entry[2] + columns.nbytes, columns)
+                self._total_bytes += columns.nbytes
+                while self._total_bytes > self.max_bytes:
+                    self._pop(next(iter(self._entries)))
+                    self.evictions += 1
+        return columns
+
+    def invalidate(self, batch_id: str):
+        """Drop a batch from the cache"""
+        with self._lock:
+            self._pop(batch_id)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache size and hit-rate counters"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "size_bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+            }
+
+    def _pop(self, batch_id: str):
+        entry = self._entries.pop(batch_id, None)
+        if entry:
+            self._total_bytes -= entry[2]
@@ -0,0 +1,419 @@
+import json
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Any
+from app.core.config import settings
+from app.storage.file_manager import FileManager
+from app.storage.json_index import FileLock
+from app.storage.term_index import document_terms
+from app.storage.bm25_index import term_frequencies
+from app.storage.minhash_index import minhash_signature
+from app.storage.data_models import ResumeMetadata, AnalysisResult, BatchResult, RankedBatchResult
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS resumes (
+    id TEXT PRIMARY KEY,
+    upload_date TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_resumes_upload_date ON resumes(upload_date);
+CREATE INDEX IF NOT EXISTS idx_resumes_content_hash ON resumes(json_extract(data, '$.content_hash'));
+
+CREATE TABLE IF NOT EXISTS parsed_content (
+    resume_id TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS analyses (
+    id TEXT PRIMARY KEY,
+    resume_id TEXT NOT NULL,
+    overall_score REAL NOT NULL,
+    analysis_date TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_analyses_resume_id ON analyses(resume_id, analysis_date);
+CREATE INDEX IF NOT EXISTS idx_analyses_score ON analyses(overall_score);
+
+CREATE TABLE IF NOT EXISTS batches (
+    id TEXT PRIMARY KEY,
+    created_date TEXT NOT NULL,
+    status TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_batches_created_date ON batches(created_date);
+
+CREATE TABLE IF NOT EXISTS ranked_batches (
+    batch_id TEXT PRIMARY KEY,
+    created_date TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS ranked_candidates (
+    batch_id TEXT NOT NULL,
+    resume_id TEXT NOT NULL,
+    rank INTEGER,
+    score REAL NOT NULL,
+    PRIMARY KEY (batch_id, resume_id)
+);
+CREATE INDEX IF NOT EXISTS idx_ranked_candidates_resume_id ON ranked_candidates(resume_id);
+CREATE INDEX IF NOT EXISTS idx_ranked_candidates_score ON ranked_candidates(batch_id, score);
+
+CREATE TABLE IF NOT EXISTS batch_stats (
+    batch_id TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS batch_leaders (
+    batch_id TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS ranking_views (
+    batch_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    created_date TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (batch_id, name)
+);
+"""
+
+def _dumps(data: Dict[str, Any]) -> str:
+    return json.dumps(data, default=str)
+
+class SQLiteFileManager(FileManager):
+    """
+    FileManager backend storing records in SQLite (WAL mode) instead of one JSON file each.
+    Public methods match FileManager; uploads, CSV exports and the resume search indexes stay on disk.
+    """
+
+    def __init__(self, db_path: str):
+        super().__init__()
+        self.db_path = Path(db_path)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        # A resume's row is its blob reference, so row changes and blob files share one lock
+        self._blob_lock = FileLock(self.db_path.with_suffix(".blobs.lock"))
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the database on first use and create the schema"""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _execute(self, query: str, params: tuple = ()) -> List[tuple]:
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                return conn.execute(query, params).fetchall()
+
+    def save_resume_metadata(self, metadata: ResumeMetadata) -> str:
+        """Save resume metadata"""
+        self._execute(
+            "INSERT OR REPLACE INTO resumes (id, upload_date, data) VALUES (?, ?, ?)",
+            (metadata.id, metadata.upload_date.isoformat(), _dumps(metadata.dict()))
+        )
+        return metadata.id
+
+    def get_resume_metadata(self, resume_id: str) -> Optional[ResumeMetadata]:
+        """Get resume metadata by ID"""
+        rows = self._execute("SELECT data FROM resumes WHERE id = ?", (resume_id,))
+        return ResumeMetadata(**json.loads(rows[0][0])) if rows else None
+
+    def save_analysis_result(self, analysis: AnalysisResult) -> str:
+        """Save analysis result"""
+        self._execute(
+            "INSERT OR REPLACE INTO analyses (id, resume_id, overall_score, analysis_date, data) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (analysis.id, analysis.resume_id, analysis.overall_score,
+             analysis.analysis_date.isoformat(), _dumps(analysis.dict()))
+        )
+        self.term_index.set_score(analysis.resume_id, analysis.overall_score, analysis.analysis_date.isoformat())
+        return analysis.id
+
+    def get_analysis_result(self, analysis_id: str) -> Optional[AnalysisResult]:
+        """Get analysis result by ID"""
+        rows = self._execute("SELECT data FROM analyses WHERE id = ?", (analysis_id,))
+        return AnalysisResult(**json.loads(rows[0][0])) if rows else None
+
+    def get_analyses_for_resume(self, resume_id: str) -> List[AnalysisResult]:
+        """Get all analysis results for a resume"""
+        rows = self._execute(
+            "SELECT data FROM analyses WHERE resume_id = ? ORDER BY analysis_date",
+            (resume_id,)
+        )
+        return [AnalysisResult(**json.loads(row[0])) for row in rows]
+
+    def get_latest_analysis(self, resume_id: str) -> Optional[AnalysisResult]:
+        """Get the most recent analysis result for a resume"""
+        rows = self._execute(
+            "SELECT data FROM analyses WHERE resume_id = ? ORDER BY analysis_date DESC LIMIT 1",
+            (resume_id,)
+        )
+        return AnalysisResult(**json.loads(rows[0][0])) if rows else None
+
+    def rebuild_analysis_index(self) -> int:
+        """Analyses are indexed by SQLite itself; nothing to rebuild"""
+        rows = self._execute("SELECT COUNT(*) FROM analyses")
+        return rows[0][0]
+
+    def find_resumes_by_hash(self, content_hash: str) -> List[str]:
+        """Get IDs of resumes whose uploaded bytes have this hash"""
+        rows = self._execute(
+            "SELECT id FROM resumes WHERE json_extract(data, '$.content_hash') = ?",
+            (content_hash,)
+        )
+        return [row[0] for row in rows]
+
+    def get_all_resumes(self) -> List[ResumeMetadata]:
+        """Get all resume metadata"""
+        rows = self._execute("SELECT data FROM resumes ORDER BY upload_date DESC")
+        return [ResumeMetadata(**json.loads(row[0])) for row in rows]
+
+    def delete_resume(self, resume_id: str) -> bool:
+        """Delete resume and associated records and files"""
+        try:
+            metadata = self.get_resume_metadata(resume_id)
+            with self._blob_lock:
+                with self._lock:
+                    conn = self._connection()
+                    with conn:
+                        conn.execute("DELETE FROM resumes WHERE id = ?", (resume_id,))
+                        conn.execute("DELETE FROM parsed_content WHERE resume_id = ?", (resume_id,))
+                        conn.execute("DELETE FROM analyses WHERE resume_id = ?", (resume_id,))
+                # Delete uploaded file unless another resume shares the blob
+                if metadata:
+                    self._release_upload(metadata)
+            self.term_index.remove(resume_id)
+            self.bm25_index.remove(resume_id)
+            self.minhash_index.remove(resume_id)
+
+            return True
+        except Exception as e:
+            print(f"Error deleting resume {resume_id}: {e}")
+            return False
+
+    def save_parsed_content(self, resume_id: str, content: Dict[str, Any]) -> str:
+        """Save parsed resume content"""
+        self._execute(
+            "INSERT OR REPLACE INTO parsed_content (resume_id, data) VALUES (?, ?)",
+            (resume_id, _dumps(content))
+        )
+        self.term_index.add(resume_id, document_terms(content))
+        self.bm25_index.add(resume_id, term_frequencies(content.get("extracted_text") or ""))
+        self.minhash_index.add(
+            resume_id, minhash_signature(content.get("extracted_text") or "", settings.minhash_permutations)
+        )
+        return resume_id
+
+    def _iter_parsed_content(self) -> Iterable[Tuple[str, Dict[str, Any]]]:
+        for resume_id, data in self._execute("SELECT resume_id, data FROM parsed_content"):
+            yield resume_id, json.loads(data)
+
+    def get_parsed_content(self, resume_id: str) -> Optional[Dict[str, Any]]:
+        """Get parsed resume content"""
+        rows = self._execute("SELECT data FROM parsed_content WHERE resume_id = ?", (resume_id,))
+        return json.loads(rows[0][0]) if rows else None
+
+    def save_batch_result(self, batch_result: BatchResult) -> str:
+        """Save batch processing result"""
+        self._execute(
+            "INSERT OR REPLACE INTO batches (id, created_date, status, data) VALUES (?, ?, ?, ?)",
+            (batch_result.id, batch_result.created_date.isoformat(), batch_result.status,
+             _dumps(batch_result.dict()))
+        )
+        return batch_result.id
+
+    def get_batch_result(self, batch_id: str) -> Optional[BatchResult]:
+        """Get batch processing result by ID"""
+        rows = self._execute("SELECT data FROM batches WHERE id = ?", (batch_id,))
+        return BatchResult(**json.loads(rows[0][0])) if rows else None
+
+    def save_ranked_batch_result(self, ranked_result: RankedBatchResult,
+                                 summary: Optional[Dict[str, Any]] = None) -> str:
+        """Save ranked batch result with its summary, index its candidates and write it through to the cache"""
+        data = _dumps(ranked_result.dict())
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO ranked_batches (batch_id, created_date, data) VALUES (?, ?, ?)",
+                    (ranked_result.batch_id, ranked_result.created_date.isoformat(), data)
+                )
+                conn.execute("DELETE FROM ranked_candidates WHERE batch_id = ?", (ranked_result.batch_id,))
+                conn.executemany(
+                    "INSERT OR REPLACE INTO ranked_candidates (batch_id, resume_id, rank, score) VALUES (?, ?, ?, ?)",
+                    [(ranked_result.batch_id, c.resume_id, c.rank, c.score) for c in ranked_result.ranked_candidates]
+                )
+                if summary is not None:
+                    self._write_summary(conn, ranked_result.batch_id, summary)
+                else:
+                    conn.execute("DELETE FROM batch_stats WHERE batch_id = ?", (ranked_result.batch_id,))
+                    conn.execute("DELETE FROM batch_leaders WHERE batch_id = ?", (ranked_result.batch_id,))
+        # Only this process writes the database, so write-through keeps the cache current
+        self.ranked_cache.put(ranked_result.batch_id, None, ranked_result, len(data))
+        return ranked_result.batch_id
+
+    def get_ranked_batch_result(self, batch_id: str) -> Optional[RankedBatchResult]:
+        """Get ranked batch result by ID"""
+        cached = self.ranked_cache.get(batch_id, None)
+        if cached is not None:
+            return cached
+        
+        rows = self._execute("SELECT data FROM ranked_batches WHERE batch_id = ?", (batch_id,))
+        if not rows:
+            return None
+        ranked_result = RankedBatchResult(**json.loads(rows[0][0]))
+        self.ranked_cache.put(batch_id, None, ranked_result, len(rows[0][0]))
+        return ranked_result
+
+    def save_batch_summary(self, batch_id: str, summary: Dict[str, Any]):
+        """Store the summary of a batch's ranked result"""
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                self._write_summary(conn, batch_id, summary)
+
+    def get_batch_summaries(self, batch_ids: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """Stored summaries of ranked batches (all by default) by batch ID, without loading candidates"""
+        query = "SELECT s.batch_id, s.data, l.data FROM batch_stats s JOIN batch_leaders l ON l.batch_id = s.batch_id"
+        if batch_ids is None:
+            rows = self._execute(query)
+        else:
+            batch_ids = list(batch_ids)
+            if not batch_ids:
+                return {}
+            rows = self._execute(f"{query} WHERE s.batch_id IN ({', '.join('?' * len(batch_ids))})", tuple(batch_ids))
+        return {
+            batch_id: {"stats": json.loads(stats), "leaders": json.loads(leaders)}
+            for batch_id, stats, leaders in rows
+        }
+
+    def get_unsummarized_batch_ids(self) -> List[str]:
+        """IDs of ranked batches without a stored summary, e.g. saved before summaries existed"""
+        rows = self._execute(
+            "SELECT r.batch_id FROM ranked_batches r "
+            "LEFT JOIN batch_stats s ON s.batch_id = r.batch_id "
+            "LEFT JOIN batch_leaders l ON l.batch_id = r.batch_id "
+            "WHERE s.batch_id IS NULL OR l.batch_id IS NULL"
+        )
+        return [row[0] for row in rows]
+
+    @staticmethod
+    def _write_summary(conn: sqlite3.Connection, batch_id: str, summary: Dict[str, Any]):
+        conn.execute(
+            "INSERT OR REPLACE INTO batch_stats (batch_id, data) VALUES (?, ?)", (batch_id, _dumps(summary["stats"]))
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO batch_leaders (batch_id, data) VALUES (?, ?)", (batch_id, _dumps(summary["leaders"]))
+        )
+
+    def save_ranking_view(self, ranked_result: RankedBatchResult) -> str:
+        """Save a re-scored ranking of a batch under its view name"""
+        self._execute(
+            "INSERT OR REPLACE INTO ranking_views (batch_id, name, created_date, data) VALUES (?, ?, ?, ?)",
+            (ranked_result.batch_id, ranked_result.view_name, ranked_result.created_date.isoformat(),
+             _dumps(ranked_result.dict()))
+        )
+        return ranked_result.view_name
+
+    def get_ranking_view(self, batch_id: str, view_name: str) -> Optional[RankedBatchResult]:
+        """Get a named ranking view of a batch"""
+        rows = self._execute(
+            "SELECT data FROM ranking_views WHERE batch_id = ? AND name = ?", (batch_id, view_name)
+        )
+        return RankedBatchResult(**json.loads(rows[0][0])) if rows else None
+
+    def get_ranking_views(self, batch_id: str) -> List[RankedBatchResult]:
+        """Get all named ranking views of a batch, newest first"""
+        rows = self._execute(
+            "SELECT data FROM ranking_views WHERE batch_id = ? ORDER BY created_date DESC", (batch_id,)
+        )
+        return [RankedBatchResult(**json.loads(row[0])) for row in rows]
+
+    def get_all_batch_results(self) -> List[BatchResult]:
+        """Get all batch processing results"""
+        rows = self._execute("SELECT data FROM batches ORDER BY created_date DESC")
+        return [BatchResult(**json.loads(row[0])) for row in rows]
+
+    def delete_batch_result(self, batch_id: str) -> bool:
+        """Delete batch result and associated records and files"""
+        try:
+            with self._lock:
+                conn = self._connection()
+                with conn:
+                    conn.execute("DELETE FROM batches WHERE id = ?", (batch_id,))
+                    conn.execute("DELETE FROM ranked_batches WHERE batch_id = ?", (batch_id,))
+                    conn.execute("DELETE FROM ranked_candidates WHERE batch_id = ?", (batch_id,))
+                    conn.execute("DELETE FROM batch_stats WHERE batch_id = ?", (batch_id,))
+                    conn.execute("DELETE FROM batch_leaders WHERE batch_id = ?", (batch_id,))
+                    conn.execute("DELETE FROM ranking_views WHERE batch_id = ?", (batch_id,))
+            self.ranked_cache.invalidate(batch_id)
+
+            # Delete CSV file
+            csv_file = self.metadata_dir / f"ranked_{batch_id}.csv"
+            if csv_file.exists():
+                csv_file.unlink()
+
+            return True
+        except Exception as e:
+            print(f"Error deleting batch {batch_id}: {e}")
+            return False
+
+def migrate_from_json(source: FileManager, target: SQLiteFileManager) -> Dict[str, int]:
+    """Copy every record from the JSON file tree into SQLite; safe to re-run"""
+    counts = {"resumes": 0, "parsed_content": 0, "analyses": 0, "batches": 0, "ranked_batches": 0, "ranking_views": 0}
+
+    for metadata_file in source.metadata_dir.glob("*.json"):
+        try:
+            with open(metadata_file, 'r') as f:
+                data = json.load(f)
+            if metadata_file.name.startswith("batch_"):
+                target.save_batch_result(BatchResult(**data))
+                counts["batches"] += 1
+            elif metadata_file.name.startswith("ranked_"):
+                ranked_result = RankedBatchResult(**data)
+                target.save_ranked_batch_result(
+                    ranked_result, source.get_batch_summaries([ranked_result.batch_id]).get(ranked_result.batch_id)
+                )
+                counts["ranked_batches"] += 1
+            elif metadata_file.name.startswith("view_"):
+                target.save_ranking_view(RankedBatchResult(**data))
+                counts["ranking_views"] += 1
+            else:
+                target.save_resume_metadata(ResumeMetadata(**data))
+                counts["resumes"] += 1
+        except Exception as e:
+            print(f"Error migrating {metadata_file}: {e}")
+
+    for analysis_file in source.analyses_dir.glob("*.json"):
+        try:
+            with open(analysis_file, 'r') as f:
+                target.save_analysis_result(AnalysisResult(**json.load(f)))
+            counts["analyses"] += 1
+        except Exception as e:
+            print(f"Error migrating {analysis_file}: {e}")
+
+    for parsed_file in source.parsed_dir.glob("*.json"):
+        try:
+            with open(parsed_file, 'r') as f:
+                target.save_parsed_content(parsed_file.stem, json.load(f))
+            counts["parsed_content"] += 1
+        except Exception as e:
+            print(f"Error migrating {parsed_file}: {e}")
+
+    return counts
+
+if __name__ == "__main__":
+    # One-shot migration: python -m app.storage.sqlite_manager migrate
+    if sys.argv[1:] != ["migrate"]:
+        print("Usage: python -m app.storage.sqlite_manager migrate")
+        sys.exit(1)
+    counts = migrate_from_json(FileManager(), SQLiteFileManager(settings.sqlite_path))
+    print(f"Migrated into {settings.sqlite_path}: " + ", ".join(f"{n} {name}" for name, n in counts.items()))
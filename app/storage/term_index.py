@@ -0,0 +1,106 @@
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+from app.storage.log_index import LogIndex, Operation
+
+def document_terms(parsed_content: Dict[str, Any]) -> List[str]:
+    """Normalized skills, degrees and keywords of parsed resume content"""
+    parsed_data = parsed_content.get("parsed_data") or {}
+    terms = []
+    for field in ("skills", "degrees", "keywords"):
+        terms.extend(normalize_term(term) for term in parsed_data.get(field) or [])
+    return sorted(set(term for term in terms if term))
+
+def normalize_term(term: str) -> str:
+    return " ".join(term.lower().split())
+
+class TermIndex(LogIndex):
+    """
+    Inverted index from normalized skill, degree and keyword terms to resume
+    IDs, with each resume's latest score for filtering. Held in memory as
+    posting sets and persisted as a log of add/remove/score operations.
+    """
+
+    def __init__(self, path: Path, rebuild: Optional[Callable[[], Iterable[Operation]]] = None):
+        super().__init__(path, rebuild)
+        self._docs: Dict[str, List[str]] = {}
+        self._postings: Dict[str, Set[str]] = {}
+        self._scores: Dict[str, Tuple[float, str]] = {}
+
+    def add(self, resume_id: str, terms: List[str]):
+        """Index a resume's terms, replacing any earlier terms for it"""
+        with self.lock:
+            self._load()
+            self._record(["add", resume_id, terms])
+
+    def remove(self, resume_id: str):
+        with self.lock:
+            self._load()
+            if resume_id in self._docs or resume_id in self._scores:
+                self._record(["remove", resume_id])
+
+    def set_score(self, resume_id: str, score: float, analysis_date: str):
+        """Record an analysis score unless a later analysis is already recorded"""
+        with self.lock:
+            self._load()
+            current = self._scores.get(resume_id)
+            if current is None or analysis_date >= current[1]:
+                self._record(["score", resume_id, score, analysis_date])
+
+    def postings(self, term: str) -> Set[str]:
+        """Resume IDs indexed under a term; do not mutate"""
+        with self.lock:
+            self._load()
+            return self._postings.get(term, set())
+
+    def resume_ids(self) -> Set[str]:
+        """Every indexed resume ID"""
+        with self.lock:
+            self._load()
+            return set(self._docs)
+
+    def scores(self, resume_ids: Iterable[str], min_score: Optional[float] = None) -> List[Tuple[str, Optional[float]]]:
+        """
+        (resume ID, latest score) pairs, with None for resumes not yet analyzed.
+        min_score drops lower and unscored resumes in the same pass.
+        """
+        with self.lock:
+            self._load()
+            scores = self._scores
+            if min_score is None:
+                return [(resume_id, scores[resume_id][0] if resume_id in scores else None) for resume_id in resume_ids]
+            results = []
+            for resume_id in resume_ids:
+                entry = scores.get(resume_id)
+                if entry is not None and entry[0] >= min_score:
+                    results.append((resume_id, entry[0]))
+            return results
+
+    def _apply(self, operation: Operation):
+        op, resume_id = operation[0], operation[1]
+        if op in ("add", "remove"):
+            for term in self._docs.pop(resume_id, []):
+                ids = self._postings.get(term)
+                if ids is not None:
+                    ids.discard(resume_id)
+                    if not ids:
+                        del self._postings[term]
+        if op == "add":
+            self._docs[resume_id] = list(operation[2])
+            for term in operation[2]:
+                self._postings.setdefault(term, set()).add(resume_id)
+        elif op == "remove":
+            self._scores.pop(resume_id, None)
+        elif op == "score":
+            self._scores[resume_id] = (operation[2], operation[3])
+
+    def _reset(self):
+        self._docs, self._postings, self._scores = {}, {}, {}
+
+    def _snapshot(self) -> Iterable[Operation]:
+        for resume_id, terms in self._docs.items():
+            yield ["add", resume_id, terms]
+        for resume_id, (score, analysis_date) in self._scores.items():
+            yield ["score", resume_id, score, analysis_date]
+
+    def _live_count(self) -> int:
+        return len(self._docs) + len(self._scores)
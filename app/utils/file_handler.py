@@ -1,21 +1,51 @@
 import aiofiles
+import hashlib
 import os
 from pathlib import Path
-from fastapi import UploadFile
+from typing import NamedTuple
+from fastapi import HTTPException, UploadFile
 from app.core.config import settings
 
-async def save_uploaded_file(file: UploadFile, filename: str) -> str:
-    """Save uploaded file to disk"""
+class SavedUpload(NamedTuple):
+    file_path: str
+    sha256: str
+    size: int
+
+async def save_uploaded_file(file: UploadFile, filename: str) -> SavedUpload:
+    """
+    Stream uploaded file to disk in fixed-size chunks.
+    The content is hashed and size-checked while copying, written to a temporary
+    file and renamed into place only once complete, so memory use per upload is
+    constant and a rejected upload leaves nothing behind.
+    """
     file_path = Path(settings.upload_dir) / filename
+    tmp_path = file_path.with_name(f".{filename}.part")
+    digest = hashlib.sha256()
+    size = 0
     
     try:
-        async with aiofiles.open(file_path, 'wb') as f:
-            content = await file.read()
-            await f.write(content)
+        async with aiofiles.open(tmp_path, 'wb') as f:
+            while True:
+                chunk = await file.read(settings.upload_chunk_size)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > settings.max_file_size:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"File too large. Maximum size is {settings.max_file_size / 1024 / 1024:.1f}MB"
+                    )
+                digest.update(chunk)
+                await f.write(chunk)
         
-        return str(file_path)
+        os.replace(tmp_path, file_path)
+        return SavedUpload(str(file_path), digest.hexdigest(), size)
     
+    except HTTPException:
+        delete_file(str(tmp_path))
+        raise
     except Exception as e:
+        delete_file(str(tmp_path))
         raise Exception(f"Error saving file: {str(e)}")
 
 def get_file_size(file_path: str) -> int:
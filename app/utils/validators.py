@@ -4,8 +4,8 @@ from app.core.config import settings
 def validate_file(file: UploadFile) -> bool:
     """Validate uploaded file"""
     
-    # Check file size
-    if file.size > settings.max_file_size:
+    # Check declared file size; the actual size is enforced while streaming to disk
+    if file.size is not None and file.size > settings.max_file_size:
         raise HTTPException(
             status_code=413,
             detail=f"File too large. Maximum size is {settings.max_file_size / 1024 / 1024:.1f}MB"
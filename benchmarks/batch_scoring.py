@@ -0,0 +1,77 @@
+"""
+Benchmark ScoringEngine.score_batch against scoring resumes one at a time.
+
+Usage:
+    python -m benchmarks.batch_scoring [--count 100000]
+
+Scores synthetic features (with a mix of missing and present AI scores) both
+ways, checks the results agree and reports the time taken by each path, with
+and without building highlights.
+"""
+import argparse
+import random
+import time
+
+from app.services.resume_features import DEGREE_LEVELS, ResumeFeatures
+from app.services.scoring_engine import scoring_engine
+from app.storage.data_models import AnalysisResult
+
+SKILLS = ["Python", "Java", "Go", "React", "Node.js", "SQL", "AWS", "Docker", "Kubernetes", "Terraform", "Rust", "Scala"]
+
+def generate(count: int, seed: int = 0):
+    rng = random.Random(seed)
+    features, analyses = [], []
+    for _ in range(count):
+        features.append(ResumeFeatures(
+            skills=rng.sample(SKILLS, rng.randint(0, len(SKILLS))),
+            has_contact_info=rng.random() < 0.9,
+            has_email=rng.random() < 0.85,
+            has_phone=rng.random() < 0.7,
+            has_linkedin=rng.random() < 0.5,
+            experience_count=rng.randint(0, 12),
+            education_count=rng.randint(0, 4),
+            years_of_experience=rng.choice([None, rng.randint(0, 25)]),
+            degree=rng.choice((None,) + DEGREE_LEVELS),
+            text_length=rng.randint(100, 8000),
+            line_count=rng.randint(5, 200),
+            bullet_count=rng.randint(0, 40)
+        ))
+        category_scores = {
+            category: rng.choice([0.0, rng.uniform(20, 100)])
+            for category in ("technical_skills", "experience", "education", "presentation")
+        }
+        analyses.append(rng.choice([None, AnalysisResult(resume_id="", ai_provider="gemini", overall_score=0.0,
+                                                         category_scores=category_scores, feedback="", suggestions=[])]))
+    return features, analyses
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=100000, help="Resumes to score")
+    args = parser.parse_args()
+
+    features, analyses = generate(args.count)
+
+    start = time.perf_counter()
+    single = [scoring_engine.score_resume(f, a) for f, a in zip(features, analyses)]
+    single_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = scoring_engine.score_batch(features, analyses)
+    batch_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scoring_engine.score_batch(features, analyses, include_highlights=False)
+    scores_only_time = time.perf_counter() - start
+
+    mismatches = sum(
+        1 for one, many in zip(single, batch)
+        if one["overall_score"] != many["overall_score"] or one["category_scores"] != many["category_scores"]
+    )
+    print(f"{args.count} resumes")
+    print(f"score_resume loop  {single_time:8.3f}s")
+    print(f"score_batch        {batch_time:8.3f}s  ({single_time / batch_time:.1f}x)")
+    print(f"  scores only      {scores_only_time:8.3f}s  ({single_time / scores_only_time:.1f}x)")
+    print(f"mismatched results {mismatches}")
+
+if __name__ == "__main__":
+    main()
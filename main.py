@@ -2,9 +2,12 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse, HTMLResponse, RedirectResponse
-from app.api import routes_upload, routes_analysis, routes_resume, routes_batch
+from app.api import routes_upload, routes_analysis, routes_resume, routes_batch, routes_match
 from app.core.config import settings
 from app.storage.file_manager import ensure_directories
+from app.services.batch_processor import batch_processor
+from app.services.ai_providers import shutdown_providers
+from app.services.resume_parser import shutdown_parser_pool
 import uvicorn
 import logging
 import os
@@ -63,17 +66,25 @@ app.include_router(routes_upload.router, prefix="/api/v1", tags=["upload"])
 app.include_router(routes_analysis.router, prefix="/api/v1", tags=["analysis"])
 app.include_router(routes_resume.router, prefix="/api/v1", tags=["resume"])
 app.include_router(routes_batch.router, prefix="/api/v1", tags=["batch"])
+app.include_router(routes_match.router, prefix="/api/v1", tags=["match"])
 
 @app.on_event("startup")
 async def startup_event():
     try:
         ensure_directories()
+        await batch_processor.start()
         logger.info("SmartRecruit API started successfully")
         logger.info(f"Server running on http://localhost:8000")
     except Exception as e:
         logger.error(f"Failed to start SmartRecruit API: {e}")
         raise e
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    await batch_processor.stop()
+    shutdown_providers()
+    shutdown_parser_pool()
+
 @app.get("/health")
 async def health_check():
     return {"status": "healthy", "service": "SmartRecruit API"}
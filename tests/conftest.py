@@ -0,0 +1,31 @@
+import pytest
+
+from app.core.config import settings
+from app.storage.file_manager import FileManager, ensure_directories
+
+STORAGE_DIRS = (
+    "upload_dir", "blob_dir", "parsed_dir", "data_dir", "resumes_dir",
+    "analyses_dir", "metadata_dir", "index_dir", "analysis_cache_dir"
+)
+
+@pytest.fixture
+def storage_settings(tmp_path, monkeypatch):
+    """Point every storage path at a scratch tree"""
+    for name in STORAGE_DIRS:
+        monkeypatch.setattr(settings, name, str(tmp_path / name))
+    monkeypatch.setattr(settings, "sqlite_path", str(tmp_path / "smartrecruit.db"))
+    ensure_directories()
+    return settings
+
+@pytest.fixture
+def json_storage(storage_settings):
+    """JSON file storage backend on a scratch tree"""
+    return FileManager()
+
+@pytest.fixture(params=["json", "sqlite"])
+def storage(request, storage_settings):
+    """Each storage backend on a scratch tree"""
+    if request.param == "sqlite":
+        from app.storage.sqlite_manager import SQLiteFileManager
+        return SQLiteFileManager(storage_settings.sqlite_path)
+    return FileManager()
@@ -0,0 +1,56 @@
+import asyncio
+import time
+
+import pytest
+
+from app.services.ai_providers import AIProvider
+
+class SlowProvider(AIProvider):
+    """Provider whose blocking call takes a fixed time"""
+    name = "slow"
+
+    def __init__(self, max_concurrency: int, timeout: float, delay: float):
+        super().__init__("test-model", max_concurrency, timeout)
+        self.delay = delay
+
+    def _generate(self, prompt: str) -> str:
+        time.sleep(self.delay)
+        return prompt.upper()
+
+def test_generate_returns_response_text():
+    provider = SlowProvider(max_concurrency=2, timeout=1.0, delay=0.01)
+    try:
+        assert asyncio.run(provider.generate("hello")) == "HELLO"
+    finally:
+        provider.shutdown()
+
+def test_timed_out_calls_keep_their_slot_until_they_return():
+    provider = SlowProvider(max_concurrency=2, timeout=0.05, delay=0.3)
+
+    async def run():
+        results = await asyncio.gather(*(provider.generate(str(i)) for i in range(2)), return_exceptions=True)
+        held = provider._slots.locked()
+        await asyncio.sleep(0.4)
+        return results, held, provider._slots.locked()
+
+    try:
+        results, held, still_held = asyncio.run(run())
+    finally:
+        provider.shutdown()
+    assert all(isinstance(result, asyncio.TimeoutError) for result in results)
+    assert held
+    assert not still_held
+
+def test_slot_is_released_after_a_timed_out_call_returns():
+    provider = SlowProvider(max_concurrency=1, timeout=0.05, delay=0.1)
+
+    async def run():
+        with pytest.raises(asyncio.TimeoutError):
+            await provider.generate("slow")
+        provider.delay = 0.0
+        return await asyncio.wait_for(provider.generate("next"), timeout=1.0)
+
+    try:
+        assert asyncio.run(run()) == "NEXT"
+    finally:
+        provider.shutdown()
@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+
+import app.services.batch_processor as batch_processor_module
+import app.services.batch_summaries as batch_summaries_module
+from app.services.batch_processor import BatchProcessor
+from app.storage.data_models import AnalysisResult, BatchResult
+from tests.test_file_manager import _upload
+
+@pytest.fixture
+def processor(json_storage, monkeypatch):
+    """A batch processor on scratch storage, with parsing and AI analysis faked and counted"""
+    calls = {"parse": [], "analyze": []}
+
+    async def parse_resume(file_path):
+        calls["parse"].append(file_path)
+        await asyncio.sleep(0.05)
+        with open(file_path, "rb") as f:
+            text = f.read().decode()
+        return {"extracted_text": text, "parsed_data": {"skills": ["Python"]}}
+
+    async def analyze_resume(resume_text, force=False):
+        calls["analyze"].append(resume_text)
+        await asyncio.sleep(0.05)
+        return AnalysisResult(
+            resume_id="", ai_provider="test", overall_score=float(len(resume_text)),
+            category_scores={}, feedback="", suggestions=[]
+        )
+
+    monkeypatch.setattr(batch_processor_module, "file_manager", json_storage)
+    monkeypatch.setattr(batch_summaries_module, "file_manager", json_storage)
+    monkeypatch.setattr(batch_processor_module, "parse_resume", parse_resume)
+    monkeypatch.setattr(batch_processor_module, "analyze_resume", analyze_resume)
+    processor = BatchProcessor()
+    processor.calls = calls
+    return processor
+
+def _batch(storage, contents):
+    resumes = [_upload(storage, content) for content in contents]
+    batch = BatchResult(
+        total_files=len(resumes), processed_files=0, failed_files=0,
+        resume_ids=[metadata.id for metadata in resumes]
+    )
+    storage.save_batch_result(batch)
+    return batch, resumes
+
+def test_identical_resumes_in_a_batch_are_processed_once(processor, json_storage):
+    batch, resumes = _batch(json_storage, [b"python developer", b"data engineer", b"python developer"])
+    asyncio.run(processor.process_batch(batch.id))
+
+    assert len(processor.calls["parse"]) == 2
+    assert sorted(processor.calls["analyze"]) == ["data engineer", "python developer"]
+
+    batch = json_storage.get_batch_result(batch.id)
+    assert batch.status == "completed"
+    assert batch.processed_files == 3
+    first, duplicate = json_storage.get_resume_metadata(resumes[0].id), json_storage.get_resume_metadata(resumes[2].id)
+    assert first.is_analyzed and duplicate.is_analyzed
+    assert json_storage.get_latest_analysis(duplicate.id).overall_score == len("python developer")
+    assert json_storage.get_ranked_batch_result(batch.id).total_candidates == 3
+    assert processor._in_flight == {}
+
+def test_duplicate_is_processed_when_its_original_fails(processor, json_storage, monkeypatch):
+    failing = {"left": 1}
+    parse_resume = batch_processor_module.parse_resume
+
+    async def flaky_parse(file_path):
+        if failing["left"]:
+            failing["left"] -= 1
+            await asyncio.sleep(0.05)
+            raise ValueError("unreadable")
+        return await parse_resume(file_path)
+
+    monkeypatch.setattr(batch_processor_module, "parse_resume", flaky_parse)
+    batch, _ = _batch(json_storage, [b"python developer", b"python developer"])
+    asyncio.run(processor.process_batch(batch.id))
+
+    batch = json_storage.get_batch_result(batch.id)
+    assert batch.processed_files == 1
+    assert batch.failed_files == 1
+    assert processor.calls["analyze"] == ["python developer"]
@@ -0,0 +1,75 @@
+import hashlib
+import threading
+from pathlib import Path
+
+from app.core.config import settings
+from app.storage.data_models import ResumeMetadata
+
+def _upload(storage, content: bytes, name: str = "resume.pdf") -> ResumeMetadata:
+    """Save bytes the way the upload routes do and store them as a blob"""
+    metadata = ResumeMetadata(
+        filename=name, original_filename=name, file_path="", file_size=len(content),
+        file_type="pdf", content_hash=hashlib.sha256(content).hexdigest()
+    )
+    upload_path = Path(settings.upload_dir) / f"{metadata.id}.pdf"
+    upload_path.write_bytes(content)
+    metadata.file_path = str(upload_path)
+    storage.store_blob(metadata)
+    return metadata
+
+def test_identical_uploads_share_one_blob(storage):
+    first = _upload(storage, b"same bytes")
+    second = _upload(storage, b"same bytes")
+    other = _upload(storage, b"other bytes")
+
+    assert first.file_path == second.file_path != other.file_path
+    assert Path(first.file_path).read_bytes() == b"same bytes"
+    assert not list(Path(settings.upload_dir).iterdir())
+    assert sorted(storage.find_resumes_by_hash(first.content_hash)) == sorted([first.id, second.id])
+
+def test_blob_is_deleted_with_its_last_reference(storage):
+    first = _upload(storage, b"same bytes")
+    second = _upload(storage, b"same bytes")
+
+    assert storage.delete_resume(first.id)
+    assert Path(second.file_path).exists()
+    assert storage.find_resumes_by_hash(first.content_hash) == [second.id]
+
+    assert storage.delete_resume(second.id)
+    assert not Path(second.file_path).exists()
+    assert storage.find_resumes_by_hash(first.content_hash) == []
+
+def test_blob_survives_delete_racing_new_upload(storage):
+    # Each round deletes the only reference while an identical upload arrives
+    errors = []
+    for _ in range(30):
+        existing = _upload(storage, b"contended bytes")
+        uploaded = []
+        threads = [
+            threading.Thread(target=lambda: storage.delete_resume(existing.id)),
+            threading.Thread(target=lambda: uploaded.append(_upload(storage, b"contended bytes")))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if not Path(uploaded[0].file_path).exists():
+            errors.append(uploaded[0].id)
+        storage.delete_resume(uploaded[0].id)
+    assert errors == []
+
+def test_reuse_duplicate_results_copies_parsed_content_and_analysis(storage):
+    from app.storage.data_models import AnalysisResult
+
+    first = _upload(storage, b"same bytes")
+    storage.save_parsed_content(first.id, {"extracted_text": "python developer", "parsed_data": {"skills": ["Python"]}})
+    storage.save_analysis_result(AnalysisResult(
+        resume_id=first.id, ai_provider="test", overall_score=71.0, category_scores={}, feedback="ok", suggestions=[]
+    ))
+
+    second = _upload(storage, b"same bytes")
+    assert storage.reuse_duplicate_results(second)
+    assert second.is_parsed and second.is_analyzed
+    assert storage.get_parsed_content(second.id)["extracted_text"] == "python developer"
+    assert storage.get_latest_analysis(second.id).overall_score == 71.0
+    assert not storage.reuse_duplicate_results(_upload(storage, b"unseen bytes"))
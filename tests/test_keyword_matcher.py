@@ -0,0 +1,30 @@
+from app.services.keyword_matcher import KeywordMatcher
+from app.services.resume_parser import segment_sections
+
+def _matcher():
+    return KeywordMatcher([
+        ("python", "skill", "Python", False),
+        ("c++", "skill", "C++", False),
+        ("ai", "skill", "AI", False),
+        ("experience", "section", "experience", False),
+        ("education", "section", "education", False),
+    ])
+
+def test_matches_are_case_insensitive_and_respect_word_boundaries():
+    text = "Python, C++ and AI; maintained pythonic code"
+    found = [(text[m.start:m.end], m.label) for m in _matcher().find_all(text)]
+    assert found == [("Python", "Python"), ("C++", "C++"), ("AI", "AI")]
+
+def test_offsets_index_the_original_text_when_lowercasing_changes_length():
+    # "İ".lower() is two code points, which used to shift every later offset
+    text = "İzmir İİİ — PYTHON and AI"
+    matches = _matcher().find_all(text)
+    assert [text[m.start:m.end] for m in matches] == ["PYTHON", "AI"]
+
+def test_sections_after_expanding_characters_keep_their_headings():
+    text = "Ayşe İnan\nİstanbul\nEXPERIENCE\nEngineer at X\nEDUCATION\nBSc\n"
+    sections = segment_sections(text)
+    assert [(s["type"], s["heading"]) for s in sections] == [
+        ("contact", ""), ("experience", "EXPERIENCE"), ("education", "EDUCATION")
+    ]
+    assert text[sections[1]["start"]:sections[1]["end"]].strip() == "Engineer at X"
@@ -0,0 +1,47 @@
+import multiprocessing
+
+from app.storage.term_index import TermIndex
+
+def _add_resumes(path, worker: int, count: int, start):
+    index = TermIndex(path)
+    start.wait()
+    # Re-adding supersedes earlier lines, so workers compact the log while others append
+    for round_number in range(6):
+        for number in range(count):
+            index.add(f"w{worker}-r{number}", ["python", f"worker {worker}", f"round {round_number}"])
+    for number in range(count):
+        index.set_score(f"w{worker}-r{number}", float(number), "2026-01-01T00:00:00")
+
+def test_concurrent_processes_keep_every_update(tmp_path):
+    path = tmp_path / "resume_terms.log"
+    start = multiprocessing.Barrier(4)
+    workers = [multiprocessing.Process(target=_add_resumes, args=(path, worker, 400, start)) for worker in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    assert all(worker.exitcode == 0 for worker in workers)
+
+    index = TermIndex(path)
+    assert len(index.postings("python")) == 1600
+    assert all(len(index.postings(f"worker {worker}")) == 400 for worker in range(4))
+    assert len(index.postings("round 5")) == 1600
+    assert len(index.scores(index.resume_ids(), min_score=0)) == 1600
+
+def test_reader_follows_appends_and_compaction_by_another_writer(tmp_path):
+    path = tmp_path / "resume_terms.log"
+    writer, reader = TermIndex(path), TermIndex(path)
+    writer.add("a", ["python"])
+    assert reader.postings("python") == {"a"}
+
+    writer.add("b", ["python"])
+    writer.remove("a")
+    assert reader.postings("python") == {"b"}
+
+    # Enough superseded lines to make the writer compact its log
+    for number in range(1200):
+        writer.add("b", ["python", f"term {number % 2}"])
+    assert path.stat().st_size < 100 * 1024
+    assert reader.postings("python") == {"b"}
+    assert reader.postings("term 1") == {"b"}
+    assert reader.postings("term 0") == set()
@@ -0,0 +1,44 @@
+from app.storage.minhash_index import MinHashIndex, minhash_signature
+
+BASE = (
+    "Senior backend engineer with eight years of experience building distributed systems in Python and Go, "
+    "designing REST APIs, running PostgreSQL and Kafka in production and mentoring junior developers"
+)
+OTHER = (
+    "Graphic designer focused on brand identity, print layouts and illustration, "
+    "skilled in Figma, Photoshop and InDesign with a portfolio of packaging work"
+)
+
+def _index(tmp_path, texts):
+    index = MinHashIndex(tmp_path / "minhash.log", num_perm=128, bands=32)
+    for resume_id, text in texts.items():
+        index.add(resume_id, minhash_signature(text, 128))
+    return index
+
+def test_clusters_group_near_duplicates(tmp_path):
+    index = _index(tmp_path, {
+        "a": BASE,
+        "b": BASE + " and on-call rotations",
+        "c": BASE,
+        "d": OTHER,
+    })
+    clusters = index.clusters(0.7)
+    assert len(clusters) == 1
+    members, weakest = clusters[0]
+    assert members == ["a", "b", "c"]
+    assert 0.7 <= weakest < 1.0
+
+def test_neighbours_and_removal(tmp_path):
+    index = _index(tmp_path, {"a": BASE, "b": BASE + " and on-call rotations", "d": OTHER})
+    assert [resume_id for resume_id, _ in index.neighbours("a", 0.7)] == ["b"]
+    assert index.neighbours("d", 0.7) == []
+
+    index.remove("b")
+    assert index.neighbours("a", 0.7) == []
+    assert index.clusters(0.7) == []
+
+def test_index_survives_reload(tmp_path):
+    _index(tmp_path, {"a": BASE, "c": BASE, "d": OTHER})
+    reloaded = MinHashIndex(tmp_path / "minhash.log", num_perm=128, bands=32)
+    assert len(reloaded) == 3
+    assert reloaded.clusters(0.9) == [(["a", "c"], 1.0)]
@@ -0,0 +1,64 @@
+import random
+
+from app.services.ranked_batch import RankedBatch
+from app.storage.data_models import AnalysisResult, ScoredResume
+
+CATEGORIES = ("completeness", "technical_skills", "experience", "education", "presentation")
+
+def _candidate(index: int, score: float) -> ScoredResume:
+    analysis = AnalysisResult(
+        resume_id=f"r{index}", ai_provider="test", overall_score=score,
+        category_scores={}, feedback="", suggestions=[]
+    )
+    return ScoredResume(
+        resume_id=f"r{index}", filename=f"r{index}.pdf", original_filename=f"r{index}.pdf", score=score,
+        category_scores={category: score for category in CATEGORIES}, highlights={}, rank=0, analysis=analysis
+    )
+
+def _full_sort(candidates):
+    """Reference ranking: score descending, ties in upload order"""
+    order = {candidate.resume_id: index for index, candidate in enumerate(candidates)}
+    return [c.resume_id for c in sorted(candidates, key=lambda c: (-c.score, order[c.resume_id]))]
+
+def test_insert_and_remove_match_full_sort():
+    rng = random.Random(1)
+    # Coarse scores so plenty of ties exercise the upload-order tie break
+    candidates = [_candidate(index, float(rng.randint(0, 20) * 5)) for index in range(300)]
+    order = {candidate.resume_id: index for index, candidate in enumerate(candidates)}
+
+    ranked = RankedBatch("batch")
+    for index in rng.sample(range(len(candidates)), len(candidates)):
+        ranked.insert(candidates[index], order[candidates[index].resume_id])
+    removed = set(rng.sample([candidate.resume_id for candidate in candidates], 100))
+    for resume_id in removed:
+        assert ranked.remove(resume_id).resume_id == resume_id
+
+    remaining = [candidate for candidate in candidates if candidate.resume_id not in removed]
+    result = ranked.to_result()
+    assert [c.resume_id for c in result.ranked_candidates] == _full_sort(remaining)
+    assert [c.rank for c in result.ranked_candidates] == list(range(1, len(remaining) + 1))
+
+    # Averages are updated incrementally, so they may differ from a rebuild in the last rounded digit
+    summary, rebuilt = result.summary_stats, RankedBatch.from_candidates("batch", remaining).summary_stats()
+    assert abs(summary.pop("average_score") - rebuilt.pop("average_score")) <= 0.01
+    averages, rebuilt_averages = summary.pop("category_averages"), rebuilt.pop("category_averages")
+    assert all(abs(averages[category] - rebuilt_averages[category]) <= 0.01 for category in CATEGORIES)
+    assert summary == rebuilt
+
+def test_insert_replaces_earlier_entry_for_resume():
+    ranked = RankedBatch.from_candidates("batch", [_candidate(index, float(index)) for index in range(5)])
+    assert ranked.insert(_candidate(0, 99.0)) == 1
+    assert len(ranked) == 5
+    assert ranked.rank_of("r0") == 1
+    assert ranked.remove("missing") is None
+
+def test_stats_state_rebuilt_after_removals():
+    candidates = [_candidate(index, float(index * 10)) for index in range(10)]
+    ranked = RankedBatch.from_candidates("batch", candidates)
+    ranked.remove("r9")
+    ranked.remove("r0")
+
+    state = ranked.stats_state()
+    assert state["overall"]["count"] == 8
+    assert state["overall"]["min"] == 10.0
+    assert state["overall"]["max"] == 80.0
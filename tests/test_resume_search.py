@@ -0,0 +1,37 @@
+import pytest
+
+from app.services.resume_search import parse_query
+
+def test_not_binds_tighter_than_and_and_and_tighter_than_or():
+    assert parse_query("alpha OR beta AND NOT gamma") == (
+        "or", [("term", "alpha"), ("and", [("term", "beta"), ("not", ("term", "gamma"))])]
+    )
+
+def test_adjacent_terms_are_anded():
+    assert parse_query("alpha beta NOT gamma") == parse_query("alpha AND beta AND NOT gamma")
+    assert parse_query("alpha beta") == ("and", [("term", "alpha"), ("term", "beta")])
+
+def test_parentheses_override_precedence():
+    assert parse_query("(alpha OR beta) gamma") == (
+        "and", [("or", [("term", "alpha"), ("term", "beta")]), ("term", "gamma")]
+    )
+    assert parse_query("NOT (alpha OR beta)") == ("not", ("or", [("term", "alpha"), ("term", "beta")]))
+
+def test_quoted_terms_and_lowercase_operators():
+    assert parse_query('"Alpha  Beta" or gamma') == ("or", [("term", "alpha beta"), ("term", "gamma")])
+
+@pytest.mark.parametrize("query", [
+    "",
+    "   ",
+    "(alpha OR beta",
+    "alpha OR",
+    "alpha AND",
+    "NOT",
+    "alpha )",
+    "OR alpha",
+    '""',
+    "()",
+])
+def test_malformed_queries_raise_value_error(query):
+    with pytest.raises(ValueError):
+        parse_query(query)
@@ -0,0 +1,78 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import app.api.routes_batch as routes_batch_module
+import app.services.batch_processor as batch_processor_module
+from app.services.ranked_batch import RankedBatch
+from main import app
+from tests.test_ranked_batch import _candidate
+
+@pytest.fixture
+def client(json_storage, monkeypatch):
+    monkeypatch.setattr(routes_batch_module, "file_manager", json_storage)
+    monkeypatch.setattr(batch_processor_module, "file_manager", json_storage)
+    return TestClient(app)
+
+@pytest.fixture
+def ranked(json_storage):
+    # Scores repeat so pages split ties
+    ranked = RankedBatch.from_candidates("batch", [_candidate(index, float(index // 3 * 10)) for index in range(30)])
+    json_storage.save_ranked_batch_result(ranked.to_result())
+    return ranked
+
+def _pages(client, **params):
+    ids, cursor, pages = [], None, 0
+    while True:
+        response = client.get("/api/v1/batch/batch/candidates", params={**params, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == 200
+        body = response.json()
+        ids.extend(candidate["resume_id"] for candidate in body["candidates"])
+        pages += 1
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return ids, pages
+
+def test_pages_cover_the_ranking_once(client, ranked):
+    ids, pages = _pages(client, limit=7)
+    assert ids == [candidate.resume_id for candidate in ranked.to_result().ranked_candidates]
+    assert pages == 5
+
+def test_pages_apply_score_filters(client, ranked):
+    ids, _ = _pages(client, limit=4, min_score=30, max_score=70)
+    expected = [c.resume_id for c in ranked.to_result().ranked_candidates if 30 <= c.score <= 70]
+    assert ids == expected
+
+    ids, _ = _pages(client, limit=4, category="experience", category_min_score=85)
+    assert ids == [c.resume_id for c in ranked.to_result().ranked_candidates if c.score >= 85]
+
+def test_pages_stay_consistent_when_the_batch_changes(client, ranked, json_storage):
+    first = client.get("/api/v1/batch/batch/candidates", params={"limit": 10}).json()
+    seen = [candidate["resume_id"] for candidate in first["candidates"]]
+
+    # A late applicant and a removal above the cursor, and a removal below it
+    ranked.insert(_candidate(100, 95.0))
+    ranked.remove(seen[0])
+    ranked.remove("r0")
+    json_storage.save_ranked_batch_result(ranked.to_result())
+
+    ids, _ = _pages(client, limit=10, cursor=first["next_cursor"])
+    assert not set(ids) & set(seen)
+    assert "r100" not in ids and "r0" not in ids
+    assert len(seen) + len(ids) == 30 - 1
+
+def test_page_after_removed_cursor_candidate_continues_below_its_score(client, ranked, json_storage):
+    first = client.get("/api/v1/batch/batch/candidates", params={"limit": 10}).json()
+    last = first["candidates"][-1]
+    ranked.remove(last["resume_id"])
+    json_storage.save_ranked_batch_result(ranked.to_result())
+
+    page = client.get("/api/v1/batch/batch/candidates", params={"limit": 10, "cursor": first["next_cursor"]}).json()
+    assert page["candidates"][0]["score"] < last["score"]
+
+@pytest.mark.parametrize("limit", [0, -1])
+def test_non_positive_limit_is_rejected(client, ranked, limit):
+    assert client.get("/api/v1/batch/batch/candidates", params={"limit": limit}).status_code == 422
+
+def test_invalid_cursor_and_unknown_batch(client, ranked):
+    assert client.get("/api/v1/batch/batch/candidates", params={"cursor": "not a cursor"}).status_code == 400
+    assert client.get("/api/v1/batch/missing/candidates").status_code == 404
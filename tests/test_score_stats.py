@@ -0,0 +1,92 @@
+import bisect
+import random
+import statistics
+
+from app.services.score_stats import KLLSketch, RunningStats, ScoreStats
+
+def test_kll_rank_error_within_bound():
+    random.seed(7)  # Compaction coin flips
+    rng = random.Random(7)
+    values = [rng.gauss(60, 15) for _ in range(50000)]
+    k = 200
+    sketch = KLLSketch(k)
+    for value in values:
+        sketch.add(value)
+
+    ordered = sorted(values)
+    for fraction in (0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99):
+        rank = bisect.bisect_left(ordered, sketch.quantile(fraction)) / len(ordered)
+        assert abs(rank - fraction) <= 1.7 / k * 2
+    assert sum(len(items) for items in sketch.compactors) < len(values) // 10
+
+def test_kll_merge_keeps_rank_error_within_bound():
+    random.seed(11)
+    rng = random.Random(11)
+    parts = [[rng.uniform(0, 100) for _ in range(5000)] for _ in range(8)]
+    k = 200
+    merged = KLLSketch(k)
+    for part in parts:
+        sketch = KLLSketch(k)
+        for value in part:
+            sketch.add(value)
+        merged.merge(KLLSketch.from_dict(sketch.to_dict()))
+
+    ordered = sorted(value for part in parts for value in part)
+    assert merged.count == len(ordered)
+    for fraction in (0.1, 0.5, 0.9):
+        rank = bisect.bisect_left(ordered, merged.quantile(fraction)) / len(ordered)
+        assert abs(rank - fraction) <= 1.7 / k * 2
+
+def test_kll_is_exact_below_capacity():
+    sketch = KLLSketch(200)
+    for value in range(100):
+        sketch.add(float(value))
+    assert sketch.quantile(0.0) == 0.0
+    assert sketch.quantile(0.5) == 50.0
+    assert KLLSketch().quantile(0.5) is None
+
+def test_running_stats_merge_matches_concatenated_data():
+    rng = random.Random(3)
+    parts = [[rng.uniform(0, 100) for _ in range(rng.randint(0, 300))] for _ in range(6)]
+    merged = RunningStats()
+    for part in parts:
+        running = RunningStats()
+        for value in part:
+            running.add(value)
+        merged.merge(RunningStats.from_dict(running.to_dict()))
+
+    values = [value for part in parts for value in part]
+    assert merged.count == len(values)
+    assert abs(merged.mean - statistics.fmean(values)) < 1e-9
+    assert abs(merged.variance - statistics.pvariance(values)) < 1e-6
+    assert merged.min == min(values)
+    assert merged.max == max(values)
+
+def test_running_stats_remove_undoes_add():
+    values = [12.0, 55.5, 70.25, 91.0, 33.0]
+    running = RunningStats()
+    for value in values:
+        running.add(value)
+    running.remove(91.0)
+    running.remove(12.0)
+
+    remaining = [55.5, 70.25, 33.0]
+    assert running.count == 3
+    assert abs(running.mean - statistics.fmean(remaining)) < 1e-9
+    assert abs(running.variance - statistics.pvariance(remaining)) < 1e-9
+
+def test_score_stats_merge_matches_single_pass():
+    rng = random.Random(5)
+    scores = [round(rng.uniform(0, 100), 2) for _ in range(600)]
+    categories = [{"experience": score / 2} for score in scores]
+
+    merged = ScoreStats()
+    for start in range(0, len(scores), 150):
+        part = ScoreStats.from_scores(scores[start:start + 150], categories[start:start + 150])
+        merged.merge(ScoreStats.from_dict(part.to_dict()))
+    single = ScoreStats.from_scores(scores, categories)
+
+    assert merged.overall.count == single.overall.count
+    assert abs(merged.overall.mean - single.overall.mean) < 1e-9
+    assert merged.histogram.counts == single.histogram.counts
+    assert abs(merged.categories["experience"].mean - single.categories["experience"].mean) < 1e-9
@@ -0,0 +1,66 @@
+import pytest
+
+from app.services.batch_summaries import batch_summary
+from app.services.ranked_batch import RankedBatch
+from app.storage.data_models import AnalysisResult, BatchResult
+from app.storage.sqlite_manager import SQLiteFileManager, migrate_from_json
+from tests.test_file_manager import _upload
+from tests.test_ranked_batch import _candidate
+
+@pytest.fixture
+def populated(json_storage):
+    """A JSON tree with every kind of record"""
+    resumes = [_upload(json_storage, b"python developer"), _upload(json_storage, b"data engineer")]
+    for number, metadata in enumerate(resumes):
+        json_storage.save_parsed_content(
+            metadata.id, {"extracted_text": f"resume {number}", "parsed_data": {"skills": ["Python"]}}
+        )
+        for score in (50.0, 60.0 + number):
+            json_storage.save_analysis_result(AnalysisResult(
+                resume_id=metadata.id, ai_provider="test", overall_score=score,
+                category_scores={}, feedback="", suggestions=[]
+            ))
+
+    batch = BatchResult(total_files=2, processed_files=2, failed_files=0, resume_ids=[m.id for m in resumes])
+    json_storage.save_batch_result(batch)
+    ranked = RankedBatch.from_candidates(batch.id, [_candidate(1, 80.0), _candidate(2, 70.0)]).to_result()
+    json_storage.save_ranked_batch_result(ranked, batch_summary(ranked))
+    json_storage.save_ranking_view(ranked.model_copy(update={"view_name": "tech-heavy"}))
+
+    # Saved before summaries existed
+    legacy = RankedBatch.from_candidates("legacy", [_candidate(3, 40.0)]).to_result()
+    json_storage.save_ranked_batch_result(legacy)
+    return json_storage, resumes, batch, ranked
+
+def test_migration_copies_every_record(populated, storage_settings):
+    source, resumes, batch, ranked = populated
+    target = SQLiteFileManager(storage_settings.sqlite_path)
+
+    counts = migrate_from_json(source, target)
+    assert counts == {
+        "resumes": 2, "parsed_content": 2, "analyses": 4, "batches": 1, "ranked_batches": 2, "ranking_views": 1
+    }
+
+    for metadata in resumes:
+        assert target.get_resume_metadata(metadata.id) == metadata
+        assert target.get_parsed_content(metadata.id) == source.get_parsed_content(metadata.id)
+        assert [a.id for a in target.get_analyses_for_resume(metadata.id)] == \
+            [a.id for a in source.get_analyses_for_resume(metadata.id)]
+        assert target.get_latest_analysis(metadata.id).id == source.get_latest_analysis(metadata.id).id
+    assert target.find_resumes_by_hash(resumes[0].content_hash) == [resumes[0].id]
+
+    assert target.get_batch_result(batch.id) == batch
+    assert target.get_ranked_batch_result(batch.id) == ranked
+    assert [view.view_name for view in target.get_ranking_views(batch.id)] == ["tech-heavy"]
+    assert target.get_batch_summaries([batch.id]) == source.get_batch_summaries([batch.id])
+    assert target.get_unsummarized_batch_ids() == ["legacy"]
+
+def test_migration_can_be_rerun(populated, storage_settings):
+    source, resumes, batch, _ = populated
+    target = SQLiteFileManager(storage_settings.sqlite_path)
+
+    first = migrate_from_json(source, target)
+    assert migrate_from_json(source, target) == first
+    assert len(target.get_all_resumes()) == 2
+    assert len(target.get_all_batch_results()) == 1
+    assert all(len(target.get_analyses_for_resume(metadata.id)) == 2 for metadata in resumes)